@@ -0,0 +1,95 @@
+"""config_write_benchmark
+
+ConfigTxtImplによるコンフィグの出力時間を、コマンドごとにテキストモードで書き込む実装と比較するマイクロベンチマーク
+
+Usage:
+    python benchmarks/config_write_benchmark.py [--devices N] [--commands N] [--repeat N]
+
+"""
+from typing import Callable, Dict, List
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.config.config import Config, ConfigSource
+from src.infra.config.config_txt_impl import ConfigTxtImpl
+
+
+class LineByLineConfigTxtImpl(ConfigTxtImpl):
+    """LineByLineConfigTxtImpl
+
+    比較のため、ConfigSampleFileを毎回読み込み、行・コマンドごとにテキストモードで書き込むConfigTxtImpl
+
+    """
+
+    def write(self, config: Config, output_config_file: str) -> None:
+        with open(self.config_sample_file, "r", encoding="utf-8") as cs:
+            config_sample: List[str] = cs.readlines()
+
+        with open(output_config_file, "w", encoding="utf-8") as c:
+            for config_line in config_sample:
+                stripped_config_line: str = config_line.strip()
+
+                if self._inspect_marker(stripped_config_line):
+                    if stripped_config_line in config.get_markers():
+                        for commands in config.get_commands_group(stripped_config_line):
+                            for command in commands:
+                                c.write(f"{command}\n")
+                else:
+                    c.write(config_line)
+
+
+CONFIG_REPOSITORIES: Dict[str, type] = {
+    "line by line": LineByLineConfigTxtImpl,
+    "single write(ConfigTxtImpl)": ConfigTxtImpl,
+}
+
+
+def measure(function: Callable[[], None], repeat: int) -> float:
+    elapsed_times: List[float] = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    return min(elapsed_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="コンフィグの出力の性能を計測します。")
+    parser.add_argument("--devices", type=int, default=200, help="出力するコンフィグの数")
+    parser.add_argument("--commands", type=int, default=500, help="1つのmarkerに埋め込むコマンドの数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    markers: List[str] = [f"%%MARKER{i}%%" for i in range(10)]
+    config: Config = Config(
+        config_sources=[
+            ConfigSource(marker=marker, commands_group=[[f"command {marker} {i}", "!"] for i in range(args.commands)]) for marker in markers
+        ]
+    )
+
+    print(f"{args.devices} devices x {len(markers)} markers x {args.commands} commands groups")
+
+    with tempfile.TemporaryDirectory() as output_path:
+        config_sample_file: str = os.path.join(output_path, "config_sample.log")
+
+        with open(config_sample_file, "w", encoding="utf-8") as cs:
+            cs.write("".join([f"interface GigabitEthernet0/{i}\n{marker}\n!\n" for i, marker in enumerate(markers)]))
+
+        for name, config_repository in CONFIG_REPOSITORIES.items():
+            config_repo_inst: ConfigTxtImpl = config_repository(config_sample_file)
+            elapsed_time: float = measure(
+                lambda: [config_repo_inst.write(config, os.path.join(output_path, f"device{i}.log")) for i in range(args.devices)],
+                args.repeat
+            )
+            print(f"{name:<30} {elapsed_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""hot_path_types_benchmark
+
+ConfigCommandUsecase.create_device_configsによるデバイスごとのコンフィグ作成(パラメータシートの読み込みからコンフィグの出力まで)について、
+ConfigSource、Configを軽量に生成する場合と、pydanticのバリデーションを行って生成する場合の処理時間とメモリ使用量のピークを比較するベンチマーク
+
+Usage:
+    python benchmarks/hot_path_types_benchmark.py [--devices N] [--rules N] [--rows N] [--columns N] [--repeat N] [--memory]
+
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import argparse
+import contextlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl.utils import get_column_letter
+import openpyxl
+
+from src.domain.config.config import Config, ConfigSource
+from src.domain.rule.rule import Rule
+from src.infra.config.config_txt_impl import ConfigTxtImpl
+from src.infra.paramater_locations.parameter_locations_xlsx_impl import ParameterLocationsXlsxImpl
+from src.infra.rule.rule_yaml_impl import RuleYamlImpl
+from src.usecase.config_command_usecase import ConfigCommandUsecase
+
+
+ROW_FROM: int = 2
+
+
+@contextlib.contextmanager
+def lightweight_types() -> Iterator[None]:
+    yield
+
+
+@contextlib.contextmanager
+def validated_types() -> Iterator[None]:
+    # 比較のため、ConfigSource、Configのconstructをバリデーションを行うコンストラクタに置き換える
+    for model in (Config, ConfigSource):
+        model.construct = classmethod(lambda cls, **data: cls(**data))
+    try:
+        yield
+    finally:
+        for model in (Config, ConfigSource):
+            del model.construct
+
+
+TYPES: Dict[str, Callable[[], contextlib.AbstractContextManager]] = {
+    "lightweight types": lightweight_types,
+    "pydantic validation": validated_types,
+}
+
+
+def create_files(temp_dir: str, devices: int, rules: int, rows: int, columns: int) -> Tuple[str, str, Rule]:
+    # ルールごとに列を割り当てたシートをデバイス数分作成し、デバイスごとに異なる値とする
+    parameter_sheet_file: str = os.path.join(temp_dir, "parameter_sheet.xlsx")
+    workbook = openpyxl.Workbook(write_only=True)
+
+    for device in range(devices):
+        worksheet = workbook.create_sheet(f"device{device:03}")
+        worksheet.append([f"header{column}" for column in range(1, rules * columns + 1)])
+        for row in range(ROW_FROM, ROW_FROM + rows):
+            worksheet.append([None if (row + column) % 7 == 0 else f"d{device}r{row}c{column}" for column in range(1, rules * columns + 1)])
+
+    workbook.save(parameter_sheet_file)
+
+    converter_rules: Dict[str, Dict[str, Any]] = {}
+
+    for rule in range(rules):
+        names: List[str] = [f"Parameter{column}" for column in range(columns)]
+        converter_rules[f"RULE{rule}"] = {
+            "marker": f"%%RULE{rule}%%",
+            "data": {
+                "parameter_column_locations": [
+                    {"name": name, "column_number": get_column_letter(rule * columns + column + 1)} for column, name in enumerate(names)
+                ],
+                "row_from": ROW_FROM,
+                "row_to": ROW_FROM + rows - 1,
+            },
+            "commands": [f"command {{{names[0]}}}", " ".join(f"{{{name}}}" for name in names)],
+            "validations": [],
+            "conditions": [
+                {
+                    "condition": {"type": "isEmpty", "target_parameters": names[1:2] or names[:1]},
+                    "action": "Delete",
+                    "commands": [" ".join(f"{{{name}}}" for name in names)],
+                }
+            ],
+            "options": {"indent_level": 1, "filling_each_commands_group": True},
+        }
+
+    config_sample_file: str = os.path.join(temp_dir, "config_sample.log")
+
+    with open(config_sample_file, "w", encoding="utf-8") as f:
+        f.write("".join(f"!\n%%RULE{rule}%%\n" for rule in range(rules)) + "end\n")
+
+    return parameter_sheet_file, config_sample_file, Rule(common_parameter={"filling": "!"}, converter_rules=converter_rules)
+
+
+def create_each_device(usecase: ConfigCommandUsecase, parameter_sheet_file: str, config_sample_file: str, rule_object: Rule, output_path: str, memory: bool) -> Tuple[List[float], Optional[int]]:
+    parameter_locations_repo_inst = ParameterLocationsXlsxImpl(parameter_sheet_file)
+    config_repo_inst = ConfigTxtImpl(config_sample_file)
+    elapsed_times: List[float] = []
+    peak_memory: Optional[int] = None
+
+    for device_name in parameter_locations_repo_inst.get_sheets():
+
+        # tracemallocは実行時間を大きく増やすため、指定した場合のみ最初のデバイスで計測する
+        if memory and peak_memory is None:
+            tracemalloc.start()
+            usecase.create_device_configs(parameter_locations_repo_inst, config_repo_inst, rule_object, [device_name], output_path)
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        start_time = time.perf_counter()
+        usecase.create_device_configs(parameter_locations_repo_inst, config_repo_inst, rule_object, [device_name], output_path)
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    parameter_locations_repo_inst.close()
+
+    return elapsed_times, peak_memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="デバイスごとのコンフィグ作成について、生成する型の性能を計測します。")
+    parser.add_argument("--devices", type=int, default=10, help="デバイスのシート数")
+    parser.add_argument("--rules", type=int, default=10, help="ルールの数")
+    parser.add_argument("--rows", type=int, default=100, help="ルールごとの行数")
+    parser.add_argument("--columns", type=int, default=5, help="ルールごとの列数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    parser.add_argument("--memory", action="store_true", help="tracemallocでデバイスごとのピークメモリ使用量も計測する")
+    args = parser.parse_args()
+
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsXlsxImpl, RuleYamlImpl)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        parameter_sheet_file, config_sample_file, rule_object = create_files(temp_dir, args.devices, args.rules, args.rows, args.columns)
+        output_path: str = os.path.join(temp_dir, "output")
+        os.makedirs(output_path)
+
+        print(f"parameter sheet: {args.devices} devices, {args.rules} rules x {args.rows} rows x {args.columns} columns per device")
+
+        for name, types in TYPES.items():
+            with types():
+                # 繰り返しごとのデバイスあたりの平均時間のうち、最小のものを用いる
+                results: List[Tuple[List[float], Optional[int]]] = [
+                    create_each_device(usecase, parameter_sheet_file, config_sample_file, rule_object, output_path, args.memory and i == 0)
+                    for i in range(args.repeat)
+                ]
+
+            elapsed_time: float = min(statistics.mean(elapsed_times) for elapsed_times, _ in results)
+            peak_memory: Optional[int] = results[0][1]
+
+            if peak_memory is None:
+                print(f"{name:<30} {elapsed_time * 1000:8.2f} ms/device")
+            else:
+                print(f"{name:<30} {elapsed_time * 1000:8.2f} ms/device {peak_memory / 1024 / 1024:8.2f} MiB(peak per device)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""parameter_group_benchmark
+
+ParameterGroupのパラメータ名による検索(__contains__, get, to_dict)の処理時間を、線形探索による実装と比較するマイクロベンチマーク
+
+Usage:
+    python benchmarks/parameter_group_benchmark.py [--columns N] [--rows N] [--repeat N]
+
+"""
+from typing import Callable, Dict, List, Optional, Type
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
+
+
+class LinearParameterGroup(ParameterGroup):
+    """LinearParameterGroup
+
+    比較のため、パラメータ名の索引を用いずに線形探索で検索するParameterGroup
+
+    """
+
+    def __contains__(self, name: str) -> bool:
+        return any([parameter.name == name for parameter in self.parameters])
+
+    def get(self, name: str) -> Optional[Parameter]:
+        for parameter in self.parameters:
+            if parameter.name == name:
+                return parameter
+
+    def to_dict(self) -> Dict[str, str]:
+        return {parameter.name: parameter.value for parameter in self.parameters}
+
+
+PARAMETER_GROUPS: Dict[str, Type[ParameterGroup]] = {
+    "linear scan": LinearParameterGroup,
+    "name index(ParameterGroup)": ParameterGroup,
+}
+
+
+def create_parameter_groups(parameter_group: Type[ParameterGroup], columns: int, rows: int) -> List[ParameterGroup]:
+    return [
+        parameter_group(parameters=[Parameter(name=f"Parameter{column}", value=f"value{row}-{column}") for column in range(columns)])
+        for row in range(rows)
+    ]
+
+
+def look_up_all_parameters(parameter_groups: List[ParameterGroup], names: List[str]) -> None:
+    # Condition、Validator、コマンドの作成で、行ごとに全ての列を参照する場合を想定する
+    for parameter_group in parameter_groups:
+        for name in names:
+            if name in parameter_group:
+                _ = parameter_group.get(name).value
+            _ = parameter_group.to_dict()[name]
+
+
+def measure(function: Callable[[], None], repeat: int) -> float:
+    elapsed_times: List[float] = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    return min(elapsed_times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ParameterGroupのパラメータ名による検索の性能を計測します。")
+    parser.add_argument("--columns", type=int, default=50, help="ルールの列数")
+    parser.add_argument("--rows", type=int, default=1000, help="ルールの行数")
+    parser.add_argument("--repeat", type=int, default=5, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    names: List[str] = [f"Parameter{column}" for column in range(args.columns)]
+
+    print(f"rule: {args.columns} columns x {args.rows} rows")
+
+    for name, parameter_group in PARAMETER_GROUPS.items():
+        parameter_groups: List[ParameterGroup] = create_parameter_groups(parameter_group, args.columns, args.rows)
+        elapsed_time: float = measure(lambda: look_up_all_parameters(parameter_groups, names), args.repeat)
+        print(f"{name:<30} {elapsed_time:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""parameter_locations_benchmark
+
+ParameterLocationsRepositoryの実装ごとに、パラメータシートの読み込み時間とメモリ使用量を計測するベンチマーク
+
+Usage:
+    python benchmarks/parameter_locations_benchmark.py [--devices N] [--rows N] [--columns N] [--repeat N] [--memory]
+
+"""
+from typing import Callable, Dict, List, Optional, Tuple, Type
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl.utils import get_column_letter
+import openpyxl
+
+from src.domain.parameter_locations.parameter_locations_repository import ParameterLocationsRepository
+from src.infra.paramater_locations.parameter_locations_excel_impl import ParameterLocationsExcelImpl
+from src.infra.paramater_locations.parameter_locations_xlsx_impl import ParameterLocationsXlsxImpl
+
+
+PARAMETER_LOCATIONS_REPOS: Dict[str, Type[ParameterLocationsRepository]] = {
+    "openpyxl(ParameterLocationsExcelImpl)": ParameterLocationsExcelImpl,
+    "zip+xml(ParameterLocationsXlsxImpl)": ParameterLocationsXlsxImpl,
+}
+
+
+def create_parameter_sheet(file_name: str, devices: int, rows: int, columns: int) -> None:
+    workbook = openpyxl.Workbook(write_only=True)
+
+    for device in range(devices):
+        worksheet = workbook.create_sheet(f"device{device:03}")
+        for row in range(1, rows + 1):
+            worksheet.append([f"r{row}c{column}" if column % 3 else row * column for column in range(1, columns + 1)])
+
+    workbook.create_sheet("改版履歴")
+    workbook.save(file_name)
+
+
+def read_parameter_sheet(parameter_locations_repo: Type[ParameterLocationsRepository], file_name: str, rows: List[int], columns: List[str]) -> None:
+    parameter_locations_repo_inst = parameter_locations_repo(file_name)
+
+    for sheet_name in parameter_locations_repo_inst.get_sheets():
+        if sheet_name == "改版履歴":
+            continue
+        _ = parameter_locations_repo_inst.read_matrix(sheet_name, rows, columns)
+
+    parameter_locations_repo_inst.close()
+
+
+def measure(function: Callable[[], None], repeat: int, memory: bool) -> Tuple[float, Optional[float]]:
+    elapsed_times: List[float] = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    if not memory:
+        return min(elapsed_times), None
+
+    # tracemallocは実行時間を大きく増やすため、指定した場合のみ追加で1回計測する
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(elapsed_times), peak_memory / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ParameterLocationsRepositoryの実装ごとの読み込み性能を計測します。")
+    parser.add_argument("--devices", type=int, default=5, help="デバイスのシート数")
+    parser.add_argument("--rows", type=int, default=500, help="シートごとの行数")
+    parser.add_argument("--columns", type=int, default=40, help="シートごとの列数")
+    parser.add_argument("--repeat", type=int, default=1, help="計測の繰り返し回数")
+    parser.add_argument("--memory", action="store_true", help="tracemallocでピークメモリ使用量も計測する")
+    args = parser.parse_args()
+
+    # ルールが参照するセルは、シートの一部の行・列のみであることを想定する
+    rows: List[int] = list(range(1, args.rows + 1, 10))
+    columns: List[str] = [get_column_letter(column) for column in range(1, args.columns + 1, 4)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_name = os.path.join(temp_dir, "parameter_sheet.xlsx")
+        create_parameter_sheet(file_name, args.devices, args.rows, args.columns)
+
+        print(f"parameter sheet: {args.devices} sheets x {args.rows} rows x {args.columns} columns ({os.path.getsize(file_name) / 1024:.0f} KiB)")
+        print(f"requested cells: {len(rows)} rows x {len(columns)} columns per sheet")
+
+        for name, parameter_locations_repo in PARAMETER_LOCATIONS_REPOS.items():
+            elapsed_time, peak_memory = measure(
+                lambda: read_parameter_sheet(parameter_locations_repo, file_name, rows, columns),
+                args.repeat,
+                args.memory
+            )
+            if peak_memory is None:
+                print(f"{name:<40} {elapsed_time:8.3f} s")
+            else:
+                print(f"{name:<40} {elapsed_time:8.3f} s  {peak_memory:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
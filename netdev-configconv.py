@@ -5,9 +5,12 @@ from src.usecase.config_command_usecase import AbstractConfigCommandUsecase, Con
 from src.usecase.params_command_usecase import AbstractParamsCommandUsecase, ParamsCommandUsecase
 from src.presentation.cli_presentation import CliPresentation
 from src.infra.config.config_txt_impl import ConfigTxtImpl
-from src.infra.paramater_locations.parameter_locations_excel_impl import ParameterLocationsExcelImpl
+from src.infra.config.config_archive_impl import ConfigArchiveImpl
+from src.infra.paramater_locations.parameter_locations_xlsx_impl import ParameterLocationsXlsxImpl
 from src.infra.rule.rule_yaml_impl import RuleYamlImpl
+from src.infra.cache.cache_file_impl import CacheFileImpl
 from src.utils.custom_error import CustomError
+import multiprocessing
 
 
 def run_cli(config_command_usecase: AbstractConfigCommandUsecase, params_command_usecase: AbstractParamsCommandUsecase) -> None:
@@ -23,9 +26,11 @@ def main() -> None:
 
     try:
         config_repo = ConfigTxtImpl
-        parameter_locations_repo = ParameterLocationsExcelImpl
+        parameter_locations_repo = ParameterLocationsXlsxImpl
         rule_repo = RuleYamlImpl
-        config_command_usecase: AbstractConfigCommandUsecase = ConfigCommandUsecase(config_repo, parameter_locations_repo, rule_repo)
+        cache_repo = CacheFileImpl
+        archive_config_repo = ConfigArchiveImpl
+        config_command_usecase: AbstractConfigCommandUsecase = ConfigCommandUsecase(config_repo, parameter_locations_repo, rule_repo, cache_repo, archive_config_repo)
         params_command_usecase: AbstractParamsCommandUsecase = ParamsCommandUsecase(config_repo, parameter_locations_repo, rule_repo)
 
         run_cli(config_command_usecase, params_command_usecase)
@@ -37,4 +42,6 @@ def main() -> None:
 
 
 if __name__ == '__main__':
+    # pyinstallerで.exe化した場合に、プロセスプールのワーカーが本スクリプトを再実行しないようにする
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,127 @@
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, Optional
+from src.utils.logger import get_custom_logger
+import functools
+import hashlib
+import os
+import sys
+
+
+logger = get_custom_logger(__name__)
+
+
+class CacheRepository(ABC):
+    """CacheRepository
+
+    本クラスは、実行をまたいで再利用する中間データをキャッシュするための抽象クラスである
+
+    Attributes:
+        cache_dir (str): キャッシュを格納するディレクトリ
+        max_size (int): キャッシュの合計サイズの上限(バイト)
+
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = 512 * 1024 * 1024) -> None:
+
+        logger.debug(f"Intializing CacheRepository(cache_dir={cache_dir}, max_size={max_size})...")
+
+        self.cache_dir: str = cache_dir
+        self.max_size: int = max_size
+
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Any]:
+        """load
+
+        キーに対応するキャッシュを取得する関数
+
+        Args:
+            key (str): キャッシュのキー
+
+        Returns:
+            Optional[Any]: キャッシュされた値、キャッシュが存在しないまたは破損している場合はNone
+
+        """
+        raise NotImplementedError("The 'load' method of the CacheRepository must be implemented")
+
+
+    @abstractmethod
+    def save(self, key: str, value: Any) -> None:
+        """save
+
+        キーに対応する値をキャッシュする関数
+
+        Args:
+            key (str): キャッシュのキー
+            value (Any): キャッシュする値
+
+        """
+        raise NotImplementedError("The 'save' method of the CacheRepository must be implemented")
+
+
+    @abstractmethod
+    def prune(self) -> None:
+        """prune
+
+        キャッシュの合計サイズがmax_sizeを超えている場合、最も長く使用されていないキャッシュから削除する関数
+
+        """
+        raise NotImplementedError("The 'prune' method of the CacheRepository must be implemented")
+
+
+    @staticmethod
+    def hash_file(file: str) -> str:
+        """hash_file
+
+        ファイルの内容からキャッシュのキーに用いるハッシュ値を計算する関数
+
+        Args:
+            file (str): ファイルパス
+
+        Returns:
+            str: ファイル内容のSHA-256ハッシュ値(16進数)
+
+        """
+        hash_object = hashlib.sha256()
+
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hash_object.update(chunk)
+
+        return hash_object.hexdigest()
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def hash_sources(*modules: ModuleType) -> str:
+        """hash_sources
+
+        キャッシュする値の型を定義したモジュールのソースファイルから、値の形式を表すハッシュ値を計算する関数
+
+        Args:
+            modules (ModuleType): キャッシュする値の型を定義したモジュール
+
+        Returns:
+            str: ソースファイルの内容のSHA-256ハッシュ値(16進数)
+
+        Note:
+            キャッシュのキーに含めることで、型の定義を変更した場合に古いキャッシュを自動的に無効にする。
+            ソースファイルが存在しない場合(pyinstallerで作成した実行ファイルなど)は、実行ファイルのサイズと更新日時から計算する。
+
+        """
+        hash_object = hashlib.sha256()
+
+        for module in modules:
+
+            source_file: Optional[str] = getattr(module, "__file__", None)
+
+            if source_file is None or not source_file.endswith(".py") or not os.path.isfile(source_file):
+
+                stat = os.stat(sys.executable)
+
+                return hashlib.sha256(f"{sys.executable}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8")).hexdigest()
+
+            hash_object.update(CacheRepository.hash_file(source_file).encode("utf-8"))
+
+        return hash_object.hexdigest()
@@ -0,0 +1,55 @@
+from typing import Callable, List, Optional, Tuple
+from src.utils.logger import get_custom_logger
+from .config import Config
+from .config_repository import ConfigRepository
+
+
+logger = get_custom_logger(__name__)
+
+
+class BufferedConfigRepository(ConfigRepository):
+    """BufferedConfigRepository
+
+    本クラスは、出力するConfigを作成したコンフィグの内容として、出力先に書き込まずに保持するクラスである
+
+    Attributes:
+        config_sample_file (str): ConfigSampleFileが存在するファイルパス
+        render (Callable[[Config], bytes]): Configからコンフィグの内容を作成する関数
+        contents (List[Tuple[bytes, str, Optional[str]]]): 作成したコンフィグの内容、出力先、デバイス名の組の配列
+
+    Note:
+        並列処理で、複数のプロセスから同時に書き込めないConfigRepositoryに出力する場合に用いる。
+        Configはワーカーで作成済みのコンフィグの内容に変換して保持し、親プロセスでflushを呼び出して書き込む。
+
+    """
+
+    def __init__(self, config_sample_file: str, render: Callable[[Config], bytes]) -> None:
+        super().__init__(config_sample_file)
+        self.render: Callable[[Config], bytes] = render
+        self.contents: List[Tuple[bytes, str, Optional[str]]] = []
+
+
+    def write(self, config: Config, output_config_file: str, device_name: Optional[str] = None) -> None:
+        self.contents.append((self.render(config), output_config_file, device_name))
+
+
+    def make_output_dir(self, output_path: str) -> None:
+        # 出力先ディレクトリは、flushで書き込むConfigRepositoryが作成する
+        pass
+
+
+    @staticmethod
+    def flush(contents: List[Tuple[bytes, str, Optional[str]]], config_repo_inst: ConfigRepository) -> None:
+        """flush
+
+        保持したコンフィグの内容をConfigRepositoryに書き込む関数
+
+        Args:
+            contents (List[Tuple[bytes, str, Optional[str]]]): 書き込むコンフィグの内容、出力先、デバイス名の組の配列
+            config_repo_inst (:obj:`ConfigRepository`): コンフィグを出力するリポジトリ
+
+        """
+        for content, output_config_file, device_name in contents:
+            config_repo_inst.write_content(content=content, output_config_file=output_config_file, device_name=device_name)
+
+        logger.debug(f"Writing {len(contents)} buffered configs has been completed")
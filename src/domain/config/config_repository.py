@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Optional
 from src.domain.config.config import Config
 from src.utils.logger import get_custom_logger
 from .config_exception import ConfigSampleFileNotExistError
@@ -15,9 +16,15 @@ class ConfigRepository(ABC):
 
     Attributes:
         config_sample_file str: ConfigSampleFileが存在するファイルパス
+        concurrent_writable (bool): 複数のプロセスから同時に書き込めるかどうか
+
+    Note:
+        concurrent_writableがFalseの場合、並列処理では各ワーカーで作成したConfigを親プロセスで書き込む。
         
     """
 
+    concurrent_writable: bool = True
+
     def __init__(self, config_sample_file: str) -> None:
 
         logger.debug(f"Intializing ConfigRepository(config_sample_file={config_sample_file})...")
@@ -50,7 +57,7 @@ class ConfigRepository(ABC):
 
 
     @abstractmethod
-    def write(self, config: Config, output_config_file: str) -> None:
+    def write(self, config: Config, output_config_file: str, device_name: Optional[str] = None) -> None:
         """write
 
         ConfigSampleFileとConfigインスタンスからConfigファイルを出力する関数
@@ -58,10 +65,105 @@ class ConfigRepository(ABC):
         Args:
             config (:obj:`Config`): コンフィグに記載すべき内容を含んだオブジェクト
             output_config_file (str): 出力先のディレクトリ
+            device_name (Optional[str]): コンフィグのデバイス名
 
         """
         raise NotImplementedError("The 'write_config' method of the ConfigRepository must be implemented.")
 
+    def render(self, config: Config) -> bytes:
+        """render
+
+        ConfigSampleFileとConfigインスタンスから、コンフィグファイルの内容を作成する関数
+
+        Note:
+            並列処理で、ワーカーが作成した内容を親プロセスで書き込む具象クラスは、本関数とwrite_contentをオーバーライドすること。
+
+        """
+        raise NotImplementedError("The 'render' method of the ConfigRepository must be implemented.")
+
+    def write_content(self, content: bytes, output_config_file: str, device_name: Optional[str] = None) -> None:
+        """write_content
+
+        renderで作成したコンフィグファイルの内容を出力する関数
+
+        Args:
+            content (bytes): コンフィグファイルの内容
+            output_config_file (str): 出力先のファイルパス
+            device_name (Optional[str]): コンフィグのデバイス名
+
+        """
+        raise NotImplementedError("The 'write_content' method of the ConfigRepository must be implemented.")
+
+    def make_output_dir(self, output_path: str) -> None:
+        """make_output_dir
+
+        コンフィグの出力先ディレクトリを作成する関数
+
+        Note:
+            ファイル以外に出力する具象クラスは、本関数をオーバーライドすること。
+
+        """
+        os.makedirs(output_path, exist_ok=True)
+
+    def exists(self, output_config_file: str) -> bool:
+        """exists
+
+        出力先に以前出力したコンフィグが存在するかどうかを返す関数
+
+        Note:
+            以前の出力を再利用できない具象クラスは、Falseを返す本関数をそのまま用いること。
+
+        """
+        return False
+
+    def read_manifest(self, output_path: str) -> Dict[str, str]:
+        """read_manifest
+
+        出力先ディレクトリに以前出力したコンフィグの、デバイス名とフィンガープリントの辞書を取得する関数
+
+        Args:
+            output_path (str): コンフィグの出力先ディレクトリ
+
+        Returns:
+            Dict[str, str]: デバイス名からフィンガープリントを参照する辞書、存在しない場合は空の辞書
+
+        """
+        return {}
+
+    def write_manifest(self, output_path: str, fingerprints: Dict[str, str]) -> None:
+        """write_manifest
+
+        出力先ディレクトリに出力したコンフィグの、デバイス名とフィンガープリントの辞書を記録する関数
+
+        Args:
+            output_path (str): コンフィグの出力先ディレクトリ
+            fingerprints (Dict[str, str]): デバイス名からフィンガープリントを参照する辞書
+
+        """
+        pass
+
+    def close(self) -> None:
+        """close
+
+        全てのコンフィグを出力した後に、出力先を閉じる関数
+
+        Note:
+            出力先を開いたままにする具象クラスは、本関数をオーバーライドすること。
+
+        """
+        pass
+
+    def abort(self) -> None:
+        """abort
+
+        コンフィグの出力中にエラーが発生した場合に、出力先を閉じる関数
+
+        Note:
+            出力の完了時のみ記録する内容を持つ具象クラスは、本関数をオーバーライドすること。
+
+        """
+        self.close()
+
     @staticmethod
     def _inspect_marker(line: str) -> bool:
         
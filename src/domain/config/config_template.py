@@ -0,0 +1,89 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.utils.logger import get_custom_logger
+from .config import Config
+import re
+
+
+logger = get_custom_logger(__name__)
+
+
+MARKER_PATTERN: re.Pattern = re.compile(r"%{2}\w+%{2}")
+
+
+class ConfigTemplate:
+    """ConfigTemplate
+
+    本クラスは、ConfigSampleFileを固定のテキストとmarkerの挿入位置(スロット)の配列に事前に解析したテンプレートである
+
+    Attributes:
+        chunks (Tuple[str, ...]): スロットの前後の固定のテキストの配列、スロットの数より1つ多い
+        slots (Tuple[Tuple[str, int], ...]): スロットのmarker(前後の空白を除いた行)と行番号の組の配列
+        marker_slots (Dict[str, Tuple[int, ...]]): markerからスロットのインデックスを参照する辞書
+
+    Note:
+        markerを含む行は、行全体がスロットとなりコマンド群に置換される。
+        Configに該当するmarkerが存在しない場合、その行は出力されない。
+
+    """
+
+    __slots__ = ("chunks", "slots", "marker_slots")
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        chunks: List[str] = []
+        slots: List[Tuple[str, int]] = []
+        marker_slots: Dict[str, List[int]] = {}
+        chunk: List[str] = []
+
+        for config_row, config_line in enumerate(lines):
+            stripped_config_line: str = config_line.strip()
+
+            if MARKER_PATTERN.search(stripped_config_line):
+                chunks.append("".join(chunk))
+                chunk = []
+                marker_slots.setdefault(stripped_config_line, []).append(len(slots))
+                slots.append((stripped_config_line, config_row))
+            else:
+                chunk.append(config_line)
+
+        chunks.append("".join(chunk))
+
+        self.chunks: Tuple[str, ...] = tuple(chunks)
+        self.slots: Tuple[Tuple[str, int], ...] = tuple(slots)
+        self.marker_slots: Dict[str, Tuple[int, ...]] = {marker: tuple(indexes) for marker, indexes in marker_slots.items()}
+
+    def __getstate__(self):
+        return self.chunks, self.slots, self.marker_slots
+
+    def __setstate__(self, state):
+        self.chunks, self.slots, self.marker_slots = state
+
+    def render(self, config: Config) -> str:
+        """render
+
+        Configのコマンド群をスロットに埋め込み、コンフィグの文字列を作成する関数
+
+        Args:
+            config (:obj:`Config`): コンフィグに記載すべき内容を含んだオブジェクト
+
+        Returns:
+            str: コンフィグの文字列
+
+        """
+        rendered_slots: List[Optional[str]] = [None] * len(self.slots)
+
+        for config_source in config.config_sources:
+            for index in self.marker_slots.get(config_source.marker, ()):
+                rendered_slots[index] = "".join([f"{command}\n" for commands in config_source.commands_group for command in commands])
+
+        result: List[str] = [self.chunks[0]]
+
+        for (marker, config_row), rendered_slot, chunk in zip(self.slots, rendered_slots, self.chunks[1:]):
+
+            if rendered_slot is None:
+                logger.warning(f"Inspected a marker({marker}) at line({config_row}) in the ConfigTemplate, but any config_source doesn't exist")
+            else:
+                result.append(rendered_slot)
+
+            result.append(chunk)
+
+        return "".join(result)
@@ -0,0 +1,54 @@
+from typing import Any, Dict
+import pickle
+import pytest
+
+from .config import Config, ConfigSource
+from .config_template import ConfigTemplate
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "lines": ["show running-config\n", "!\n", "%%parameter1%%\n", "!\n", "  %%parameter2%%  \n", "end"],
+                    "config_sources": [
+                        {"marker": "%%parameter1%%", "commands_group": [["command1", "!"], ["command2"]]},
+                        {"marker": "%%parameter2%%", "commands_group": [["command3"]]},
+                    ]
+                },
+                "show running-config\n!\ncommand1\n!\ncommand2\n!\ncommand3\nend",
+                None
+        ),
+        # 1. correct(repeated marker and marker without config_source)
+        (
+                {
+                    "lines": ["%%parameter1%%\n", "!\n", "%%parameter3%%\n", "interface %%parameter1%%\n", "%%parameter1%%"],
+                    "config_sources": [
+                        {"marker": "%%parameter1%%", "commands_group": [["command1"]]},
+                    ]
+                },
+                "command1\n!\ncommand1\n",
+                None
+        ),
+        # 2. correct(no marker)
+        (
+                {
+                    "lines": ["show running-config\n", "end\n"],
+                    "config_sources": []
+                },
+                "show running-config\nend\n",
+                None
+        ),
+    ]
+)
+def test_config_template_render(test_input: Dict[str, Any], test_result: str, test_exception_result: Exception):
+    config = Config(config_sources=[ConfigSource(**config_source) for config_source in test_input["config_sources"]])
+    if test_result:
+        config_template = ConfigTemplate(test_input["lines"])
+        assert config_template.render(config) == test_result
+        assert pickle.loads(pickle.dumps(config_template)).render(config) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = ConfigTemplate(test_input["lines"]).render(config)
+        assert str(test_exception_result) in str(e.value)
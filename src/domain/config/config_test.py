@@ -2,6 +2,7 @@ from typing import Dict
 import pytest
 
 from .config import Config, ConfigSource
+from .config_exception import DuplicateMarkerError
 
 
 @pytest.mark.parametrize(
@@ -10,13 +11,13 @@ from .config import Config, ConfigSource
         (
                 {
                     "marker": "%%example%%",
-                    "command_groups": [
+                    "commands_group": [
                         ["example command"],
                     ]
                 },
                 ConfigSource(
                     marker="%%example%%",
-                    command_groups=[
+                    commands_group=[
                         ["example command"],
                     ]
                 ),
@@ -26,14 +27,14 @@ from .config import Config, ConfigSource
         (
                 {
                     "marker": "%%example%%",
-                    "command_groups": [
+                    "commands_group": [
                         ["example command1"],
                         ["example command2"]
                     ]
                 },
                 ConfigSource(
                     marker="%%example%%",
-                    command_groups=[
+                    commands_group=[
                         ["example command1"],
                         ["example command2"]
                     ]
@@ -44,7 +45,7 @@ from .config import Config, ConfigSource
         (
                 {
                     "marker": "%%example%",
-                    "command_groups": [
+                    "commands_group": [
                         ["example command"],
                     ]
                 },
@@ -56,7 +57,7 @@ from .config import Config, ConfigSource
         (
                 {
                     "marker": "%%%%",
-                    "command_groups": [
+                    "commands_group": [
                         ["example command"],
                     ]
                 },
@@ -64,11 +65,11 @@ from .config import Config, ConfigSource
                 ValueError(
                     'ensure this value has at least 5 characters (type=value_error.any_str.min_length; limit_value=5)')
         ),
-        # no command_groups
+        # no commands_group
         (
                 {
                     "marker": "%%example%%",
-                    "command_groups": []
+                    "commands_group": []
                 },
                 None,
                 ValueError('ensure this value has at least 1 items (type=value_error.list.min_items; limit_value=1)')
@@ -93,13 +94,13 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                         [
                             {
                                 "marker": "%%example1%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"],
                                 ]
                             },
                             {
                                 "marker": "%%example2%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -109,12 +110,12 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                 Config(config_sources=[
                     ConfigSource(
                         marker="%%example1%%",
-                        command_groups=[
+                        commands_group=[
                             ["example command"]
                         ]),
                     ConfigSource(
                         marker="%%example2%%",
-                        command_groups=[
+                        commands_group=[
                             ["example command1"],
                             ["example command2"]
                         ]
@@ -129,13 +130,13 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                         [
                             {
                                 "marker": "fffffff%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"]
                                 ]
                             },
                             {
                                 "marker": "%%example%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -153,13 +154,13 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                         [
                             {
                                 "marker": "%%%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"]
                                 ]
                             },
                             {
                                 "marker": "%%example%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -170,18 +171,18 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                 ValueError(
                     'ensure this value has at least 5 characters (type=value_error.any_str.min_length; limit_value=5)')
         ),
-        # no command_groups
+        # no commands_group
         (
                 {
                     "config_sources":
                         [
                             {
                                 "marker": "%%%%",
-                                "command_groups": []
+                                "commands_group": []
                             },
                             {
                                 "marker": "%%example%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -198,13 +199,13 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                         [
                             {
                                 "marker": "%%example%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"]
                                 ]
                             },
                             {
                                 "marker": "%%example%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -212,7 +213,7 @@ def test_config_source(test_input: Dict[str, str], test_result: ConfigSource, te
                         ]
                 },
                 None,
-                ValueError("Each element of the markers in 'config_sources' of the Config must be unique (type=value_error)")
+                DuplicateMarkerError(message_items={"marker": "%%example%%"})
         )
     ]
 )
@@ -222,7 +223,10 @@ def test_config(test_input: Dict[str, str], test_result: Config, test_exception_
     else:
         with pytest.raises(Exception) as e:
             _ = Config(**test_input)
-        assert str(test_exception_result) in str(e.value)
+        if isinstance(test_exception_result, DuplicateMarkerError):
+            assert e.value.get_ja_message() == test_exception_result.get_ja_message()
+        else:
+            assert str(test_exception_result) in str(e.value)
 
 
 @pytest.mark.parametrize(
@@ -234,13 +238,13 @@ def test_config(test_input: Dict[str, str], test_result: Config, test_exception_
                         [
                             {
                                 "marker": "%%example1%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"],
                                 ]
                             },
                             {
                                 "marker": "%%example2%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -270,13 +274,13 @@ def test_config_get_markers(test_input: Dict[str, str], test_result: Config, tes
                         [
                             {
                                 "marker": "%%example1%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"],
                                 ]
                             },
                             {
                                 "marker": "%%example2%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
@@ -295,13 +299,13 @@ def test_config_get_markers(test_input: Dict[str, str], test_result: Config, tes
                         [
                             {
                                 "marker": "%%example3%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command"],
                                 ]
                             },
                             {
                                 "marker": "%%example2%%",
-                                "command_groups": [
+                                "commands_group": [
                                     ["example command1"],
                                     ["example command2"]
                                 ]
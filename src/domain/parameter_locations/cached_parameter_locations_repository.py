@@ -0,0 +1,145 @@
+from typing import Any, Dict, List, Optional, Type
+from src.utils.logger import get_custom_logger
+from src.domain.cache.cache_repository import CacheRepository
+from .parameter import ParameterGroup
+from . import parameter_cell_matrix as parameter_cell_matrix_module
+from .parameter_cell_matrix import ParameterCellMatrix
+from .parameter_locations import ParameterLocations, ParameterLocationSource
+from .parameter_locations_repository import ParameterLocationsRepository
+import hashlib
+import inspect
+import sys
+
+
+logger = get_custom_logger(__name__)
+
+
+class CachedParameterLocationsRepository(ParameterLocationsRepository):
+    """CachedParameterLocationsRepository
+
+    本クラスは、ParameterLocationsRepositoryから取得したシート名とセルの値を、パラメータシートの内容のハッシュ値をキーとしてキャッシュするクラスである
+
+    Attributes:
+        parameter_sheet_file (str): パラメータシートが存在するファイルパス
+        parameter_locations_repo (Type[ParameterLocationsRepository]): キャッシュが存在しない場合に使用するリポジトリ
+        cache_repo_inst (:obj:`CacheRepository`): キャッシュを格納するリポジトリ
+
+    Note:
+        キャッシュのキーはパラメータシートの内容のハッシュ値を含むため、パラメータシートが更新された場合は自動的に無効となる。
+        また、parameter_locations_repoのクラス名、モジュールのソースファイルのハッシュ値、設定(コンストラクタの既定値)を含むため、
+        取得する値が異なるリポジトリや設定の間でキャッシュを共有しない。
+        parameter_locations_repoは、キャッシュが存在しない場合に初めてインスタンス化されるため、
+        全てのキャッシュが存在する場合はパラメータシートを開かない。
+
+    """
+
+    def __init__(self, parameter_sheet_file: str, parameter_locations_repo: Type[ParameterLocationsRepository], cache_repo_inst: CacheRepository):
+        super().__init__(parameter_sheet_file)
+        self.parameter_locations_repo: Type[ParameterLocationsRepository] = parameter_locations_repo
+        self.cache_repo_inst: CacheRepository = cache_repo_inst
+        self._parameter_locations_repo_inst: Optional[ParameterLocationsRepository] = None
+        self._parameter_sheet_hash: Optional[str] = None
+        self._reader_fingerprint: Optional[str] = None
+
+
+    @property
+    def parameter_locations_repo_inst(self) -> ParameterLocationsRepository:
+        if self._parameter_locations_repo_inst is None:
+
+            logger.debug(f"Opening the parameter_sheet_file({self.parameter_sheet_file}) because of a cache miss...")
+
+            self._parameter_locations_repo_inst = self.parameter_locations_repo(parameter_sheet_file=self.parameter_sheet_file)
+
+        return self._parameter_locations_repo_inst
+
+
+    @property
+    def parameter_sheet_hash(self) -> str:
+        if self._parameter_sheet_hash is None:
+            self._parameter_sheet_hash = self.cache_repo_inst.hash_file(self.parameter_sheet_file)
+
+        return self._parameter_sheet_hash
+
+
+    @property
+    def reader_fingerprint(self) -> str:
+        """reader_fingerprint
+
+        parameter_locations_repoのクラス名、モジュールのソースファイルのハッシュ値、設定から計算したハッシュ値
+
+        Note:
+            parameter_locations_repoはparameter_sheet_fileのみを指定してインスタンス化するため、
+            コンストラクタの引数の既定値(read_only、data_onlyなど)を設定とする。
+
+        """
+        if self._reader_fingerprint is None:
+            reader: Type[ParameterLocationsRepository] = self.parameter_locations_repo
+            options: Dict[str, Any] = {
+                name: parameter.default for name, parameter in inspect.signature(reader).parameters.items()
+                if parameter.default is not inspect.Parameter.empty
+            }
+            fingerprint: str = repr((
+                f"{reader.__module__}.{reader.__qualname__}",
+                self.cache_repo_inst.hash_sources(sys.modules[reader.__module__]),
+                sorted(options.items()),
+            ))
+            self._reader_fingerprint = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+        return self._reader_fingerprint
+
+
+    def get_sheets(self) -> List[str]:
+        key: str = f"sheets:{self.reader_fingerprint}:{self.parameter_sheet_hash}"
+
+        result: Optional[List[str]] = self.cache_repo_inst.load(key)
+
+        if result is None:
+
+            result = self.parameter_locations_repo_inst.get_sheets()
+
+            self.cache_repo_inst.save(key, result)
+
+        return result
+
+
+    def read(self, sheet_name: str, parameter_locations: ParameterLocations) -> ParameterGroup:
+        return self.parameter_locations_repo_inst.read(sheet_name=sheet_name, parameter_locations=parameter_locations)
+
+
+    def read_range(self, sheet_name: str, parameter_location_source: ParameterLocationSource) -> List[ParameterGroup]:
+        return self.parameter_locations_repo_inst.read_range(sheet_name=sheet_name, parameter_location_source=parameter_location_source)
+
+
+    def read_matrix(self, sheet_name: str, rows: List[int], columns: List[str]) -> ParameterCellMatrix:
+        """read_matrix
+
+        キャッシュが存在する場合はキャッシュから、存在しない場合はパラメータシートからParameterCellMatrixを取得する関数
+
+        Note:
+            キーは、ParameterCellMatrixの定義のハッシュ値、parameter_locations_repoとその設定のハッシュ値、パラメータシートのハッシュ値、
+            取得する行番号・列番号(ルールの位置)のハッシュ値、シート名から構成される。
+
+        """
+        locations_fingerprint: str = hashlib.sha256(repr((rows, columns)).encode("utf-8")).hexdigest()
+        key: str = f"parameter_cell_matrix:{self.cache_repo_inst.hash_sources(parameter_cell_matrix_module)}:{self.reader_fingerprint}:{self.parameter_sheet_hash}:{locations_fingerprint}:{sheet_name}"
+
+        result: Optional[ParameterCellMatrix] = self.cache_repo_inst.load(key)
+
+        if result is None:
+
+            result = self.parameter_locations_repo_inst.read_matrix(sheet_name=sheet_name, rows=rows, columns=columns)
+
+            self.cache_repo_inst.save(key, result)
+
+        else:
+
+            logger.debug(f"Getting a parameter_cell_matrix of the sheet({sheet_name}) from the cache has been completed")
+
+        return result
+
+
+    def close(self) -> None:
+        if self._parameter_locations_repo_inst is not None:
+            self._parameter_locations_repo_inst.close()
+
+        self.cache_repo_inst.prune()
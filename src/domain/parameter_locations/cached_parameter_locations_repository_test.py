@@ -0,0 +1,59 @@
+from typing import Any, Dict, List, Type
+import pytest
+import openpyxl
+
+from .cached_parameter_locations_repository import CachedParameterLocationsRepository
+from .parameter_locations_repository import ParameterLocationsRepository
+from src.infra.cache.cache_file_impl import CacheFileImpl
+from src.infra.paramater_locations.parameter_locations_excel_impl import ParameterLocationsExcelImpl
+from src.infra.paramater_locations.parameter_locations_xlsx_impl import ParameterLocationsXlsxImpl
+
+
+class ValuesOnlyParameterLocationsExcelImpl(ParameterLocationsExcelImpl):
+    def __init__(self, parameter_sheet_file: str, read_only: bool = True, data_only: bool = True):
+        super().__init__(parameter_sheet_file, read_only=read_only, data_only=data_only)
+
+
+@pytest.fixture
+def parameter_sheet_file(tmp_path) -> str:
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "test_device"
+    worksheet["C2"] = "value1"
+    worksheet["D2"] = "=1+1"
+    file_name = str(tmp_path / "test_parameter_sheet.xlsx")
+    workbook.save(file_name)
+    return file_name
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. different repositories
+        (
+                {"parameter_locations_repos": [ParameterLocationsExcelImpl, ParameterLocationsXlsxImpl]},
+                None,
+                None
+        ),
+        # 1. same repository with a different configuration
+        (
+                {"parameter_locations_repos": [ParameterLocationsExcelImpl, ValuesOnlyParameterLocationsExcelImpl]},
+                None,
+                None
+        ),
+    ]
+)
+def test_read_matrix_with_repositories(tmp_path, parameter_sheet_file: str, test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    # 1つのキャッシュを共有しても、各リポジトリが直接取得した値と一致すること
+    cache_repo_inst = CacheFileImpl(cache_dir=str(tmp_path / "cache"))
+    parameter_locations_repos: List[Type[ParameterLocationsRepository]] = test_input["parameter_locations_repos"]
+
+    for parameter_locations_repo in parameter_locations_repos:
+        parameter_locations_repo_inst = parameter_locations_repo(parameter_sheet_file=parameter_sheet_file)
+        expected = parameter_locations_repo_inst.read_matrix("test_device", [2], ["C", "D"])
+        parameter_locations_repo_inst.close()
+
+        cached_parameter_locations_repo_inst = CachedParameterLocationsRepository(parameter_sheet_file, parameter_locations_repo, cache_repo_inst)
+        parameter_cell_matrix = cached_parameter_locations_repo_inst.read_matrix("test_device", [2], ["C", "D"])
+        cached_parameter_locations_repo_inst.close()
+
+        assert parameter_cell_matrix.values == expected.values
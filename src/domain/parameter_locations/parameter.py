@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict
+from pydantic import BaseModel, Field, PrivateAttr, validator
+from types import MappingProxyType
+from typing import Any, List, Dict, Mapping, Optional, Sequence
 from src.utils.logger import get_custom_logger
 
 
@@ -18,6 +19,15 @@ class Parameter(BaseModel):
 class ParameterGroup(BaseModel):
     parameters: List[Parameter] = Field(..., min_items=1)
 
+    _indexes: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _values: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        # パラメータ名から位置と値を参照する辞書を構築時に1度だけ作成し、検索を定数時間で行う
+        self._indexes = {parameter.name: i for i, parameter in enumerate(self.parameters)}
+        self._values = {parameter.name: parameter.value for parameter in self.parameters}
+
     @validator("parameters")
     def _validate_no_duplicate_name(cls, value: List[Parameter]):
         if len(set([i.name for i in value])) != len(value):
@@ -25,12 +35,11 @@ class ParameterGroup(BaseModel):
         return value
 
     def __contains__(self, name: str) -> bool:
-        return any([parameter.name == name for parameter in self.parameters])
+        return name in self._indexes
 
-    def get(self, name: str) -> Parameter:
-        for parameter in self.parameters:
-            if parameter.name == name:
-                return parameter
+    def get(self, name: str) -> Optional[Parameter]:
+        index: Optional[int] = self._indexes.get(name)
+        return self.parameters[index] if index is not None else None
 
     def is_all_required_params_available(self) -> bool:
         for parameter in self.parameters:
@@ -38,8 +47,92 @@ class ParameterGroup(BaseModel):
                 return False
         return True
 
-    def to_dict(self) -> Dict[str, str]:
-        return {parameter.name: parameter.value for parameter in self.parameters}
+    def to_dict(self) -> Mapping[str, str]:
+        # 構築時に作成した辞書を、読み取り専用のビューとして返す
+        return MappingProxyType(self._values)
 
     class Config:
         allow_mutation = False
+
+
+class ParameterValue:
+    """ParameterValue
+
+    ParameterValueは、Parameterと同じ属性を持つ軽量な値クラスである。
+
+    Attributes:
+        name (str): パラメータ名
+        value (Optional[str]): パラメータの値
+        required (bool): パラメータが必須かどうか
+
+    Note:
+        デバイスごとに大量に生成されるため、pydanticによるバリデーションを行わない。
+        値は生成元(ParameterFrameなど)で検証・変換済みであること。
+
+    """
+
+    __slots__ = ("name", "value", "required")
+
+    def __init__(self, name: str, value: Optional[str], required: bool = False) -> None:
+        self.name: str = name
+        self.value: Optional[str] = value
+        self.required: bool = required
+
+    def __repr__(self) -> str:
+        return f"ParameterValue(name={self.name!r}, value={self.value!r}, required={self.required!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ParameterValue, Parameter)):
+            return NotImplemented
+        return (self.name, self.value, self.required) == (other.name, other.value, other.required)
+
+
+class ParameterRow:
+    """ParameterRow
+
+    ParameterRowは、ParameterGroupと同じインターフェースを持つ、1行分のパラメータを値の組として保持する軽量クラスである。
+
+    Attributes:
+        values (Tuple[Optional[str], ...]): パラメータ名と同じ順序で並べた値の組
+        required (Tuple[bool, ...]): パラメータ名と同じ順序で並べた、必須かどうかの組
+
+    Note:
+        パラメータ名から位置を参照する辞書は、同じ範囲の全ての行で共有する。
+        デバイスごとに大量に生成されるため、pydanticによるバリデーションを行わない。
+
+    """
+
+    __slots__ = ("_indexes", "values", "required")
+
+    def __init__(self, indexes: Mapping[str, int], values: Sequence[Optional[str]], required: Sequence[bool]) -> None:
+        self._indexes: Mapping[str, int] = indexes
+        self.values: Sequence[Optional[str]] = values
+        self.required: Sequence[bool] = required
+
+    def __repr__(self) -> str:
+        return f"ParameterRow({self.to_dict()!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ParameterRow, ParameterGroup)):
+            return NotImplemented
+        return self.parameters == [ParameterValue(i.name, i.value, i.required) for i in other.parameters]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indexes
+
+    @property
+    def parameters(self) -> List[ParameterValue]:
+        return [ParameterValue(name, value, required) for name, value, required in zip(self._indexes, self.values, self.required)]
+
+    def get(self, name: str) -> Optional[ParameterValue]:
+        index: Optional[int] = self._indexes.get(name)
+        return ParameterValue(name, self.values[index], self.required[index]) if index is not None else None
+
+    def is_all_required_params_available(self) -> bool:
+        for value, required in zip(self.values, self.required):
+            if required == True and value == False:
+                return False
+        return True
+
+    def to_dict(self) -> Mapping[str, str]:
+        return dict(zip(self._indexes, self.values))
@@ -0,0 +1,129 @@
+from typing import Any, Dict, List
+from src.utils.logger import get_custom_logger
+from .parameter import Parameter, ParameterGroup
+from .parameter_frame import ParameterFrame
+from .parameter_locations import ParameterLocationSource, ParameterRange
+import hashlib
+
+
+logger = get_custom_logger(__name__)
+
+
+class ParameterCellMatrix:
+    """ParameterCellMatrix
+
+    ParameterCellMatrixは、1シート分の必要なセルの値を(行, 列)をキーとする2次元配列として保持するクラスである。
+
+    Attributes:
+        rows (List[int]): 保持している行番号の配列
+        columns (List[str]): 保持している列番号(アルファベット)の配列
+        values (List[Any]): 行優先で格納したセルの値の配列
+
+    Note:
+        全てのConverterRuleが同じインスタンスからパラメータを取得することで、同じセルを何度も読み込まないようにする。
+
+    """
+
+    def __init__(self, rows: List[int], columns: List[str], values: List[Any]) -> None:
+
+        if len(values) != len(rows) * len(columns):
+
+            raise ValueError(f"The length of 'values'({len(values)}) of the ParameterCellMatrix must be equal to rows({len(rows)}) x columns({len(columns)})")
+
+        self.rows: List[int] = rows
+        self.columns: List[str] = columns
+        self.values: List[Any] = values
+        self._row_indexes: Dict[int, int] = {row: i for i, row in enumerate(rows)}
+        self._column_indexes: Dict[str, int] = {column: i for i, column in enumerate(columns)}
+
+
+    def __reduce__(self):
+        # キャッシュやプロセス間の受け渡しでは、再構築可能な索引を除いた値のみを直列化する
+        return (self.__class__, (self.rows, self.columns, self.values))
+
+
+    def fingerprint(self) -> str:
+        """fingerprint
+
+        保持している行番号・列番号とセルの値から、内容が変わっていないかを判定するためのハッシュ値を計算する関数
+
+        Returns:
+            str: 行番号・列番号とセルの値のSHA-256ハッシュ値(16進数)
+
+        """
+        return hashlib.sha256(repr((self.rows, self.columns, self.values)).encode("utf-8")).hexdigest()
+
+
+    def get(self, row: int, column: str) -> Any:
+        """get
+
+        行番号と列番号からセルの値を取得する関数
+
+        Args:
+            row (int): 行番号
+            column (str): 列番号(アルファベット)
+
+        Returns:
+            Any: セルの値
+
+        Note:
+            保持していないセルを指定した場合、KeyErrorが発生する。
+
+        """
+        return self.values[self._row_indexes[row] * len(self.columns) + self._column_indexes[column]]
+
+
+    def get_parameter_groups(self, parameter_location_source: ParameterLocationSource) -> List[ParameterGroup]:
+        """get_parameter_groups
+
+        ParameterLocationSourceが示す範囲のパラメータを行ごとのParameterGroupとして取得する関数
+
+        Args:
+            parameter_location_source (:obj:`ParameterLocationSource`): パラメータの列と行の範囲を記述したもの
+
+        Returns:
+            List[ParameterGroup]: 行ごとのパラメータ群の配列
+
+        """
+        parameter_range: ParameterRange = parameter_location_source.parameter_range
+
+        return [
+            ParameterGroup(
+                parameters=[
+                    Parameter(
+                        name=name,
+                        value=self.get(row, column_number),
+                        required=required
+                    ) for name, column_number, required in zip(parameter_range.names, parameter_range.column_numbers, parameter_range.required)
+                ]
+            ) for row in parameter_range.rows
+        ]
+
+
+    def get_parameter_frame(self, parameter_location_source: ParameterLocationSource) -> ParameterFrame:
+        """get_parameter_frame
+
+        ParameterLocationSourceが示す範囲のパラメータを列ごとの値の配列として取得する関数
+
+        Args:
+            parameter_location_source (:obj:`ParameterLocationSource`): パラメータの列と行の範囲を記述したもの
+
+        Returns:
+            ParameterFrame: 列ごとの値の配列として保持したパラメータ群
+
+        """
+        parameter_range: ParameterRange = parameter_location_source.parameter_range
+        column_count: int = len(self.columns)
+        row_offsets: List[int] = [self._row_indexes[row] * column_count for row in parameter_range.rows]
+
+        columns: List[List[Any]] = []
+
+        for column_number in parameter_range.column_numbers:
+            column_index: int = self._column_indexes[column_number]
+            columns.append([self.values[row_offset + column_index] for row_offset in row_offsets])
+
+        return ParameterFrame(
+            names=list(parameter_range.names),
+            columns=columns,
+            required=list(parameter_range.required)
+        )
@@ -0,0 +1,138 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from pydantic.validators import str_validator
+from src.utils.logger import get_custom_logger
+from .parameter import ParameterRow
+
+
+logger = get_custom_logger(__name__)
+
+
+class ParameterFrame:
+    """ParameterFrame
+
+    ParameterFrameは、ParameterLocationSourceが示す範囲のパラメータを、列(パラメータ名)ごとの値の配列として保持するクラスである。
+
+    Attributes:
+        names (List[str]): パラメータ名の配列
+        columns (List[List[Optional[str]]]): パラメータ名と同じ順序で並べた、列ごとの値の配列
+        required (List[bool]): パラメータ名と同じ順序で並べた、必須かどうかの配列
+
+    Note:
+        値はParameterと同じく文字列(またはNone)に変換して保持する。
+        行ごとのParameterGroupを生成せずに、範囲内の全ての行をまとめて処理するために用いる。
+
+    """
+
+    def __init__(self, names: List[str], columns: List[List[Any]], required: Optional[List[bool]] = None) -> None:
+
+        if len(names) != len(columns):
+
+            raise ValueError(f"The length of 'columns'({len(columns)}) of the ParameterFrame must be equal to that of 'names'({len(names)})")
+
+        if len(set(names)) != len(names):
+
+            raise ValueError("Each element of the 'names' of the ParameterFrame must be unique")
+
+        if len(set(len(column) for column in columns)) > 1:
+
+            raise ValueError("Each element of the 'columns' of the ParameterFrame must have the same length")
+
+        self.names: List[str] = names
+        self.columns: List[List[Optional[str]]] = [[self._to_parameter_value(value) for value in column] for column in columns]
+        self.required: List[bool] = required if required is not None else [False] * len(names)
+        self._column_indexes: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._parameter_groups: Optional[List[ParameterRow]] = None
+
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._column_indexes
+
+
+    def get_column(self, name: str) -> List[Optional[str]]:
+        """get_column
+
+        パラメータ名から列の値の配列を取得する関数
+
+        Note:
+            存在しないパラメータ名を指定した場合、KeyErrorが発生する。
+
+        """
+        return self.columns[self._column_indexes[name]]
+
+
+    def get_rows(self, names: Optional[Sequence[str]] = None) -> List[Tuple[Optional[str], ...]]:
+        """get_rows
+
+        行ごとの値の組の配列を取得する関数
+
+        Args:
+            names (Optional[Sequence[str]]): 値の組に含めるパラメータ名の配列、省略した場合は全てのパラメータ
+
+        Returns:
+            List[Tuple[Optional[str], ...]]: namesと同じ順序で値を並べた、行ごとの値の組の配列
+
+        """
+        columns: List[List[Optional[str]]] = self.columns if names is None else [self.get_column(name) for name in names]
+
+        if not columns:
+            return [()] * len(self)
+
+        return list(zip(*columns))
+
+
+    def select(self, mask: Sequence[bool]) -> "ParameterFrame":
+        """select
+
+        マスクが真の行のみを抽出したParameterFrameを取得する関数
+
+        """
+        if all(mask):
+            return self
+
+        return ParameterFrame(
+            names=self.names,
+            columns=[[value for value, selected in zip(column, mask) if selected] for column in self.columns],
+            required=self.required
+        )
+
+
+    def is_all_required_params_available(self) -> List[bool]:
+        """is_all_required_params_available
+
+        ParameterGroup.is_all_required_params_availableを全ての行に対して評価したマスクを取得する関数
+
+        """
+        mask: List[bool] = [True] * len(self)
+
+        for column, required in zip(self.columns, self.required):
+            if required:
+                mask = [selected and value != False for selected, value in zip(mask, column)]
+
+        return mask
+
+
+    def get_parameter_groups(self) -> List[ParameterRow]:
+        """get_parameter_groups
+
+        行ごとのParameterRow(ParameterGroupと同じインターフェースを持つ)の配列を取得する関数
+
+        Note:
+            バッチ処理に対応していない処理で、行ごとに評価するために用いる。
+            生成したParameterRowは保持し、2回目以降の呼び出しでは再利用する。
+
+        """
+        if self._parameter_groups is None:
+            required: Tuple[bool, ...] = tuple(self.required)
+            self._parameter_groups = [ParameterRow(self._column_indexes, row, required) for row in self.get_rows()]
+
+        return self._parameter_groups
+
+
+    @staticmethod
+    def _to_parameter_value(value: Any) -> Optional[str]:
+        # Parameter.valueと同じ規則で文字列に変換する
+        return None if value is None else str_validator(value)
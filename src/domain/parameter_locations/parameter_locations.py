@@ -1,7 +1,7 @@
-from typing import List
-from pydantic import BaseModel, Field, validator
+from typing import Iterator, List, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from src.utils.logger import get_custom_logger
-from .parameter_locations_exceptions import RowFromNotExistError, RowFromBiggerThanRowToExistError
+from .parameter_locations_exceptions import RowFromBiggerThanRowToExistError
 
 
 logger = get_custom_logger(__name__)
@@ -56,10 +56,95 @@ class ParameterColumnLocation(BaseModel):
     """
 
     name: str = Field(..., min_length=1)
-    column_number: str = Field(..., min_length=1, regex=r"[A-Z]+")
+    column_number: str = Field(..., min_length=1, regex=r"^[A-Z]+$")
     required: bool = False
 
 
+class ParameterRange:
+    """ParameterRange
+
+    ParameterRangeは、ParameterLocationSourceが示すパラメータの範囲を、列と行の境界として保持する不変のクラスである。
+
+    Attributes:
+        names (Tuple[str, ...]): パラメータ名の組
+        column_numbers (Tuple[str, ...]): パラメータ名と同じ順序で並べた、列番号(アルファベット)の組
+        column_indexes (Tuple[int, ...]): パラメータ名と同じ順序で並べた、列番号(1始まりの数値)の組
+        required (Tuple[bool, ...]): パラメータ名と同じ順序で並べた、必須かどうかの組
+        row_from (int): 行の始端
+        row_to (int): 行の終端
+
+    Note:
+        行ごとのParameterLocationsは保持せず、iter_parameter_locationsで必要になった時点で1行ずつ作成する。
+        そのため、範囲の行数によらずメモリ使用量は一定となる。
+
+    """
+
+    __slots__ = ("names", "column_numbers", "column_indexes", "required", "row_from", "row_to")
+
+    def __init__(self, names: Tuple[str, ...], column_numbers: Tuple[str, ...], required: Tuple[bool, ...], row_from: int, row_to: int) -> None:
+        object.__setattr__(self, "names", tuple(names))
+        object.__setattr__(self, "column_numbers", tuple(column_numbers))
+        object.__setattr__(self, "column_indexes", tuple(self._to_column_index(column_number) for column_number in column_numbers))
+        object.__setattr__(self, "required", tuple(required))
+        object.__setattr__(self, "row_from", row_from)
+        object.__setattr__(self, "row_to", row_to)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"'{self.__class__.__name__}' object is immutable")
+
+    def __reduce__(self):
+        return (self.__class__, (self.names, self.column_numbers, self.required, self.row_from, self.row_to))
+
+    def __repr__(self) -> str:
+        return f"ParameterRange(names={self.names!r}, column_numbers={self.column_numbers!r}, rows={self.row_from}-{self.row_to})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParameterRange):
+            return NotImplemented
+        return self.__reduce__()[1] == other.__reduce__()[1]
+
+    def __hash__(self) -> int:
+        return hash(self.__reduce__()[1])
+
+    def __len__(self) -> int:
+        return self.row_to - self.row_from + 1
+
+    @property
+    def rows(self) -> range:
+        return range(self.row_from, self.row_to + 1)
+
+    def iter_parameter_locations(self) -> Iterator["ParameterLocations"]:
+        """iter_parameter_locations
+
+        範囲の行ごとのParameterLocationsを、先頭の行から1行ずつ作成して返すイテレータ
+
+        Note:
+            ParameterLocationSourceで検証済みの値から組み立てるため、ParameterLocationのバリデーションは行わない。
+
+        """
+        columns: List[Tuple[str, str, bool]] = list(zip(self.names, self.column_numbers, self.required))
+
+        for row in self.rows:
+            yield ParameterLocations.construct(
+                locations=[
+                    ParameterLocation.construct(name=name, cell_number=f"{column_number}{row}", required=required)
+                    for name, column_number, required in columns
+                ]
+            )
+
+    @staticmethod
+    def _to_column_index(column_number: str) -> int:
+        # 列番号(アルファベット)を1始まりの数値に変換する(A=1, Z=26, AA=27)
+        result: int = 0
+
+        for letter in column_number:
+            if not "A" <= letter <= "Z":
+                raise ValueError(f"The column_number({column_number}) must consist of uppercase letters")
+            result = result * 26 + ord(letter) - ord("A") + 1
+
+        return result
+
+
 class ParameterLocationSource(BaseModel):
     """ParameterLocationSource
     
@@ -76,18 +161,43 @@ class ParameterLocationSource(BaseModel):
     row_from: int = Field(..., ge=1)
     row_to: int = Field(..., ge=1)
 
+    _parameter_range: ParameterRange = PrivateAttr(default=None)
+
     class Config:
         allow_mutation = False
 
 
+    def __init__(self, **data):
+        super().__init__(**data)
+        # 範囲はルールの読み込み時に1度だけ作成し、デバイスごとに再利用する
+        self._parameter_range = ParameterRange(
+            names=tuple(i.name for i in self.parameter_column_locations),
+            column_numbers=tuple(i.column_number for i in self.parameter_column_locations),
+            required=tuple(i.required for i in self.parameter_column_locations),
+            row_from=self.row_from,
+            row_to=self.row_to
+        )
+
+
+    @property
+    def parameter_range(self) -> ParameterRange:
+        """parameter_range
+
+        列と行の境界として保持した、不変のパラメータの範囲
+
+        """
+        return self._parameter_range
+
+
     @validator("row_to")
     def _validate_row_to(cls, value, values) -> int:
         
         logger.debug(f"Validating row_to({value}) in the ParameterLocationSource...")
 
+        # row_fromのバリデーションに失敗した場合は、row_fromのエラーのみを報告する
         if "row_from" not in values.keys():
 
-            raise RowFromNotExistError()
+            return value
 
         if value < values["row_from"]:
 
@@ -106,16 +216,9 @@ class ParameterLocationSource(BaseModel):
         Returns:
             List[ParameterLocations]: ParameterGroup配列の位置を記述した配列
 
+        Note:
+            全ての行のParameterLocationsを作成するため、行ごとに処理する場合はparameter_range.iter_parameter_locationsを用いること。
+
         """
 
-        return [
-            ParameterLocations(
-                locations=[
-                    ParameterLocation(
-                        name=i.name,
-                        cell_number=f"{i.column_number}{j}",
-                        required=i.required
-                    ) for i in self.parameter_column_locations
-                ]
-            ) for j in range(self.row_from, self.row_to+1)
-        ]
\ No newline at end of file
+        return list(self.parameter_range.iter_parameter_locations())
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Tuple
 from src.utils.logger import get_custom_logger
-from .parameter_locations import ParameterLocations
+from .parameter_locations import ParameterLocations, ParameterLocationSource, ParameterColumnLocation
+from .parameter_cell_matrix import ParameterCellMatrix
 from .parameter_locations_exceptions import ParameterSheetNotExistError
 from .parameter import ParameterGroup
 
@@ -17,8 +18,12 @@ class ParameterLocationsRepository(ABC):
 
     Attributes:
         parameter_sheet_file (str): パラメータシートが存在するファイルパス
+        file_extensions (Tuple[str, ...]): ディレクトリからパラメータシートを探索する際に対象とする拡張子
 
     """
+
+    file_extensions: Tuple[str, ...] = ()
+
     def __init__(self, parameter_sheet_file: str):
 
         logger.debug(f"Intializing ParameterLocationsRepository(parameter_sheet_file={parameter_sheet_file})...")
@@ -79,3 +84,73 @@ class ParameterLocationsRepository(ABC):
             
         """
         raise NotImplementedError("The 'read' method of the ParameterLocationsRepository must be implemented")
+
+
+    def read_range(self, sheet_name: str, parameter_location_source: ParameterLocationSource) -> List[ParameterGroup]:
+        """read_range
+
+        パラメータシートからSheetNameとParameterLocationSourceを指定して、行ごとのパラメータ群をまとめて取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            parameter_location_source (:obj:`ParameterLocationSource`): パラメータの列と行の範囲を記述したもの
+
+        Returns:
+            List[ParameterGroup]: 行ごとに取得したパラメータ群の配列
+
+        Note:
+            具象クラスで矩形範囲をまとめて取得できる場合は、本関数をオーバーライドすること。
+
+        """
+        return [
+            self.read(sheet_name=sheet_name, parameter_locations=parameter_locations)
+            for parameter_locations in parameter_location_source.parameter_range.iter_parameter_locations()
+        ]
+
+
+    def read_matrix(self, sheet_name: str, rows: List[int], columns: List[str]) -> ParameterCellMatrix:
+        """read_matrix
+
+        パラメータシートからSheetNameと行番号・列番号の配列を指定して、各セルを1度だけ読み込んだParameterCellMatrixを取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            rows (List[int]): 取得する行番号の配列
+            columns (List[str]): 取得する列番号(アルファベット)の配列
+
+        Returns:
+            ParameterCellMatrix: 取得したセルの値を保持する2次元配列
+
+        Note:
+            具象クラスで矩形範囲をまとめて取得できる場合は、本関数をオーバーライドすること。
+
+        """
+        values: List[Any] = []
+
+        if rows and columns:
+
+            parameter_groups: List[ParameterGroup] = self.read_range(
+                sheet_name=sheet_name,
+                parameter_location_source=ParameterLocationSource(
+                    parameter_column_locations=[ParameterColumnLocation(name=column, column_number=column) for column in columns],
+                    row_from=min(rows),
+                    row_to=max(rows)
+                )
+            )
+
+            for row in rows:
+                values.extend(parameter.value for parameter in parameter_groups[row - min(rows)].parameters)
+
+        return ParameterCellMatrix(rows=rows, columns=columns, values=values)
+
+
+    def close(self) -> None:
+        """close
+
+        パラメータシートの読み込みに使用したリソースを解放する関数
+
+        Note:
+            解放すべきリソースを持たない具象クラスでは、何も行わない。
+
+        """
+        pass
@@ -1,9 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 
+import pickle
 import pytest
 
-from .parameter import Parameter, ParameterGroup
-from .parameter_locations import ParameterLocations, ParameterLocation, ParameterColumnLocation, ParameterLocationSource
+from .parameter import Parameter, ParameterGroup, ParameterRow
+from .parameter_locations import ParameterLocations, ParameterLocation, ParameterColumnLocation, ParameterLocationSource, ParameterRange
+from .parameter_cell_matrix import ParameterCellMatrix
+from .parameter_locations_exceptions import RowFromBiggerThanRowToExistError
 
 
 @pytest.mark.parametrize(
@@ -199,6 +202,79 @@ def test_parameter_tp_dict(test_input: Dict[str, Any], test_result: bool, test_e
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "parameters": [
+                            {"name": "Example1", "value": "Example1"},
+                            {"name": "Example2", "value": None}
+                    ]
+                },
+                {"Example1": "Example1", "Example2": None},
+                None
+        ),
+    ]
+)
+def test_parameter_group_index(test_input: Dict[str, Any], test_result: Dict[str, Any], test_exception_result: Exception):
+    parameter_group = ParameterGroup(**test_input)
+    # to_dictは読み取り専用であること
+    with pytest.raises(TypeError):
+        parameter_group.to_dict()["Example1"] = "changed"
+    assert parameter_group.to_dict() == test_result
+    # 直列化して復元した場合も索引が利用できること
+    restored_parameter_group = pickle.loads(pickle.dumps(parameter_group))
+    assert restored_parameter_group == parameter_group
+    assert [name in restored_parameter_group for name in test_result] == [True] * len(test_result)
+    assert {name: restored_parameter_group.get(name).value for name in test_result} == test_result
+    assert restored_parameter_group.get("Unknown") is None
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "parameters": [
+                            {"name": "Example1", "value": "Example1", "required": True},
+                            {"name": "Example2", "value": None}
+                    ]
+                },
+                True,
+                None
+        ),
+        # 1. correct(single parameter)
+        (
+                {
+                    "parameters": [
+                            {"name": "Example1", "value": None}
+                    ]
+                },
+                True,
+                None
+        ),
+    ]
+)
+def test_parameter_row(test_input: Dict[str, Any], test_result: bool, test_exception_result: Exception):
+    parameter_group = ParameterGroup(**test_input)
+    parameter_row = ParameterRow(
+        {parameter.name: i for i, parameter in enumerate(parameter_group.parameters)},
+        tuple(parameter.value for parameter in parameter_group.parameters),
+        tuple(parameter.required for parameter in parameter_group.parameters)
+    )
+    # ParameterGroupと同じ結果となること
+    assert parameter_row == parameter_group
+    assert parameter_row.is_all_required_params_available() == parameter_group.is_all_required_params_available() == test_result
+    assert parameter_row.to_dict() == parameter_group.to_dict()
+    for parameter in parameter_group.parameters:
+        assert parameter.name in parameter_row
+        assert parameter_row.get(parameter.name) == parameter
+    assert "Unknown" not in parameter_row
+    assert parameter_row.get("Unknown") is None
+    assert pickle.loads(pickle.dumps(parameter_row)) == parameter_group
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # 0. correct
@@ -223,7 +299,13 @@ def test_parameter_tp_dict(test_input: Dict[str, Any], test_result: bool, test_e
         (
                 {"name": "Example", "column_number": "1"},
                 None,
-                ValueError('string does not match regex "[A-Z]+" (type=value_error.str.regex; pattern=[A-Z]+)')
+                ValueError('string does not match regex "^[A-Z]+$" (type=value_error.str.regex; pattern=^[A-Z]+$)')
+        ),
+        # 4. cell number as column_number
+        (
+                {"name": "Example", "column_number": "A1"},
+                None,
+                ValueError('string does not match regex "^[A-Z]+$" (type=value_error.str.regex; pattern=^[A-Z]+$)')
         )
     ]
 )
@@ -282,9 +364,19 @@ def test_parameter_column_location(test_input: Dict[str, str], test_result: Para
                     "row_to": 1,
                 },
                 None,
-                ValueError('string does not match regex "[A-Z]+" (type=value_error.str.regex; pattern=[A-Z]+)')
+                ValueError('string does not match regex "^[A-Z]+$" (type=value_error.str.regex; pattern=^[A-Z]+$)')
         ),
-        # 4.empty parameter_column_locations
+        # 4.cell number as column_number
+        (
+                {
+                    "parameter_column_locations": [{"name": "Example", "column_number": "A1"}],
+                    "row_from": 1,
+                    "row_to": 1,
+                },
+                None,
+                ValueError('string does not match regex "^[A-Z]+$" (type=value_error.str.regex; pattern=^[A-Z]+$)')
+        ),
+        # 5.empty parameter_column_locations
         (
                 {
                     "parameter_column_locations": [],
@@ -294,16 +386,16 @@ def test_parameter_column_location(test_input: Dict[str, str], test_result: Para
                 None,
                 ValueError('ensure this value has at least 1 items (type=value_error.list.min_items; limit_value=1)')
         ),
-        # 5.empty row_from
+        # 6.empty row_from
         (
                 {
                     "parameter_column_locations": [{"name": "Example", "column_number": "A"}],
                     "row_to": 1,
                 },
                 None,
-                ValueError("row_from\n  field required (type=value_error.missing)")
+                ValueError("1 validation error for ParameterLocationSource\nrow_from\n  field required (type=value_error.missing)")
         ),
-        # 6.empty row_to
+        # 7.empty row_to
         (
                 {
                     "parameter_column_locations": [{"name": "Example", "column_number": "A"}],
@@ -312,7 +404,7 @@ def test_parameter_column_location(test_input: Dict[str, str], test_result: Para
                 None,
                 ValueError('1 validation error for ParameterLocationSource\nrow_to\n  field required (type=value_error.missing)')
         ),
-        # 7.invalid row_to
+        # 8.invalid row_to
         (
                 {
                     "parameter_column_locations": [{"name": "Example", "column_number": "A"}],
@@ -320,7 +412,7 @@ def test_parameter_column_location(test_input: Dict[str, str], test_result: Para
                     "row_to": 5,
                 },
                 None,
-                ValueError("the 'row_to' property of the ParameterSaveLocationSource must be greater than the 'row_from' property (type=value_error)")
+                RowFromBiggerThanRowToExistError(message_items={"row_from": 10, "row_to": 5})
         ),
     ]
 )
@@ -330,7 +422,10 @@ def test_parameter_location_source(test_input: Dict[str, str], test_result: Para
     else:
         with pytest.raises(Exception) as e:
             _ = ParameterLocationSource(**test_input)
-        assert str(test_exception_result) in str(e.value)
+        if isinstance(test_exception_result, RowFromBiggerThanRowToExistError):
+            assert e.value.get_ja_message() == test_exception_result.get_ja_message()
+        else:
+            assert str(test_exception_result) in str(e.value)
 
 
 @pytest.mark.parametrize(
@@ -360,6 +455,49 @@ def test_convert_to_parameter_locations_list(test_input: Dict[str, str], test_re
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0.correct
+        (
+                {
+                    "parameter_column_locations": [{"name": "Example1", "column_number": "AB", "required": True}, {"name": "Example2", "column_number": "C"}],
+                    "row_from": 2,
+                    "row_to": 5001,
+                },
+                {
+                    "names": ("Example1", "Example2"),
+                    "column_numbers": ("AB", "C"),
+                    "column_indexes": (28, 3),
+                    "required": (True, False),
+                    "rows": range(2, 5002),
+                },
+                None
+        ),
+    ]
+)
+def test_parameter_range(test_input: Dict[str, Any], test_result: Dict[str, Any], test_exception_result: Exception):
+    parameter_location_source = ParameterLocationSource(**test_input)
+    parameter_range = parameter_location_source.parameter_range
+    assert isinstance(parameter_range, ParameterRange)
+    assert {key: getattr(parameter_range, key) for key in test_result} == test_result
+    assert len(parameter_range) == len(test_result["rows"])
+    # ルールごとに1度だけ作成され、変更できないこと
+    assert parameter_location_source.parameter_range is parameter_range
+    with pytest.raises(AttributeError):
+        parameter_range.row_to = 1
+    # 行ごとのParameterLocationsを遅延して作成すること
+    parameter_locations_iterator = parameter_range.iter_parameter_locations()
+    assert not isinstance(parameter_locations_iterator, list)
+    assert next(parameter_locations_iterator) == ParameterLocations(
+        locations=[
+            ParameterLocation(name="Example1", cell_number="AB2", required=True),
+            ParameterLocation(name="Example2", cell_number="C2", required=False),
+        ]
+    )
+    assert list(parameter_range.iter_parameter_locations()) == parameter_location_source.convert_to_parameter_locations_list()
+    assert pickle.loads(pickle.dumps(parameter_location_source)).parameter_range == parameter_range
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # correct
@@ -454,4 +592,122 @@ def test_parameter_locations(test_input: Dict[str, str], test_result: ParameterL
     else:
         with pytest.raises(Exception) as e:
             _ = ParameterLocations(**test_input)
-        assert str(test_exception_result) in str(e.value)
\ No newline at end of file
+        assert str(test_exception_result) in str(e.value)
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0.correct
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2, 5], "columns": ["A", "C"], "values": ["a1", "c1", "a2", None, "a5", 5]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [{"name": "Example1", "column_number": "C"}, {"name": "Example2", "column_number": "A"}],
+                        "row_from": 1,
+                        "row_to": 2,
+                    }
+                },
+                [
+                    ParameterGroup(parameters=[Parameter(name="Example1", value="c1"), Parameter(name="Example2", value="a1")]),
+                    ParameterGroup(parameters=[Parameter(name="Example1", value=None), Parameter(name="Example2", value="a2")]),
+                ],
+                None
+        ),
+        # 1.row not in matrix
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2, 5], "columns": ["A", "C"], "values": ["a1", "c1", "a2", None, "a5", 5]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [{"name": "Example1", "column_number": "A"}],
+                        "row_from": 2,
+                        "row_to": 3,
+                    }
+                },
+                None,
+                KeyError(3)
+        ),
+        # 2.invalid length of values
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2], "columns": ["A", "C"], "values": ["a1", "c1", "a2"]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [{"name": "Example1", "column_number": "A"}],
+                        "row_from": 1,
+                        "row_to": 1,
+                    }
+                },
+                None,
+                ValueError("The length of 'values'(3) of the ParameterCellMatrix must be equal to rows(2) x columns(2)")
+        ),
+    ]
+)
+def test_parameter_cell_matrix_get_parameter_groups(test_input: Dict[str, Any], test_result: List[ParameterGroup], test_exception_result: Exception):
+    if test_result:
+        assert ParameterCellMatrix(**test_input["parameter_cell_matrix"]).get_parameter_groups(
+            ParameterLocationSource(**test_input["parameter_location_source"])
+        ) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = ParameterCellMatrix(**test_input["parameter_cell_matrix"]).get_parameter_groups(
+                ParameterLocationSource(**test_input["parameter_location_source"])
+            )
+        assert str(test_exception_result) in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0.correct
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2, 5], "columns": ["A", "C"], "values": ["a1", "c1", "a2", None, "a5", 5]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [
+                            {"name": "Example1", "column_number": "C", "required": True},
+                            {"name": "Example2", "column_number": "A"}
+                        ],
+                        "row_from": 1,
+                        "row_to": 2,
+                    }
+                },
+                {"names": ["Example1", "Example2"], "columns": [["c1", None], ["a1", "a2"]], "required": [True, False]},
+                None
+        ),
+        # 1.correct(values converted as Parameter)
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2, 5], "columns": ["A", "C"], "values": ["a1", "c1", "a2", None, "a5", 5]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [{"name": "Example1", "column_number": "C"}],
+                        "row_from": 5,
+                        "row_to": 5,
+                    }
+                },
+                {"names": ["Example1"], "columns": [["5"]], "required": [False]},
+                None
+        ),
+        # 2.row not in matrix
+        (
+                {
+                    "parameter_cell_matrix": {"rows": [1, 2, 5], "columns": ["A", "C"], "values": ["a1", "c1", "a2", None, "a5", 5]},
+                    "parameter_location_source": {
+                        "parameter_column_locations": [{"name": "Example1", "column_number": "A"}],
+                        "row_from": 2,
+                        "row_to": 3,
+                    }
+                },
+                None,
+                KeyError(3)
+        ),
+    ]
+)
+def test_parameter_cell_matrix_get_parameter_frame(test_input: Dict[str, Any], test_result: Dict[str, Any], test_exception_result: Exception):
+    parameter_cell_matrix = ParameterCellMatrix(**test_input["parameter_cell_matrix"])
+    parameter_location_source = ParameterLocationSource(**test_input["parameter_location_source"])
+    if test_result:
+        parameter_frame = parameter_cell_matrix.get_parameter_frame(parameter_location_source)
+        assert (parameter_frame.names, parameter_frame.columns, parameter_frame.required) == (test_result["names"], test_result["columns"], test_result["required"])
+        # 行ごとに取得した場合と同じParameterGroupとなること
+        assert parameter_frame.get_parameter_groups() == parameter_cell_matrix.get_parameter_groups(parameter_location_source)
+    else:
+        with pytest.raises(Exception) as e:
+            _ = parameter_cell_matrix.get_parameter_frame(parameter_location_source)
+        assert str(test_exception_result) in str(e.value)
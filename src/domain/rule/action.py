@@ -1,8 +1,9 @@
-from typing import List
+from typing import Callable, Dict, List, Optional, Pattern, Set, Tuple, Type
 from src.domain.rule.rule_exceptions import ActionNotImplementedError
 from src.utils.logger import get_custom_logger
 import abc
 import copy
+import functools
 import re
 
 
@@ -15,10 +16,25 @@ class Action:
 
     Attributes:
         action_type (str): アクション名を記述する文字列
+        registry (Dict[str, Type[Action]]): アクション名とActionのサブクラスを対応付けるレジストリ
+        escape (Optional[Callable[[str], str]]): Conditionのコマンドに埋め込むパラメータの値に適用する変換、Noneの場合は変換しない
+
+    Note:
+        action_typeを定義したサブクラスは、定義した時点でレジストリに登録される。
+        本モジュールを変更せずに、任意のモジュールでサブクラスを定義してアクションを追加できる。
 
     """
 
     action_type = "Action"
+    registry: Dict[str, Type["Action"]] = {}
+    escape: Optional[Callable[[str], str]] = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "action_type" in cls.__dict__:
+            logger.debug(f"Registering an action({cls.action_type})...")
+            Action.registry[cls.action_type] = cls
 
     @abc.abstractmethod
     def do(self, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
@@ -48,15 +64,20 @@ class Action:
         Returns:
             (Obj'Action'): Actionクラスのサブクラス
 
+        Note:
+            ルールの読み込み時に1度だけ呼び出し、作成したインスタンスを使い回すこと。
+
         """
         logger.debug(f"Building an action({action})...")
 
-        for subclass_name, subclass in {c.action_type: c for c in cls.__subclasses__()}.items():
-            if subclass_name == action:
-                logger.debug(f"Building an action({action}) has been completed successfully")
-                return subclass()
-            
-        raise ActionNotImplementedError({"rule_file": action})
+        subclass: Optional[Type[Action]] = cls.registry.get(action)
+
+        if subclass is None:
+            raise ActionNotImplementedError({"action": action})
+
+        logger.debug(f"Building an action({action}) has been completed successfully")
+
+        return subclass()
 
 
 class Delete(Action):
@@ -67,29 +88,67 @@ class Delete(Action):
     Attributes:
         action_type (str): アクション名を記述する文字列
 
+    Note:
+        Conditionが適用された時に関連するコマンドと完全に一致するコマンドを削除する。
+        正規表現でコマンドを削除する場合は、DeleteRegexを用いること。
+
     """
 
     action_type = "Delete"
 
     def do(self, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
-        result: List[str] = []
-
         logger.debug(f"Apply conditional commands({conditional_commands}) a delete action against applicable commands({applicable_commands})...")
 
-        for ac in applicable_commands:
-            flag = True
-            for cc in conditional_commands:
-                if re.search(ac, cc):
-                    logger.debug(f"Apply an conditional command({cc}) a delete action against an applicable command({ac})...")
-                    flag = False
-            if flag:
-                result.append(ac)
+        # 削除するコマンドの索引を1度だけ作成し、各コマンドを定数時間で判定する
+        deleted_commands: Set[str] = set(conditional_commands)
+
+        result: List[str] = [ac for ac in applicable_commands if ac not in deleted_commands]
 
         logger.debug(f"The Result of applying an delete action is {result}")
         logger.debug(f"Apply conditional commands a delete action against applicable commands has been completed successfully")
         return result
 
 
+class DeleteRegex(Action):
+    """DeleteRegex
+    
+    DeleteRegexは、Actionのサブクラスで正規表現によるコマンドの削除を表現するデータクラスである。
+
+    Attributes:
+        action_type (str): アクション名を記述する文字列
+        escape (Callable[[str], str]): パラメータの値を正規表現のリテラルとして扱うための変換
+
+    Note:
+        Conditionが適用された時に関連するコマンドを正規表現として扱い、いずれかの正規表現にコマンド全体が一致するコマンドを削除する。
+        正規表現として扱うのはルールファイルに記述したコマンドの文字列のみで、埋め込んだパラメータの値はエスケープする。
+        全ての正規表現を1つの選択(|)にまとめてコンパイルし、各コマンドを1度だけ照合する。
+        コンパイルした正規表現は、同じコマンド群に対して再利用する。
+
+    """
+
+    action_type = "DeleteRegex"
+    escape = staticmethod(re.escape)
+
+    def do(self, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
+        logger.debug(f"Apply conditional commands({conditional_commands}) a delete regex action against applicable commands({applicable_commands})...")
+
+        if not conditional_commands:
+            return list(applicable_commands)
+
+        pattern: Pattern = self._compile(tuple(conditional_commands))
+
+        result: List[str] = [ac for ac in applicable_commands if not pattern.fullmatch(ac)]
+
+        logger.debug(f"The Result of applying an delete regex action is {result}")
+        logger.debug(f"Apply conditional commands a delete regex action against applicable commands has been completed successfully")
+        return result
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile(conditional_commands: Tuple[str, ...]) -> Pattern:
+        return re.compile("|".join([f"(?:{cc})" for cc in conditional_commands]))
+
+
 class Add(Action):
     """Add
     
@@ -0,0 +1,82 @@
+from types import ModuleType
+from pydantic import VERSION as PYDANTIC_VERSION
+from typing import Optional, Tuple, Type
+from src.utils.logger import get_custom_logger
+from src.domain.cache.cache_repository import CacheRepository
+from src.domain.parameter_locations import parameter_locations as parameter_locations_module
+from . import action as action_module
+from . import command_template as command_template_module
+from . import condition as condition_module
+from . import rule as rule_module
+from . import validator as validator_module
+from .rule import Rule
+from .rule_repository import RuleRepository
+
+
+logger = get_custom_logger(__name__)
+
+
+class CachedRuleRepository(RuleRepository):
+    """CachedRuleRepository
+
+    本クラスは、RuleRepositoryから取得した検証済みのRuleを、ルールファイルの内容のハッシュ値をキーとしてキャッシュするクラスである
+
+    Attributes:
+        rule_file (str): パラメータシートからパラメータを取り出すルールが書かれたファイル
+        rule_repo (Type[RuleRepository]): キャッシュが存在しない場合に使用するリポジトリ
+        cache_repo_inst (:obj:`CacheRepository`): キャッシュを格納するリポジトリ
+        rule_modules (Tuple[ModuleType, ...]): Ruleと、Ruleが保持する型を定義したモジュール
+
+    Note:
+        キャッシュしたRuleは、バリデーションを再実行せずに復元される。
+        キャッシュのキーはpydanticのバージョンとrule_modulesのソースファイルのハッシュ値を含むため、Ruleのモデル(内部で保持する属性を含む)を変更した場合は自動的に無効となる。
+        Ruleが保持する型を別のモジュールに追加した場合は、rule_modulesに追加すること。
+
+    """
+
+    rule_modules: Tuple[ModuleType, ...] = (
+        rule_module,
+        condition_module,
+        action_module,
+        command_template_module,
+        validator_module,
+        parameter_locations_module,
+    )
+
+    def __init__(self, rule_file: str, rule_repo: Type[RuleRepository], cache_repo_inst: CacheRepository) -> None:
+        super().__init__(rule_file)
+        self.rule_repo: Type[RuleRepository] = rule_repo
+        self.cache_repo_inst: CacheRepository = cache_repo_inst
+
+
+    def read(self) -> Rule:
+        """read
+
+        キャッシュが存在する場合はキャッシュから、存在しない場合はルールファイルからRuleを取得する関数
+
+        Returns:
+            Rule: 検証済みのRule
+
+        """
+        key: str = f"rule:{PYDANTIC_VERSION}:{self.cache_repo_inst.hash_sources(*self.rule_modules)}:{self.cache_repo_inst.hash_file(self.rule_file)}"
+
+        try:
+            result: Optional[Rule] = self.cache_repo_inst.load(key)
+        except Exception as e:
+            # 復元できないキャッシュは、キャッシュが存在しないものとして扱う
+            logger.warning(f"Ignoring the cache of the rule_file({self.rule_file}) because it couldn't be restored: {e}")
+            result = None
+
+        if isinstance(result, Rule):
+
+            logger.debug(f"Getting the rule of the rule_file({self.rule_file}) from the cache has been completed")
+
+            return result
+
+        logger.debug(f"Reading the rule_file({self.rule_file}) because of a cache miss...")
+
+        result = self.rule_repo(rule_file=self.rule_file).read()
+
+        self.cache_repo_inst.save(key, result)
+
+        return result
@@ -0,0 +1,130 @@
+from typing import Any, Dict, Optional
+import types
+import pytest
+import yaml
+
+from .cached_rule_repository import CachedRuleRepository
+from .rule import Rule
+from src.infra.cache.cache_file_impl import CacheFileImpl
+from src.infra.rule.rule_yaml_impl import RuleYamlImpl
+
+
+class UnreadableRuleYamlImpl(RuleYamlImpl):
+    def read(self) -> Rule:
+        raise AssertionError("the rule_file must not be read")
+
+
+def make_raw_rule(row_to: int) -> Dict[str, Any]:
+    return {
+        "common_parameter": {"filling": "!"},
+        "converter_rules": {
+            "HOSTNAME": {
+                "marker": "%%host_name%%",
+                "data": {
+                    "parameter_column_locations": [{"name": "HostName", "column_number": "D"}],
+                    "row_from": 9,
+                    "row_to": row_to,
+                },
+                "commands": ["hostname {HostName}"],
+                "validations": [],
+                "conditions": [
+                    {
+                        "condition": {"type": "isEmpty", "target_parameters": ["HostName"]},
+                        "action": "Delete",
+                        "commands": ["hostname {HostName}"],
+                    }
+                ],
+                "options": {"indent_level": 1},
+            }
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. cache hit
+        (
+                {"cached_raw_rule": make_raw_rule(9), "raw_rule": make_raw_rule(9), "rule_repo": UnreadableRuleYamlImpl},
+                Rule(**make_raw_rule(9)),
+                None
+        ),
+        # 1. cache miss(the rule_file has been updated)
+        (
+                {"cached_raw_rule": make_raw_rule(9), "raw_rule": make_raw_rule(10), "rule_repo": RuleYamlImpl},
+                Rule(**make_raw_rule(10)),
+                None
+        ),
+        # 2. cache miss(the rule_file has been updated) with an unreadable rule_file
+        (
+                {"cached_raw_rule": make_raw_rule(9), "raw_rule": make_raw_rule(10), "rule_repo": UnreadableRuleYamlImpl},
+                None,
+                AssertionError("the rule_file must not be read")
+        ),
+    ]
+)
+def test_cached_rule_repository_read(tmp_path, test_input: Dict[str, Any], test_result: Rule, test_exception_result: Exception):
+    rule_file = str(tmp_path / "rule.yml")
+    cache_repo_inst = CacheFileImpl(cache_dir=str(tmp_path / "cache"))
+
+    with open(rule_file, "w", encoding="UTF-8") as f:
+        yaml.safe_dump(test_input["cached_raw_rule"], f, allow_unicode=True)
+    _ = CachedRuleRepository(rule_file, RuleYamlImpl, cache_repo_inst).read()
+
+    with open(rule_file, "w", encoding="UTF-8") as f:
+        yaml.safe_dump(test_input["raw_rule"], f, allow_unicode=True)
+
+    if test_result:
+        rule_object = CachedRuleRepository(rule_file, test_input["rule_repo"], cache_repo_inst).read()
+        assert rule_object == test_result
+        assert (rule_object.required_rows, rule_object.required_columns) == (test_result.required_rows, test_result.required_columns)
+    else:
+        with pytest.raises(Exception) as e:
+            _ = CachedRuleRepository(rule_file, test_input["rule_repo"], cache_repo_inst).read()
+        assert str(test_exception_result) in str(e.value)
+
+
+class BrokenCacheFileImpl(CacheFileImpl):
+    def load(self, key: str) -> Optional[Any]:
+        raise AttributeError("Can't get attribute 'ConverterRule'")
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. cache miss(the definition of the rule has been changed)
+        (
+                {"cache_repo": CacheFileImpl, "rule_module_source": "class Rule:\n    value: int = 0\n"},
+                Rule(**make_raw_rule(9)),
+                None
+        ),
+        # 1. cache miss(the cache couldn't be restored)
+        (
+                {"cache_repo": BrokenCacheFileImpl, "rule_module_source": None},
+                Rule(**make_raw_rule(9)),
+                None
+        ),
+    ]
+)
+def test_cached_rule_repository_read_invalid_cache(tmp_path, monkeypatch, test_input: Dict[str, Any], test_result: Rule, test_exception_result: Exception):
+    rule_file = str(tmp_path / "rule.yml")
+    with open(rule_file, "w", encoding="UTF-8") as f:
+        yaml.safe_dump(make_raw_rule(9), f, allow_unicode=True)
+
+    rule_module = types.ModuleType("rule")
+    rule_module.__file__ = str(tmp_path / "rule.py")
+    with open(rule_module.__file__, "w", encoding="UTF-8") as f:
+        f.write("class Rule:\n    pass\n")
+    monkeypatch.setattr(CachedRuleRepository, "rule_modules", (rule_module,))
+
+    _ = CachedRuleRepository(rule_file, RuleYamlImpl, CacheFileImpl(cache_dir=str(tmp_path / "cache"))).read()
+
+    if test_input["rule_module_source"]:
+        changed_rule_module = types.ModuleType("rule")
+        changed_rule_module.__file__ = str(tmp_path / "changed_rule.py")
+        with open(changed_rule_module.__file__, "w", encoding="UTF-8") as f:
+            f.write(test_input["rule_module_source"])
+        monkeypatch.setattr(CachedRuleRepository, "rule_modules", (changed_rule_module,))
+
+    # キャッシュを利用できない場合は、ルールファイルを読み込むこと
+    with pytest.raises(AssertionError):
+        _ = CachedRuleRepository(rule_file, UnreadableRuleYamlImpl, test_input["cache_repo"](cache_dir=str(tmp_path / "cache"))).read()
+    assert CachedRuleRepository(rule_file, RuleYamlImpl, test_input["cache_repo"](cache_dir=str(tmp_path / "cache"))).read() == test_result
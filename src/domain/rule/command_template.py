@@ -0,0 +1,199 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from src.utils.logger import get_custom_logger
+import re
+import string
+
+
+logger = get_custom_logger(__name__)
+
+
+CONVERSIONS: Dict[str, Callable[[Any], str]] = {"s": str, "r": repr, "a": ascii}
+
+# 置換フィールド名の先頭(パラメータ名)と、それに続く属性参照(.attr)・インデックス参照([key])
+FIELD_FIRST_PATTERN: re.Pattern = re.compile(r"[^.\[]*")
+FIELD_ACCESSOR_PATTERN: re.Pattern = re.compile(r"\.([^.\[]+)|\[([^\]]+)\]")
+
+
+class MissingValue:
+    """MissingValue
+
+    本クラスは、ParameterGroupに存在しないパラメータの値を表す番兵である
+
+    Note:
+        コマンドが参照しないパラメータは存在しなくてもよいが、参照する置換フィールドの埋め込み時はKeyErrorを送出する。
+
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING_VALUE"
+
+
+MISSING_VALUE: MissingValue = MissingValue()
+
+
+def split_field_name(field_name: str) -> Tuple[str, Tuple[Tuple[bool, Union[int, str]], ...]]:
+    """split_field_name
+
+    置換フィールド名を、パラメータ名と属性参照・インデックス参照の配列に分割する関数
+
+    Args:
+        field_name (str): 置換フィールド名(Name.attr[0]など)
+
+    Returns:
+        Tuple[str, Tuple[Tuple[bool, Union[int, str]], ...]]: パラメータ名と、属性参照かどうかとキーの組の配列
+
+    Note:
+        str.formatと同じく、数字のみのインデックスは整数として扱う。
+
+    """
+    first: str = FIELD_FIRST_PATTERN.match(field_name).group()
+    position: int = len(first)
+    accessors: List[Tuple[bool, Union[int, str]]] = []
+
+    while position < len(field_name):
+
+        match: Optional[re.Match] = FIELD_ACCESSOR_PATTERN.match(field_name, position)
+
+        if match is None:
+            raise ValueError(f"The field name '{field_name}' must consist of a parameter name followed by '.attribute' or '[key]'")
+
+        attribute, key = match.groups()
+        accessors.append((True, attribute) if attribute is not None else (False, int(key) if key.isdigit() else key))
+        position = match.end()
+
+    return first, tuple(accessors)
+
+
+class CommandField:
+    """CommandField
+
+    本クラスは、コマンドのテンプレート内の置換フィールド({Param}など)を、値の配列のインデックス(スロット)に解決したものである
+
+    Attributes:
+        name (str): 置換するパラメータ名
+        slot (int): 置換する値の、値の配列内のインデックス
+        accessors (Tuple[Tuple[bool, Union[int, str]], ...]): 属性参照(.attr)・インデックス参照([key])の配列
+        conversion (Optional[str]): 変換指定(!s, !r, !a)
+        format_spec (Optional[CommandTemplate]): 書式指定、置換フィールドを含む場合があるためテンプレートとして保持する
+
+    """
+
+    __slots__ = ("name", "slot", "accessors", "conversion", "format_spec")
+
+    def __init__(self, name: str, slot: int, accessors: Tuple[Tuple[bool, Union[int, str]], ...], conversion: Optional[str], format_spec: Optional["CommandTemplate"]):
+        self.name = name
+        self.slot = slot
+        self.accessors = accessors
+        self.conversion = conversion
+        self.format_spec = format_spec
+
+    def __getstate__(self):
+        return self.name, self.slot, self.accessors, self.conversion, self.format_spec
+
+    def __setstate__(self, state):
+        self.name, self.slot, self.accessors, self.conversion, self.format_spec = state
+
+    def render(self, values: Sequence[Any]) -> str:
+        value: Any = values[self.slot]
+
+        # str.format_mapと同じく、参照したパラメータが存在しない場合はKeyErrorとする
+        if value is MISSING_VALUE:
+            raise KeyError(self.name)
+
+        for is_attribute, key in self.accessors:
+            value = getattr(value, key) if is_attribute else value[key]
+
+        if self.conversion:
+            value = CONVERSIONS[self.conversion](value)
+
+        return format(value, self.format_spec.render(values) if self.format_spec else "")
+
+
+class CommandTemplate:
+    """CommandTemplate
+
+    本クラスは、コマンドの文字列(str.format形式)を、リテラルと置換フィールドの配列に事前に解析したテンプレートである
+
+    Attributes:
+        command (str): 解析元のコマンドの文字列
+        segments (Tuple[Union[str, CommandField], ...]): リテラルと置換フィールドの配列
+
+    Note:
+        置換フィールドのパラメータ名は、解析時に値の配列のインデックスに解決する。
+        レンダリング時はパラメータ名の検索やコマンドの再解析を行わず、インデックスを用いて値を埋め込むのみとなる。
+        str.format_mapと同じく、変換指定(!r等)、書式指定、属性・インデックス参照をサポートする。
+
+    """
+
+    __slots__ = ("command", "segments")
+
+    def __init__(self, command: str, parameter_names: Sequence[str]):
+        self.command: str = command
+        self.segments: Tuple[Union[str, CommandField], ...] = self._compile(command, parameter_names)
+
+    def __getstate__(self):
+        return self.command, self.segments
+
+    def __setstate__(self, state):
+        self.command, self.segments = state
+
+    def __repr__(self) -> str:
+        return f"CommandTemplate({self.command!r})"
+
+    def render(self, values: Sequence[Any], escape: Optional[Callable[[str], str]] = None) -> str:
+        """render
+
+        値の配列を置換フィールドに埋め込み、コマンドの文字列を作成する関数
+
+        Args:
+            values (Sequence[Any]): parameter_namesと同じ順序で並べたパラメータの値の配列、存在しないパラメータはMISSING_VALUE
+            escape (Optional[Callable[[str], str]]): 置換フィールドに埋め込んだ値のみに適用する変換(re.escapeなど)
+
+        Returns:
+            str: 値を埋め込んだコマンドの文字列
+
+        Raises:
+            KeyError: 置換フィールドが参照するパラメータの値がMISSING_VALUEの場合
+
+        """
+        if escape is None:
+            return "".join([segment if segment.__class__ is str else segment.render(values) for segment in self.segments])
+
+        return "".join([segment if segment.__class__ is str else escape(segment.render(values)) for segment in self.segments])
+
+    @classmethod
+    def _compile(cls, command: str, parameter_names: Sequence[str]) -> Tuple[Union[str, CommandField], ...]:
+        slots: Dict[str, int] = {name: i for i, name in enumerate(parameter_names)}
+        segments: List[Union[str, CommandField]] = []
+
+        for literal_text, field_name, format_spec, conversion in string.Formatter().parse(command):
+
+            if literal_text:
+                segments.append(literal_text)
+
+            if field_name is None:
+                continue
+
+            first, rest = split_field_name(field_name)
+
+            if first not in slots:
+                raise ValueError(
+                    f"The placeholder '{{{field_name}}}' in the command({command}) must be one of the parameter names({list(parameter_names)})"
+                )
+
+            if conversion and conversion not in CONVERSIONS:
+                raise ValueError(f"The conversion '!{conversion}' in the command({command}) must be one of {['!' + i for i in CONVERSIONS]}")
+
+            segments.append(
+                CommandField(
+                    name=first,
+                    slot=slots[first],
+                    accessors=rest,
+                    conversion=conversion,
+                    format_spec=cls(format_spec, parameter_names) if format_spec else None
+                )
+            )
+
+        return tuple(segments)
@@ -0,0 +1,75 @@
+from typing import Any, Dict
+import pickle
+import pytest
+
+from .command_template import CommandTemplate
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {"command": "hostname {HostName}", "parameter_names": ["HostName"], "values": ["host1"]},
+                "hostname host1",
+                None
+        ),
+        # 1. correct(repeated placeholders, escaped braces and no placeholders)
+        (
+                {"command": "{{ {Prefix} }} {NextHop} {Prefix}", "parameter_names": ["NextHop", "Prefix"], "values": ["192.168.1.1", "10.0.0.0/8"]},
+                "{ 10.0.0.0/8 } 192.168.1.1 10.0.0.0/8",
+                None
+        ),
+        # 2. correct(conversion, nested format_spec and index)
+        (
+                {"command": "{Name!r:>{Width}}{Name[0]}", "parameter_names": ["Name", "Width"], "values": ["ab", "6"]},
+                "  'ab'a",
+                None
+        ),
+        # 3. correct(empty value)
+        (
+                {"command": "ip route {Prefix}", "parameter_names": ["Prefix"], "values": [None]},
+                "ip route None",
+                None
+        ),
+        # 4. unknown placeholder
+        (
+                {"command": "hostname {Unknown}", "parameter_names": ["HostName"], "values": []},
+                None,
+                ValueError("The placeholder '{Unknown}' in the command(hostname {Unknown}) must be one of the parameter names(['HostName'])")
+        ),
+        # 5. positional placeholder
+        (
+                {"command": "hostname {}", "parameter_names": ["HostName"], "values": []},
+                None,
+                ValueError("The placeholder '{}' in the command(hostname {}) must be one of the parameter names(['HostName'])")
+        ),
+        # 6. unknown conversion
+        (
+                {"command": "hostname {HostName!x}", "parameter_names": ["HostName"], "values": []},
+                None,
+                ValueError("The conversion '!x' in the command(hostname {HostName!x}) must be one of ['!s', '!r', '!a']")
+        ),
+        # 7. correct(attribute and index references)
+        (
+                {"command": "{Prefix.real}/{Names[1]}{Names[0][0]}", "parameter_names": ["Prefix", "Names"], "values": [24, ["ab", "cd"]]},
+                "24/cda",
+                None
+        ),
+        # 8. invalid field name
+        (
+                {"command": "hostname {HostName[0]x}", "parameter_names": ["HostName"], "values": []},
+                None,
+                ValueError("The field name 'HostName[0]x' must consist of a parameter name followed by '.attribute' or '[key]'")
+        ),
+    ]
+)
+def test_command_template_render(test_input: Dict[str, Any], test_result: str, test_exception_result: Exception):
+    if test_result:
+        command_template = CommandTemplate(test_input["command"], test_input["parameter_names"])
+        assert command_template.render(test_input["values"]) == test_result
+        assert command_template.render(test_input["values"]) == test_input["command"].format_map(dict(zip(test_input["parameter_names"], test_input["values"])))
+        assert pickle.loads(pickle.dumps(command_template)).render(test_input["values"]) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = CommandTemplate(test_input["command"], test_input["parameter_names"])
+        assert str(test_exception_result) in str(e.value)
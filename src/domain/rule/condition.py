@@ -1,7 +1,9 @@
-from typing import List, Literal
-from pydantic import BaseModel, Field
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Type, Union
+from pydantic import BaseModel, Field, PrivateAttr, validator
+from pydantic.errors import InvalidDiscriminator, MissingDiscriminator
 from src.utils.logger import get_custom_logger
 from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
+from src.domain.parameter_locations.parameter_frame import ParameterFrame
 
 import abc
 import re
@@ -15,8 +17,55 @@ class Condition:
     
     Conditionは、Parameterの入力内容によってParameterGroupに対してCommandの追加・削除等の操作を行うか決定するインターフェースである。
 
+    Attributes:
+        condition_type (str): ルールファイルのtypeに記述するConditionのタイプ
+        registry (Dict[str, Type[Condition]]): ConditionのタイプとConditionのサブクラスを対応付けるレジストリ
+
+    Note:
+        condition_typeを定義したサブクラスは、定義した時点でレジストリに登録される。
+        本モジュールを変更せずに、任意のモジュールでサブクラスを定義してConditionを追加できる。
+
     """
 
+    condition_type: ClassVar[str] = "Condition"
+    registry: ClassVar[Dict[str, Type["Condition"]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "condition_type" in cls.__dict__:
+            logger.debug(f"Registering a condition({cls.condition_type})...")
+            Condition.registry[cls.condition_type] = cls
+
+    @classmethod
+    def build(cls, condition: Union["Condition", Dict[str, Any]]) -> "Condition":
+        """build
+
+        build関数は、ルールファイルに記述したConditionのtypeから、レジストリに登録したサブクラスのインスタンスを作成するクラスメソッドである。
+
+        Args:
+            condition (Union[Condition, Dict[str, Any]]): Conditionのインスタンス、またはルールファイルに記述したCondition
+
+        Returns:
+            Condition: Conditionのサブクラスのインスタンス
+
+        """
+        if isinstance(condition, Condition):
+            return condition
+
+        # pydanticのdiscriminated unionと同じエラー型を送出し、ルールファイルのエラー表示を従来と揃える
+        if not isinstance(condition, dict) or "type" not in condition:
+            raise MissingDiscriminator(discriminator_key="type")
+
+        subclass: Optional[Type[Condition]] = cls.registry.get(condition["type"])
+
+        if subclass is None:
+            raise InvalidDiscriminator(
+                discriminator_key="type", discriminator_value=condition["type"], allowed_values=list(cls.registry)
+            )
+
+        return subclass.parse_obj(condition)
+
     @abc.abstractmethod
     def evaluate(self, parameter_group: List[Parameter]) -> bool:
         """evaluate
@@ -32,6 +81,23 @@ class Condition:
         """
         raise NotImplementedError("The 'evaluate' method must be implemented")
 
+    def evaluate_batch(self, parameter_frame: ParameterFrame) -> List[bool]:
+        """evaluate_batch
+    
+        evaluate_batch関数は、ParameterFrameの全ての行に対してConditionの内容を満たしているか判断する関数である。
+
+        Attributes:
+            parameter_frame (ParameterFrame): 列ごとの値の配列として保持したパラメータ群
+
+        Returns:
+            List[bool]: 行ごとにParameterが条件を満たしているかを真偽値で返す。
+
+        Note:
+            サブクラスで実装されていない場合は、行ごとのParameterGroupに対してevaluateを評価する。
+
+        """
+        return [self.evaluate(parameter_group) for parameter_group in parameter_frame.get_parameter_groups()]
+
 
 class IsEmptyCondition(Condition, BaseModel):
     """IsEmptyCondition
@@ -44,6 +110,8 @@ class IsEmptyCondition(Condition, BaseModel):
 
     """
 
+    condition_type: ClassVar[str] = "isEmpty"
+
     type: Literal['isEmpty']
     target_parameters: List[str] = Field(..., min_items=1)
 
@@ -69,6 +137,21 @@ class IsEmptyCondition(Condition, BaseModel):
 
         return True
 
+    def evaluate_batch(self, parameter_frame: ParameterFrame) -> List[bool]:
+        """evaluate_batch
+
+        ParameterFrameの全ての行に対して、対象のパラメータが全て空(Noneまたは空文字)かどうかを判断する関数
+
+        Note:
+            ParameterFrameに存在しないパラメータは、evaluateと同じく判断の対象外とする。
+
+        """
+        columns: List[List[str]] = [parameter_frame.get_column(target_parameter) for target_parameter in self.target_parameters if target_parameter in parameter_frame]
+
+        logger.debug(f"Evaluating whether {len(parameter_frame)} rows of parameters({self.target_parameters}) are empty...")
+
+        return [not any(values) for values in zip(*columns)] if columns else [True] * len(parameter_frame)
+
 
 class IsContainedCondition(Condition, BaseModel):
     """IsContainedCondition
@@ -81,17 +164,34 @@ class IsContainedCondition(Condition, BaseModel):
         target_string str: 対象となる文字列
 
     """
+    condition_type: ClassVar[str] = "isContained"
+
     type: Literal['isContained']
     target_parameters: List[str] = Field(..., min_items=1)
     target_string: str = Field(..., min_length=1)
 
+    _pattern: re.Pattern = PrivateAttr(default=None)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        # target_stringはルールの読み込み時に1度だけコンパイルし、評価のたびにreのキャッシュを検索しないようにする
+        self._pattern = re.compile(self.target_string)
+
+    @validator("target_string")
+    def _validate_target_string(cls, value: str) -> str:
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise ValueError(f"The target_string({value}) must be a valid regular expression: {e}")
+        return value
+
     def evaluate(self, parameter_group: ParameterGroup) -> bool:
 
         for target_parameter in self.target_parameters:
 
             if target_parameter in parameter_group:
 
-                if not re.search(self.target_string, parameter_group.get(target_parameter).value):
+                if not self._pattern.search(parameter_group.get(target_parameter).value):
 
                     logger.debug(f"A parameter({target_parameter}) doesn't contain target_string({self.target_string})")
 
@@ -111,4 +211,30 @@ class IsContainedCondition(Condition, BaseModel):
 
         logger.debug(f"Evaluating whether a parameter_group contained target_string({self.target_string}) has been completed successfully")
 
-        return True
\ No newline at end of file
+        return True
+
+    def evaluate_batch(self, parameter_frame: ParameterFrame) -> List[bool]:
+        """evaluate_batch
+
+        ParameterFrameの全ての行に対して、対象のパラメータが全てtarget_stringを含んでいるかを判断する関数
+
+        Note:
+            ルールの読み込み時にコンパイルしたtarget_stringを用いて、列ごとに1回の走査で検索する。
+            前の列で条件を満たさなかった行は、evaluateと同じく後ろの列を検索しない。
+
+        """
+        logger.debug(f"Evaluating whether {len(parameter_frame)} rows of parameters({self.target_parameters}) contain target_string({self.target_string})...")
+
+        if not all(target_parameter in parameter_frame for target_parameter in self.target_parameters):
+
+            logger.debug(f"Some of parameters({self.target_parameters}) don't exist")
+
+            return [False] * len(parameter_frame)
+
+        search = self._pattern.search
+        mask: List[bool] = [True] * len(parameter_frame)
+
+        for target_parameter in self.target_parameters:
+            mask = [is_satisfied and search(value) is not None for is_satisfied, value in zip(mask, parameter_frame.get_column(target_parameter))]
+
+        return mask
\ No newline at end of file
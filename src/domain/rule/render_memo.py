@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+from src.utils.logger import get_custom_logger
+import sys
+
+
+logger = get_custom_logger(__name__)
+
+
+def _get_size(value: Any) -> int:
+    # タプルは要素を含めたサイズ、それ以外(文字列・数値など)はオブジェクト自体のサイズとする
+    if value.__class__ is tuple:
+        return sys.getsizeof(value) + sum([_get_size(item) for item in value])
+
+    return sys.getsizeof(value)
+
+
+class RenderMemo:
+    """RenderMemo
+
+    本クラスは、ConverterRuleが作成したコマンド群を、ルールと抽出した値の組をキーとして保持するLRUキャッシュである
+
+    Attributes:
+        max_size (int): 保持するキーとコマンド群の合計サイズの上限(バイト)
+        hits (int): 保持していたコマンド群を返した回数
+        misses (int): 保持していなかった回数
+
+    Note:
+        上限を超えた場合は、最も長く参照されていないコマンド群から破棄する。
+        1つで上限を超えるコマンド群は保持しない。
+        コマンド群は変更できないタプルとして保持し、複数のデバイスで共有する。
+
+    """
+
+    def __init__(self, max_size: int = 32 * 1024 * 1024) -> None:
+
+        if max_size < 1:
+
+            raise ValueError(f"The 'max_size'({max_size}) of the RenderMemo must be greater than 0")
+
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._size: int = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[Tuple[str, ...], ...], int]]" = OrderedDict()
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    @property
+    def size(self) -> int:
+        """size
+
+        保持しているキーとコマンド群の合計サイズ(バイト)
+
+        """
+        return self._size
+
+
+    @property
+    def hit_rate(self) -> float:
+        """hit_rate
+
+        参照した回数のうち、保持していたコマンド群を返した割合、1度も参照していない場合は0
+
+        """
+        total: int = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+
+    def get(self, key: Hashable) -> Optional[Tuple[Tuple[str, ...], ...]]:
+        """get
+
+        キーに対応するコマンド群を取得する関数
+
+        Args:
+            key (Hashable): ルールの識別子と抽出した値の組
+
+        Returns:
+            Optional[Tuple[Tuple[str, ...], ...]]: 保持していたコマンド群、保持していない場合はNone
+
+        """
+        entry: Optional[Tuple[Tuple[Tuple[str, ...], ...], int]] = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[0]
+
+
+    def put(self, key: Hashable, commands_group: List[List[str]]) -> None:
+        """put
+
+        キーに対応するコマンド群を保持する関数
+
+        Args:
+            key (Hashable): ルールの識別子と抽出した値の組
+            commands_group (List[List[str]]): 作成したコマンド群、タプルに変換して保持する
+
+        """
+        value: Tuple[Tuple[str, ...], ...] = tuple([tuple(commands) for commands in commands_group])
+        size: int = _get_size(key) + _get_size(value)
+
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[1]
+
+        if size > self.max_size:
+
+            logger.debug(f"Skipping a commands_group({size} bytes) which exceeds the max_size({self.max_size}) of the RenderMemo")
+
+            return
+
+        self._entries[key] = (value, size)
+        self._size += size
+
+        while self._size > self.max_size:
+            self._size -= self._entries.popitem(last=False)[1][1]
+
+
+    def add_counts(self, hits: int, misses: int) -> None:
+        """add_counts
+
+        他のプロセスのRenderMemoで参照した回数を加算する関数
+
+        Args:
+            hits (int): 保持していたコマンド群を返した回数
+            misses (int): 保持していなかった回数
+
+        """
+        self.hits += hits
+        self.misses += misses
@@ -0,0 +1,71 @@
+from typing import Any, Dict, List, Tuple
+import pytest
+
+from .render_memo import RenderMemo
+
+
+def make_commands_group_size(key: str) -> int:
+    render_memo = RenderMemo()
+    render_memo.put(key, [[f"command {key}"]])
+    return render_memo.size
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(hit)
+        (
+                {"max_entries": 2, "put": ["key1", "key2"], "get": ["key1", "key2", "key3"]},
+                (["key1", "key2"], 2, 1),
+                None
+        ),
+        # 1. correct(least recently used key is evicted)
+        (
+                {"max_entries": 2, "put": ["key1", "key2", "key3"], "get": ["key1", "key2", "key3"]},
+                (["key2", "key3"], 2, 1),
+                None
+        ),
+        # 2. correct(recently used key is not evicted)
+        (
+                {"max_entries": 2, "put": ["key1", "key2", "key1", "key3"], "get": ["key1", "key2", "key3"]},
+                (["key1", "key3"], 2, 1),
+                None
+        ),
+        # 3. correct(a commands_group larger than max_size is not stored)
+        (
+                {"max_entries": 0.5, "put": ["key1"], "get": ["key1"]},
+                ([], 0, 1),
+                None
+        ),
+        # 4. incorrect(max_size is 0)
+        (
+                {"max_entries": 0, "put": [], "get": []},
+                None,
+                "The 'max_size'(0) of the RenderMemo must be greater than 0"
+        ),
+    ]
+)
+def test_render_memo(test_input: Dict[str, Any], test_result: Tuple[List[str], int, int], test_exception_result: str):
+    # 上限は、同じサイズのコマンド群の個数(max_entries)から計算する
+    max_size = int(make_commands_group_size("key1") * test_input["max_entries"])
+    if test_result:
+        render_memo = RenderMemo(max_size=max_size)
+        for key in test_input["put"]:
+            render_memo.put(key, [[f"command {key}"]])
+
+        hit_keys = [key for key in test_input["get"] if render_memo.get(key) == ((f"command {key}",),)]
+        assert (hit_keys, render_memo.hits, render_memo.misses) == test_result
+        assert len(render_memo) == int(test_input["max_entries"])
+        assert render_memo.size <= max_size
+        assert render_memo.hit_rate == pytest.approx(test_result[1] / (test_result[1] + test_result[2]))
+    else:
+        with pytest.raises(ValueError) as e:
+            _ = RenderMemo(max_size=max_size)
+        assert test_exception_result in str(e.value)
+
+
+def test_render_memo_add_counts():
+    render_memo = RenderMemo()
+    render_memo.put("key1", [["command key1"]])
+    _ = render_memo.get("key1"), render_memo.get("key2")
+    render_memo.add_counts(hits=3, misses=1)
+    assert (render_memo.hits, render_memo.misses, render_memo.hit_rate) == (4, 2, pytest.approx(4 / 6))
@@ -1,29 +1,58 @@
-from typing import List, Literal, Dict, Union
-from pydantic import BaseModel, Field, validator
+from typing import Any, Hashable, Iterable, Iterator, List, Literal, Dict, Optional, Set, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError, validator
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import WrongConstantError
 from src.utils.logger import get_custom_logger
 from src.domain.config.config import ConfigSource
 from src.domain.parameter_locations.parameter_locations import ParameterLocationSource
 from src.domain.parameter_locations.parameter import ParameterGroup
-from .condition import IsEmptyCondition, IsContainedCondition
+from src.domain.parameter_locations.parameter_frame import ParameterFrame
+from .condition import Condition, IsEmptyCondition, IsContainedCondition
 from .action import Action
+from .command_template import CommandTemplate, MISSING_VALUE
+from .render_memo import RenderMemo
 from .validator import RegexValidator, NumberRangeValidator
-import copy
 
 
 logger = get_custom_logger(__name__)
 
 
 class CommandCondition(BaseModel):
-    condition: Union[IsEmptyCondition, IsContainedCondition] = Field(..., discriminator='type')
-    action: Literal["Delete", "Add"]
+    condition: Condition
+    action: str
     commands: List[str] = Field(..., min_items=1)
 
+    _action: Action = PrivateAttr(default=None)
+
     class Config:
         allow_mutation = False
+        arbitrary_types_allowed = True
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        # Actionはルールの読み込み時にレジストリから1度だけ作成し、行ごとに使い回す
+        self._action = Action.build(self.action)
+
+    @validator("condition", pre=True)
+    def _build_condition(cls, value):
+        return Condition.build(value)
+
+    @validator("action")
+    def _validate_action(cls, value: str) -> str:
+        if value not in Action.registry:
+            raise WrongConstantError(given=value, permitted=tuple(Action.registry))
+        return value
+
+    def render_commands(self, templates: Tuple[CommandTemplate, ...], values: List[str]) -> List[str]:
+        # Actionがエスケープを指定した場合は、パラメータの値のみをエスケープしてConditionのコマンドを作成する
+        return [template.render(values, self._action.escape) for template in templates]
+
+    def apply_action(self, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
+        return self._action.do(conditional_commands, applicable_commands)
 
     def apply_command_condition(self, parameter_group: ParameterGroup, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
         if self.condition.evaluate(parameter_group):
-            return Action.build(self.action).do(conditional_commands, applicable_commands)
+            return self.apply_action(conditional_commands, applicable_commands)
         return applicable_commands
     
     
@@ -44,69 +73,42 @@ class Options(BaseModel):
         allow_mutation = False
 
     def assign_options(self, commands_group: List[List[str]], filling: str) -> List[List[str]]:
-        result: List[List[str]] = copy.deepcopy(commands_group)
+        return [list(self.iter_options(commands, filling)) for commands in commands_group]
 
-        if self.indent_level:
-            result: List[List[str]] = self._apply_indent_level(
-                indent_level=self.indent_level,
-                filling=filling,
-                commands_group=result
-            )
-
-        if self.filling_each_commands:
-            result: List[List[str]] = self._apply_filling_each_commands(
-                filling=filling,
-                commands_group=result
-            )
-        
+    def iter_options(self, commands: Iterable[str], filling: str) -> Iterator[str]:
+        """iter_options
 
-        if self.filling_each_commands_group:
-            result: List[List[str]] = self._apply_filling_each_commands_group(
-                filling=filling,
-                commands_group=result
-            )
+        1つのコマンド群に全てのOptionを1度の走査で適用し、コマンドを1行ずつ返すイテレータ
 
-        return result
+        Args:
+            commands (Iterable[str]): Optionを適用するコマンド群
+            filling (str): コマンドの間を埋める文字列
 
-    @staticmethod
-    def _apply_indent_level(indent_level: int, filling: str, commands_group: List[List[str]]) -> List[List[str]]:
-        result: List[List[str]] = []
+        Note:
+            indent_level、filling_each_commands、filling_each_commands_groupの順に適用した場合と同じ結果となる。
+            indent_levelを指定した場合、既存のfillingの行は削除される。
+            中間のコマンド群の配列を作成しないため、出力先に直接書き込む場合にも用いることができる。
 
-        for commands in commands_group:
-            commands_result = []
-            for command in commands:
-                if command != filling:
-                    commands_result.append(" " * indent_level + command)
-            result.append(commands_result)
+        """
+        indent: str = " " * self.indent_level
+        is_first: bool = True
 
-        return result
+        for command in commands:
 
-    @staticmethod
-    def _apply_filling_each_commands(filling: str, commands_group: List[List[str]]) -> List[List[str]]:
-        result: List[List[str]] = []
+            if indent:
+                if command == filling:
+                    continue
+                command = indent + command
 
-        for commands in commands_group:
-            commands_result = []
-            for i, command in enumerate(commands):
-                commands_result.append(command)
-                if len(commands) != (i+1):
-                    commands_result.append(filling)
-            result.append(commands_result)
+            if self.filling_each_commands and not is_first:
+                yield filling
 
-        return result
+            is_first = False
 
-    @staticmethod
-    def _apply_filling_each_commands_group(filling: str, commands_group: List[List[str]]) -> List[List[str]]:
-        result: List[List[str]] = []
+            yield command
 
-        for commands in commands_group:
-            commands_result = []
-            for i, command in enumerate(commands):
-                commands_result.append(command)
-                if len(commands) == (i+1):
-                    commands_result.append(filling)
-            result.append(commands_result)
-        return result
+        if self.filling_each_commands_group and not is_first:
+            yield filling
 
 
 class CommonParameter(BaseModel):
@@ -125,22 +127,45 @@ class ConverterRule(BaseModel):
     conditions: List[CommandCondition] = Field(..., min_items=0)
     options: Options
 
+    _command_templates: Tuple[CommandTemplate, ...] = PrivateAttr(default=())
+    _conditional_command_templates: Tuple[Tuple[CommandTemplate, ...], ...] = PrivateAttr(default=())
+
     class Config:
         allow_mutation = False
 
+    def __init__(self, **data):
+        super().__init__(**data)
+        # コマンドはルールの読み込み時に1度だけ解析し、パラメータ名を値の配列のインデックスに解決しておく
+        # 未知のプレースホルダーは、他のフィールドと同じくValidationErrorとして送出する
+        try:
+            self._command_templates, self._conditional_command_templates = self._compile_commands(
+                self.parameter_names, self.commands, [command_condition.commands for command_condition in self.conditions]
+            )
+        except ValueError as e:
+            raise ValidationError([ErrorWrapper(e, loc="__root__")], self.__class__) from e
+
+    @property
+    def parameter_names(self) -> List[str]:
+        return list(self.data.parameter_range.names)
+
     def make_config_source(self, parameter_group_list: List[ParameterGroup], common_parameter: CommonParameter) -> ConfigSource:
         commands_group: List[List[str]] = []
+        parameter_names: List[str] = self.parameter_names
 
         for parameter_group in parameter_group_list:
             if self._apply_validation_all_parameters(self.validations, parameter_group):
 
-                commands: List[str] = self._get_params_inserted_commands(commands=self.commands,parameter_group=parameter_group)
+                parameters: Dict[str, str] = parameter_group.to_dict()
+                # コマンドが参照しないパラメータはParameterGroupに存在しなくてもよい、参照するパラメータが存在しない場合は埋め込み時にKeyErrorとなる
+                values: List[Any] = [parameters.get(name, MISSING_VALUE) for name in parameter_names]
+
+                commands: List[str] = self._render_commands(templates=self._command_templates, values=values)
 
-                for command_condition in self.conditions:
+                for command_condition, conditional_command_templates in zip(self.conditions, self._conditional_command_templates):
 
                     commands = command_condition.apply_command_condition(
                         parameter_group=parameter_group,
-                        conditional_commands=self._get_params_inserted_commands(commands=command_condition.commands, parameter_group=parameter_group),
+                        conditional_commands=command_condition.render_commands(templates=conditional_command_templates, values=values),
                         applicable_commands=commands,
                     )
 
@@ -149,11 +174,81 @@ class ConverterRule(BaseModel):
         # optionの適用
         result: List[List[str]] = self.options.assign_options(commands_group, common_parameter.filling)
 
-        return ConfigSource(marker=self.marker, commands_group=result)
+        return self._make_config_source(marker=self.marker, commands_group=result)
+
+    def make_config_source_batch(self, parameter_frame: ParameterFrame, common_parameter: CommonParameter, render_memo: Optional[RenderMemo] = None) -> ConfigSource:
+        """make_config_source_batch
+
+        ParameterFrameの全ての行をまとめて処理し、ConfigSourceを作成する関数
+
+        Args:
+            parameter_frame (:obj:`ParameterFrame`): 列ごとの値の配列として保持したパラメータ群
+            common_parameter (:obj:`CommonParameter`): 全てのルールに共通するパラメータ
+            render_memo (Optional[:obj:`RenderMemo`]): 作成したコマンド群を、デバイスをまたいで再利用するためのキャッシュ
+
+        Returns:
+            ConfigSource: マーカーと置換するコマンド群
+
+        Note:
+            make_config_sourceと同じ結果を返す。
+            コマンドはテンプレートごとに全ての行を埋め込み、Conditionは行ごとの真偽値のマスクとして評価する。
+            Conditionを満たした行のみ、Conditionのコマンドを埋め込んでActionを適用する。
+            render_memoを指定した場合、marker、filling、ParameterFrameの全ての値が同じであれば、作成済みのコマンド群を返す。
+
+        """
+        if render_memo is None:
+            return self._make_config_source(marker=self.marker, commands_group=self._make_commands_group_batch(parameter_frame, common_parameter))
+
+        # markerはRule内で一意のため、ルールの識別子として用いる
+        key: Hashable = (self.marker, common_parameter.filling, tuple(parameter_frame.names), tuple(parameter_frame.get_rows()))
+
+        memoized: Optional[Tuple[Tuple[str, ...], ...]] = render_memo.get(key)
+
+        if memoized is None:
+            result: List[List[str]] = self._make_commands_group_batch(parameter_frame, common_parameter)
+            render_memo.put(key, result)
+        else:
+            # 保持しているコマンド群はデバイス間で共有するため、デバイスごとの配列に複製する
+            result = [list(commands) for commands in memoized]
+
+        return self._make_config_source(marker=self.marker, commands_group=result)
+
+    def _make_commands_group_batch(self, parameter_frame: ParameterFrame, common_parameter: CommonParameter) -> List[List[str]]:
+        rows: List[Tuple[str, ...]] = parameter_frame.get_rows(self.parameter_names)
+
+        # Validationは、make_config_sourceと同じく現状は適用しない(_apply_validation_all_parametersを参照)
+        # テンプレートごとに全ての行を埋め込んでから、行ごとのコマンド群に並べ替える
+        commands_group: List[List[str]] = [
+            list(commands) for commands in zip(*[[template.render(values) for values in rows] for template in self._command_templates])
+        ]
+
+        for command_condition, conditional_command_templates in zip(self.conditions, self._conditional_command_templates):
+
+            mask: List[bool] = command_condition.condition.evaluate_batch(parameter_frame)
+            for i, (is_satisfied, values) in enumerate(zip(mask, rows)):
+                if is_satisfied:
+                    commands_group[i] = command_condition.apply_action(command_condition.render_commands(templates=conditional_command_templates, values=values), commands_group[i])
+
+        # optionの適用
+        return self.options.assign_options(commands_group, common_parameter.filling)
+
+    @staticmethod
+    def _make_config_source(marker: str, commands_group: List[List[str]]) -> ConfigSource:
+        # markerはConverterRuleのバリデーションで検証済みのため、コマンド群が存在する場合はバリデーションを省略する
+        if commands_group:
+            return ConfigSource.construct(marker=marker, commands_group=commands_group)
+        return ConfigSource(marker=marker, commands_group=commands_group)
+
+    @staticmethod
+    def _compile_commands(parameter_names: List[str], commands: List[str], conditional_commands_list: List[List[str]]) -> Tuple[Tuple[CommandTemplate, ...], Tuple[Tuple[CommandTemplate, ...], ...]]:
+        return (
+            tuple(CommandTemplate(command, parameter_names) for command in commands),
+            tuple(tuple(CommandTemplate(command, parameter_names) for command in conditional_commands) for conditional_commands in conditional_commands_list)
+        )
 
     @staticmethod
-    def _get_params_inserted_commands(commands: List[str], parameter_group: ParameterGroup) -> List[str]:
-        return [command.format_map(parameter_group.to_dict()) for command in commands]
+    def _render_commands(templates: Tuple[CommandTemplate, ...], values: List[str]) -> List[str]:
+        return [template.render(values) for template in templates]
 
     @staticmethod
     def _apply_validation_all_parameters(validations: List[ParamsValidation], parameter_group: ParameterGroup) -> bool:
@@ -170,9 +265,45 @@ class Rule(BaseModel):
     common_parameter: CommonParameter
     converter_rules: Dict[str, ConverterRule]
 
+    _required_rows: Tuple[int, ...] = PrivateAttr(default=())
+    _required_columns: Tuple[str, ...] = PrivateAttr(default=())
+
     class Config:
         allow_mutation = False
 
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._required_rows, self._required_columns = self._get_required_cells(self.converter_rules)
+
+    @property
+    def required_rows(self) -> List[int]:
+        """required_rows
+
+        いずれかのConverterRuleが参照する行番号を昇順に並べた配列
+
+        """
+        return list(self._required_rows)
+
+    @property
+    def required_columns(self) -> List[str]:
+        """required_columns
+
+        いずれかのConverterRuleが参照する列番号(アルファベット)を列順に並べた配列
+
+        """
+        return list(self._required_columns)
+
+    @staticmethod
+    def _get_required_cells(converter_rules: Dict[str, ConverterRule]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        rows: Set[int] = set()
+        columns: Set[str] = set()
+
+        for converter_rule in converter_rules.values():
+            rows.update(converter_rule.data.parameter_range.rows)
+            columns.update(converter_rule.data.parameter_range.column_numbers)
+
+        return tuple(sorted(rows)), tuple(sorted(columns, key=lambda column: (len(column), column)))
+
     @validator("converter_rules")
     def _validate_no_duplicate_marker(cls, value: Dict[str, ConverterRule]):
         if len(set([i.marker for i in value.values()])) != len(value):
@@ -1,10 +1,18 @@
 from turtle import filling
-from typing import Dict, Any
+from typing import Dict, Any, List, ClassVar, Literal
+from pydantic import BaseModel
+import pickle
 import pytest
+import re
 from src.domain.config.config import ConfigSource
 
 from .rule import Action, ParameterLocationSource, CommandCondition, Options, ConverterRule, CommonParameter, Rule, IsEmptyCondition, IsContainedCondition
 from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
+from src.domain.parameter_locations.parameter_frame import ParameterFrame
+from .condition import Condition
+from .command_template import CommandTemplate
+from .render_memo import RenderMemo
+from .validator import RegexValidator
 from src.domain.parameter_locations.parameter_locations import ParameterColumnLocation
 
 
@@ -143,6 +151,23 @@ def test_is_empty_condition(test_input: Dict[str, Any], test_result: bool, test_
                 False,
                 None
         ),
+        # 3. invalid target_string
+        (
+                {
+                    "isContainedCondition": {
+                        "type": "isContained",
+                        "target_parameters": ["test1"],
+                        "target_string": "〇("
+                    },
+                    "parameters": ParameterGroup(
+                        parameters=[
+                            Parameter(name="test1", value="〇"),
+                        ]
+                    )
+                },
+                None,
+                ValueError("The target_string(〇() must be a valid regular expression: missing ), unterminated subpattern at position 1")
+        ),
     ]
 )
 def test_is_contained_condition(test_input: Dict[str, Any], test_result: bool, test_exception_result: Exception):
@@ -154,6 +179,115 @@ def test_is_contained_condition(test_input: Dict[str, Any], test_result: bool, t
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0.matched
+        (
+                {
+                    "regexValidator": {"validator_type": "RegexValidator", "parameter_name": "test1", "pattern": r"^\d+\.\d+$"},
+                    "parameters": ParameterGroup(parameters=[Parameter(name="test1", value="10.1")])
+                },
+                True,
+                None
+        ),
+        # 1.not matched
+        (
+                {
+                    "regexValidator": {"validator_type": "RegexValidator", "parameter_name": "test1", "pattern": r"^\d+\.\d+$"},
+                    "parameters": ParameterGroup(parameters=[Parameter(name="test1", value="10a1")])
+                },
+                False,
+                None
+        ),
+        # 2.invalid pattern
+        (
+                {
+                    "regexValidator": {"validator_type": "RegexValidator", "parameter_name": "test1", "pattern": "[0-9"},
+                    "parameters": ParameterGroup(parameters=[Parameter(name="test1", value="10")])
+                },
+                None,
+                ValueError("The pattern([0-9) must be a valid regular expression: unterminated character set at position 0")
+        ),
+    ]
+)
+def test_regex_validator(test_input: Dict[str, Any], test_result: bool, test_exception_result: Exception):
+    if not test_exception_result:
+        regex_validator = RegexValidator(**test_input["regexValidator"])
+        assert regex_validator.is_valid(test_input["parameters"]) == test_result
+        assert pickle.loads(pickle.dumps(regex_validator)).is_valid(test_input["parameters"]) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = RegexValidator(**test_input["regexValidator"]).is_valid(test_input["parameters"])
+        assert str(test_exception_result) in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0.correct(isEmpty)
+        (
+                {
+                    "condition": {"type": "isEmpty", "target_parameters": ["test1", "test2"]},
+                    "parameter_frame": ParameterFrame(
+                        names=["test1", "test2"],
+                        columns=[["", "〇", None, "〇"], [None, "", "〇", "〇"]]
+                    ),
+                },
+                [True, False, False, False],
+                None
+        ),
+        # 1.correct(isEmpty, parameter not in frame)
+        (
+                {
+                    "condition": {"type": "isEmpty", "target_parameters": ["test1", "test3"]},
+                    "parameter_frame": ParameterFrame(names=["test1"], columns=[["", "〇"]]),
+                },
+                [True, False],
+                None
+        ),
+        # 2.correct(isEmpty, no parameters in frame)
+        (
+                {
+                    "condition": {"type": "isEmpty", "target_parameters": ["test3"]},
+                    "parameter_frame": ParameterFrame(names=["test1"], columns=[["", "〇"]]),
+                },
+                [True, True],
+                None
+        ),
+        # 3.correct(isContained)
+        (
+                {
+                    "condition": {"type": "isContained", "target_parameters": ["test1", "test2"], "target_string": "〇"},
+                    "parameter_frame": ParameterFrame(
+                        names=["test1", "test2"],
+                        columns=[["〇", "〇", "×", "×"], ["〇", "×", None, "〇"]]
+                    ),
+                },
+                [True, False, False, False],
+                None
+        ),
+        # 4.correct(isContained, parameter not in frame)
+        (
+                {
+                    "condition": {"type": "isContained", "target_parameters": ["test1", "test3"], "target_string": "〇"},
+                    "parameter_frame": ParameterFrame(names=["test1"], columns=[["〇", "×"]]),
+                },
+                [False, False],
+                None
+        ),
+    ]
+)
+def test_condition_evaluate_batch(test_input: Dict[str, Any], test_result: List[bool], test_exception_result: Exception):
+    condition = CommandCondition(condition=test_input["condition"], action="Add", commands=["command"]).condition
+    if not test_exception_result:
+        assert condition.evaluate_batch(test_input["parameter_frame"]) == test_result
+        # 行ごとに評価した場合と同じ結果となること
+        assert Condition.evaluate_batch(condition, test_input["parameter_frame"]) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = condition.evaluate_batch(test_input["parameter_frame"])
+        assert str(test_exception_result) in str(e.value)
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # 0. correct
@@ -200,7 +334,7 @@ def test_is_contained_condition(test_input: Dict[str, Any], test_result: bool, t
                     "commands": ["Command"],
                 },
                 None,
-                ValueError("unexpected value; permitted: 'Delete', 'Add' (type=value_error.const; given=Multiply; permitted=('Delete', 'Add'))")
+                ValueError("unexpected value; permitted: 'Delete', 'DeleteRegex', 'Add' (type=value_error.const; given=Multiply; permitted=('Delete', 'DeleteRegex', 'Add'))")
         ),
         # 3. empty commands
         (
@@ -226,6 +360,80 @@ def test_command_condition(test_input: Dict[str, str], test_result: CommandCondi
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "condition": {
+                        "type": "isPrefixed",
+                        "target_parameters": ["Example"],
+                        "prefix": "Gi"
+                    },
+                    "action": "Replace",
+                    "commands": ["Command2"],
+                    "conditional_commands": ["Command2"],
+                    "applicable_commands": ["Command1"],
+                    "parameters": ParameterGroup(parameters=[Parameter(name="Example", value="Gi0/1")]),
+                },
+                ["Command2"],
+                None
+        ),
+        # 1. unknown condition type
+        (
+                {
+                    "condition": {
+                        "type": "isUnknown",
+                        "target_parameters": ["Example"],
+                    },
+                    "action": "Replace",
+                    "commands": ["Command2"],
+                },
+                None,
+                ValueError("No match for discriminator 'type' and value 'isUnknown' (allowed values: 'isEmpty', 'isContained', 'isPrefixed')")
+        ),
+    ]
+)
+def test_command_condition_registry(test_input: Dict[str, Any], test_result: List[str], test_exception_result: Exception, monkeypatch):
+    # テストで追加したActionとConditionを、テスト終了時にレジストリから削除する
+    monkeypatch.setattr(Action, "registry", dict(Action.registry))
+    monkeypatch.setattr(Condition, "registry", dict(Condition.registry))
+
+    class Replace(Action):
+        action_type = "Replace"
+
+        def do(self, conditional_commands: List[str], applicable_commands: List[str]) -> List[str]:
+            return list(conditional_commands)
+
+    class IsPrefixedCondition(Condition, BaseModel):
+        condition_type: ClassVar[str] = "isPrefixed"
+
+        type: Literal["isPrefixed"]
+        target_parameters: List[str]
+        prefix: str
+
+        def evaluate(self, parameter_group: ParameterGroup) -> bool:
+            return all([parameter_group.get(i).value.startswith(self.prefix) for i in self.target_parameters])
+
+    command_condition_input = {key: test_input[key] for key in ("condition", "action", "commands")}
+
+    if test_result:
+        command_condition = CommandCondition(**command_condition_input)
+        assert isinstance(command_condition.condition, IsPrefixedCondition)
+        assert command_condition.apply_command_condition(
+            test_input["parameters"],
+            test_input["conditional_commands"],
+            test_input["applicable_commands"]
+        ) == test_result
+        # Actionはルールの読み込み時に作成したものを使い回すこと
+        monkeypatch.setattr(Action, "build", classmethod(lambda cls, action: pytest.fail("Action.build must not be called after loading")))
+        assert command_condition.apply_action(test_input["conditional_commands"], test_input["applicable_commands"]) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = CommandCondition(**command_condition_input)
+        assert str(test_exception_result) in str(e.value)
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # 0. correct(isEmpty)
@@ -353,14 +561,12 @@ def test_apply_command_condition(test_input: Dict[str, Any], test_result: Parame
 def test_delete_do(test_input: Dict[str, Any], test_result: ParameterLocationSource, test_exception_result: Exception):
     if test_result:
         assert Action.build("Delete").do(
-            test_input["command_condition"],
             test_input["conditional_commands"],
             test_input["applicable_commands"]
         ) == test_result
     else:
         with pytest.raises(Exception) as e:
             _ = Action.build("Delete").do(
-                test_input["command_condition"],
                 test_input["conditional_commands"],
                 test_input["applicable_commands"]
             )
@@ -391,20 +597,107 @@ def test_delete_do(test_input: Dict[str, Any], test_result: ParameterLocationSou
 def test_add_do(test_input: Dict[str, Any], test_result: ParameterLocationSource, test_exception_result: Exception):
     if test_result:
         assert Action.build("Add").do(
-            test_input["command_condition"],
             test_input["conditional_commands"],
             test_input["applicable_commands"]
         ) == test_result
     else:
         with pytest.raises(Exception) as e:
             _ = Action.build("Add").do(
-                test_input["command_condition"],
                 test_input["conditional_commands"],
                 test_input["applicable_commands"]
             )
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(Delete only deletes exactly matched commands)
+        (
+                {
+                    "action": "Delete",
+                    "conditional_commands": ["ip route 10.0.0.0/8 192.168.1.1", "shutdown"],
+                    "applicable_commands": ["ip route 10.0.0.0/8 192.168.1.1", "ip route 10.0.0.0/8 192.168.101", "no shutdown", "shutdown"],
+                },
+                ["ip route 10.0.0.0/8 192.168.101", "no shutdown"],
+                None
+        ),
+        # 1. correct(Delete treats special characters literally)
+        (
+                {
+                    "action": "Delete",
+                    "conditional_commands": ["description (uplink)"],
+                    "applicable_commands": ["description (uplink)", "description uplink"],
+                },
+                ["description uplink"],
+                None
+        ),
+        # 2. correct(DeleteRegex deletes commands which fully match one of the patterns)
+        (
+                {
+                    "action": "DeleteRegex",
+                    "conditional_commands": [r"ip route 10\..*", "shut.*"],
+                    "applicable_commands": ["ip route 10.0.0.0/8 192.168.1.1", "ip route 172.16.0.0/12 192.168.1.1", "no shutdown", "shutdown"],
+                },
+                ["ip route 172.16.0.0/12 192.168.1.1", "no shutdown"],
+                None
+        ),
+        # 3. invalid pattern
+        (
+                {
+                    "action": "DeleteRegex",
+                    "conditional_commands": ["ip route ("],
+                    "applicable_commands": ["ip route 10.0.0.0/8 192.168.1.1"],
+                },
+                None,
+                re.error("missing ), unterminated subpattern")
+        ),
+    ]
+)
+def test_delete_actions_do(test_input: Dict[str, Any], test_result: List[str], test_exception_result: Exception):
+    if test_result:
+        assert Action.build(test_input["action"]).do(test_input["conditional_commands"], test_input["applicable_commands"]) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = Action.build(test_input["action"]).do(test_input["conditional_commands"], test_input["applicable_commands"])
+        assert str(test_exception_result) in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(Delete embeds parameter values as they are)
+        (
+                {"action": "Delete", "commands": ["ip route {Prefix} .*"], "values": ["10.0.0.0/8"]},
+                {"commands": ["ip route 10.0.0.0/8 .*"], "deleted_commands": []},
+                None
+        ),
+        # 1. correct(DeleteRegex escapes parameter values and keeps the literal text of the commands as a pattern)
+        (
+                {"action": "DeleteRegex", "commands": ["ip route {Prefix} .*"], "values": ["10.0.0.0/8"]},
+                {"commands": [r"ip route 10\.0\.0\.0/8 .*"], "deleted_commands": ["ip route 10.0.0.0/8 192.168.1.1"]},
+                None
+        ),
+        # 2. correct(DeleteRegex doesn't treat special characters in parameter values as a pattern)
+        (
+                {"action": "DeleteRegex", "commands": ["description {Prefix}"], "values": ["(uplink|downlink)"]},
+                {"commands": [r"description \(uplink\|downlink\)"], "deleted_commands": ["description (uplink|downlink)"]},
+                None
+        ),
+    ]
+)
+def test_command_condition_render_commands(test_input: Dict[str, Any], test_result: Dict[str, List[str]], test_exception_result: Exception):
+    command_condition = CommandCondition(
+        condition={"type": "isEmpty", "target_parameters": ["Prefix"]},
+        action=test_input["action"],
+        commands=test_input["commands"]
+    )
+    applicable_commands = ["ip route 10.0.0.0/8 192.168.1.1", "ip route 10a0b0c0/8 192.168.1.1", "description (uplink|downlink)", "description uplink"]
+
+    commands = command_condition.render_commands(tuple(CommandTemplate(command, ["Prefix"]) for command in test_input["commands"]), test_input["values"])
+
+    assert commands == test_result["commands"]
+    assert [ac for ac in applicable_commands if ac not in command_condition.apply_action(commands, applicable_commands)] == test_result["deleted_commands"]
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # 0.correct
@@ -499,11 +792,73 @@ def test_options(test_input: Dict[str, str], test_result: Options, test_exceptio
                 ],
                 None
         ),
+        # 1.correct(indent removes existing filling)
+        (
+                {
+                    "options": {
+                        "indent_level": 1,
+                        "filling_each_commands": False,
+                        "filling_each_commands_group": False
+                    },
+                    "commands_group": [
+                        ["command1", "!", "command2"]
+                    ],
+                    "filling": "!"
+                },
+                [
+                    [" command1", " command2"]
+                ],
+                None
+        ),
+        # 2.correct(no indent keeps existing filling and empty commands get no filling)
+        (
+                {
+                    "options": {
+                        "indent_level": 0,
+                        "filling_each_commands": True,
+                        "filling_each_commands_group": True
+                    },
+                    "commands_group": [
+                        ["command1", "!"],
+                        [],
+                        ["command2"]
+                    ],
+                    "filling": "!"
+                },
+                [
+                    ["command1", "!", "!", "!"],
+                    [],
+                    ["command2", "!"]
+                ],
+                None
+        ),
+        # 3.correct(commands which become empty after removing filling)
+        (
+                {
+                    "options": {
+                        "indent_level": 2,
+                        "filling_each_commands": True,
+                        "filling_each_commands_group": True
+                    },
+                    "commands_group": [
+                        ["!", "!"]
+                    ],
+                    "filling": "!"
+                },
+                [
+                    []
+                ],
+                None
+        ),
     ]
 )
 def test_options_assign_options(test_input: Dict[str, str], test_result: Options, test_exception_result: Exception):
     if test_result:
-        assert Options(**test_input["options"]).assign_options(test_input["commands_group"], test_input["filling"]) == test_result
+        commands_group = [list(commands) for commands in test_input["commands_group"]]
+        assert Options(**test_input["options"]).assign_options(commands_group, test_input["filling"]) == test_result
+        # 入力のコマンド群は変更されないこと
+        assert commands_group == test_input["commands_group"]
+        assert [list(Options(**test_input["options"]).iter_options(commands, test_input["filling"])) for commands in commands_group] == test_result
     else:
         with pytest.raises(Exception) as e:
             _ = Options(**test_input["options"]).assign_options(test_input["commands_group"], test_input["filling"])
@@ -558,6 +913,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -585,6 +941,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     row_to=10
                 ),
                 commands=["command1"],
+                validations=[],
                 conditions=[CommandCondition(
                     condition=IsEmptyCondition(
                         type="isEmpty",
@@ -616,6 +973,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -650,6 +1008,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -684,6 +1043,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -701,7 +1061,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     },
             },
             None,
-            ValueError('string does not match regex "[A-Z]+" (type=value_error.str.regex; pattern=[A-Z]+)')
+            ValueError('string does not match regex "^[A-Z]+$" (type=value_error.str.regex; pattern=^[A-Z]+$)')
         ),
         # 4. invalid parameter_column_locations.row_from
         (
@@ -718,6 +1078,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -735,7 +1096,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     },
             },
             None,
-            ValueError("'row_from' property of the ParameterSaveLocationSource must not be empty and must be greater than 1 (type=value_error)")
+            ValueError("data -> row_from\n  ensure this value is greater than or equal to 1 (type=value_error.number.not_ge; limit_value=1)")
         ),
         # 5. invalid parameter_column_locations.row_to
         (
@@ -752,6 +1113,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1",
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -784,6 +1146,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                         "row_to": 5,
                     },
                     "commands": [],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -818,6 +1181,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1"
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -852,6 +1216,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1"
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -886,6 +1251,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1"
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -903,7 +1269,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     },
             },
             None,
-            ValueError("'Delete', 'Add' (type=value_error.const; given=Assume; permitted=('Delete', 'Add'))")
+            ValueError("'Delete', 'DeleteRegex', 'Add' (type=value_error.const; given=Assume; permitted=('Delete', 'DeleteRegex', 'Add'))")
         ),
         # 10. invalid condition commands
         (
@@ -920,6 +1286,7 @@ def test_common_parameter(test_input: Dict[str, str], test_result: CommonParamet
                     "commands": [
                         "command1"
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -969,6 +1336,7 @@ def test_converter_rule(test_input: Dict[str, str], test_result: ConverterRule,
                         "command1",
                         "command2"
                     ],
+                    "validations": [],
                     "conditions": [
                         {           
                             "condition": {
@@ -1006,6 +1374,54 @@ def test_converter_rule(test_input: Dict[str, str], test_result: ConverterRule,
             ),
             None, 
         ),
+        # 1. correct(unreferenced parameter doesn't exist in the parameter_group)
+        (
+            {
+                "converter_rule": {
+                    "marker": "%%example_marker%%",
+                    "data": {
+                        "parameter_column_locations": [
+                            {"name": "A", "column_number": "A"},
+                            {"name": "B", "column_number": "B"}
+                        ],
+                        "row_from": 5,
+                        "row_to": 5,
+                    },
+                    "commands": ["x {A}"],
+                    "validations": [],
+                    "conditions": [],
+                    "options": {},
+                },
+                "parameter_group_list": [ParameterGroup(parameters=[Parameter(name="A", value="1")])],
+                "common_parameter": CommonParameter(filling="!")
+            },
+            ConfigSource(marker="%%example_marker%%", commands_group=[["x 1"]]),
+            None,
+        ),
+        # 2. referenced parameter doesn't exist in the parameter_group
+        (
+            {
+                "converter_rule": {
+                    "marker": "%%example_marker%%",
+                    "data": {
+                        "parameter_column_locations": [
+                            {"name": "A", "column_number": "A"},
+                            {"name": "B", "column_number": "B"}
+                        ],
+                        "row_from": 5,
+                        "row_to": 5,
+                    },
+                    "commands": ["x {A} {B}"],
+                    "validations": [],
+                    "conditions": [],
+                    "options": {},
+                },
+                "parameter_group_list": [ParameterGroup(parameters=[Parameter(name="A", value="1")])],
+                "common_parameter": CommonParameter(filling="!")
+            },
+            None,
+            KeyError("B"),
+        ),
     ]
 )
 def test_converter_rule_make_config_source(test_input: Dict[str, str], test_result: ConverterRule, test_exception_result: Exception):
@@ -1017,6 +1433,93 @@ def test_converter_rule_make_config_source(test_input: Dict[str, str], test_resu
         assert str(test_exception_result) in str(e.value)
 
 
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+            {
+                "converter_rule":  {
+                    "description": "example",
+                    "marker": "%%example_marker%%",
+                    "data": {
+                        "parameter_column_locations": [
+                            {"name": "Example1", "column_number": "A"},
+                            {"name": "Example2", "column_number": "B"}
+                        ],
+                        "row_from": 1,
+                        "row_to": 3,
+                    },
+                    "commands": [
+                        "command1 {Example1}",
+                        "command2 {Example2}"
+                    ],
+                    "validations": [],
+                    "conditions": [
+                        {
+                            "condition": {
+                                "type": 'isEmpty',
+                                "target_parameters": ["Example1"]
+                            },
+                            "action": "Delete",
+                            "commands": ["command1 {Example1}"],
+                        },
+                        {
+                            "condition": {
+                                "type": 'isContained',
+                                "target_parameters": ["Example2"],
+                                "target_string": "example"
+                            },
+                            "action": "Add",
+                            "commands": ["command3 {Example2}"],
+                        },
+                    ],
+                    "options": {
+                        "indent_level": 1,
+                        "filling_each_commands": True,
+                        "filling_each_commands_group": True
+                    },
+                },
+                "parameter_frame": ParameterFrame(
+                    names=["Example1", "Example2"],
+                    columns=[["", "value1", None], ["example1", "value2", "example3"]]
+                ),
+                "common_parameter": CommonParameter(filling="!")
+            },
+            ConfigSource(
+                marker="%%example_marker%%",
+                commands_group=[
+                    [" command2 example1", "!", " command3 example1", "!"],
+                    [" command1 value1", "!", " command2 value2", "!"],
+                    [" command2 example3", "!", " command3 example3", "!"],
+                ]
+            ),
+            None,
+        ),
+    ]
+)
+def test_converter_rule_make_config_source_batch(test_input: Dict[str, Any], test_result: ConfigSource, test_exception_result: Exception):
+    converter_rule = ConverterRule(**test_input["converter_rule"])
+    if test_result:
+        assert converter_rule.make_config_source_batch(test_input["parameter_frame"], test_input["common_parameter"]) == test_result
+        # 行ごとに作成した場合と同じ結果となること
+        assert converter_rule.make_config_source(test_input["parameter_frame"].get_parameter_groups(), test_input["common_parameter"]) == test_result
+        # 同じ値の場合は作成済みのコマンド群を再利用し、fillingが異なる場合は再度作成すること
+        render_memo = RenderMemo()
+        for _ in range(2):
+            config_source = converter_rule.make_config_source_batch(test_input["parameter_frame"], test_input["common_parameter"], render_memo)
+            assert config_source == test_result
+            # 返したコマンド群を変更しても、保持しているコマンド群は変更されないこと
+            for commands in config_source.commands_group:
+                commands.append("changed")
+        assert (render_memo.hits, render_memo.misses) == (1, 1)
+        _ = converter_rule.make_config_source_batch(test_input["parameter_frame"], CommonParameter(filling="#"), render_memo)
+        assert (render_memo.hits, render_memo.misses) == (1, 2)
+    else:
+        with pytest.raises(Exception) as e:
+            _ = converter_rule.make_config_source_batch(test_input["parameter_frame"], test_input["common_parameter"])
+        assert str(test_exception_result) in str(e.value)
+
+
 @pytest.mark.parametrize(
     "test_input,test_result,test_exception_result", [
         # 0. correct
@@ -1039,6 +1542,7 @@ def test_converter_rule_make_config_source(test_input: Dict[str, str], test_resu
                             "commands": [
                                 "command1",
                             ],
+                            "validations": [],
                             "conditions": [
                                 {           
                                     "condition": {
@@ -1072,6 +1576,7 @@ def test_converter_rule_make_config_source(test_input: Dict[str, str], test_resu
                             row_to=10
                         ),
                         commands=["command1"],
+                        validations=[],
                         conditions=[CommandCondition(
                             condition=IsEmptyCondition(
                                 type="isEmpty",
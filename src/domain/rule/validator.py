@@ -1,5 +1,5 @@
 from typing import List, Literal, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from src.utils.logger import get_custom_logger
 from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
 
@@ -20,10 +20,25 @@ class RegexValidator(CustomValidator, BaseModel):
     parameter_name: str = Field(..., min_length=1)
     pattern: str = Field(..., min_length=1)
 
+    _compiled_pattern: re.Pattern = PrivateAttr(default=None)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        # patternはルールの読み込み時に1度だけコンパイルする
+        self._compiled_pattern = re.compile(self.pattern)
+
+    @validator("pattern")
+    def _validate_pattern(cls, value: str) -> str:
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise ValueError(f"The pattern({value}) must be a valid regular expression: {e}")
+        return value
+
     def is_valid(self, parameter_group: ParameterGroup) -> bool:
         parameter =  parameter_group.get(self.parameter_name)
         if parameter:
-            return True if re.search(self.pattern, parameter.value) else False
+            return True if self._compiled_pattern.search(parameter.value) else False
         else:
             return False
 
@@ -0,0 +1,121 @@
+from typing import Any, List, Optional, Tuple
+from src.utils.logger import get_custom_logger
+from src.domain.cache.cache_repository import CacheRepository
+import hashlib
+import os
+import pickle
+import sys
+import zlib
+
+
+logger = get_custom_logger(__name__)
+
+
+class CacheFileImpl(CacheRepository):
+    """CacheFileImpl
+
+    本クラスは、キャッシュを1キーにつき1ファイルとしてディレクトリに格納する具象クラスである
+
+    Attributes:
+        cache_dir (str): キャッシュを格納するディレクトリ
+        max_size (int): キャッシュの合計サイズの上限(バイト)
+
+    Note:
+        値はpickleで直列化した後にzlibで圧縮し、ヘッダーとしてフォーマットのバージョンとキーを付与して格納する。
+        フォーマットのバージョンはPythonのバージョンとpickleのプロトコルから、値の型の形式はキーに含めた型の定義のハッシュ値から決まる。
+        ヘッダーが一致しないファイルは古い形式またはハッシュの衝突とみなし、キャッシュが存在しないものとして扱う。
+        読み込み中に発生した全ての例外(型の定義の変更による復元の失敗を含む)は、キャッシュが存在しないものとして扱う。
+        pickleは復元時に任意のコードを実行できるため、キャッシュのディレクトリは実行するユーザーのみが書き込める場所とすること。
+        キャッシュを取得する度にファイルの更新日時を更新し、prune時に更新日時が古いものから削除する(LRU)。
+
+    """
+
+    format_version: bytes = f"netdev-configconv-cache-py{sys.version_info.major}.{sys.version_info.minor}-p{pickle.HIGHEST_PROTOCOL}".encode("utf-8")
+    file_extension: str = ".cache"
+
+    def __init__(self, cache_dir: str, max_size: int = 512 * 1024 * 1024) -> None:
+        super(CacheFileImpl, self).__init__(cache_dir, max_size)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+
+    def load(self, key: str) -> Optional[Any]:
+        cache_file: str = self._get_cache_file(key)
+
+        try:
+            with open(cache_file, "rb") as f:
+                header: bytes = f.readline()
+                body: bytes = f.read()
+
+            if header != self._get_header(key):
+
+                logger.debug(f"The cache({cache_file}) of the key({key}) is stale")
+
+                return None
+
+            result: Any = pickle.loads(zlib.decompress(body))
+
+            os.utime(cache_file)
+
+        except FileNotFoundError:
+
+            logger.debug(f"The cache of the key({key}) doesn't exist")
+
+            return None
+
+        except Exception as e:
+
+            logger.warning(f"The cache({cache_file}) of the key({key}) is broken and will be ignored: {e}")
+
+            return None
+
+        logger.debug(f"Loading the cache({cache_file}) of the key({key}) has been completed")
+
+        return result
+
+
+    def save(self, key: str, value: Any) -> None:
+        cache_file: str = self._get_cache_file(key)
+        temporary_file: str = f"{cache_file}.{os.getpid()}.tmp"
+
+        with open(temporary_file, "wb") as f:
+            f.write(self._get_header(key))
+            f.write(zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)))
+
+        # 他のプロセスが読み込み中でも壊れたファイルが見えないように、書き込み後に置き換える
+        os.replace(temporary_file, cache_file)
+
+        logger.debug(f"Saving the cache({cache_file}) of the key({key}) has been completed")
+
+
+    def prune(self) -> None:
+        cache_files: List[Tuple[float, int, str]] = []
+
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(self.file_extension):
+                    stat = entry.stat()
+                    cache_files.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size: int = sum(size for _, size, _ in cache_files)
+
+        for _, size, cache_file in sorted(cache_files):
+
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(cache_file)
+            except FileNotFoundError:
+                pass
+
+            total_size -= size
+
+            logger.debug(f"The cache({cache_file}) has been evicted")
+
+
+    def _get_cache_file(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + self.file_extension)
+
+
+    def _get_header(self, key: str) -> bytes:
+        return self.format_version + b" " + key.encode("utf-8").replace(b"\n", b" ") + b"\n"
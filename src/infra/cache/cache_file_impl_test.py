@@ -0,0 +1,127 @@
+from typing import Dict, Any, List
+import pytest
+import os
+import types
+import time
+import zlib
+
+from .cache_file_impl import CacheFileImpl
+from src.domain.parameter_locations.parameter_cell_matrix import ParameterCellMatrix
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {"save": {"key1": ["sheet1", "sheet2"]}, "key": "key1"},
+                ["sheet1", "sheet2"],
+                None
+        ),
+        # 1. correct(overwrite)
+        (
+                {"save": {"key1": ["sheet1"], "key2": ["sheet2"]}, "key": "key2"},
+                ["sheet2"],
+                None
+        ),
+        # 2. unexisted key
+        (
+                {"save": {"key1": ["sheet1"]}, "key": "key2"},
+                None,
+                None
+        ),
+    ]
+)
+def test_load(tmp_path, test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    cache_file_impl = CacheFileImpl(str(tmp_path / "cache"))
+    for key, value in test_input["save"].items():
+        cache_file_impl.save(key, value)
+    assert cache_file_impl.load(test_input["key"]) == test_result
+
+
+def test_load_parameter_cell_matrix(tmp_path):
+    cache_file_impl = CacheFileImpl(str(tmp_path))
+    cache_file_impl.save("key", ParameterCellMatrix(rows=[1, 3], columns=["A", "AB"], values=["a", 1, None, 2.5]))
+    parameter_cell_matrix = cache_file_impl.load("key")
+    assert (parameter_cell_matrix.rows, parameter_cell_matrix.columns, parameter_cell_matrix.values) == ([1, 3], ["A", "AB"], ["a", 1, None, 2.5])
+    assert parameter_cell_matrix.get(3, "AB") == 2.5
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. stale format version
+        (
+                {"format_version": b"netdev-configconv-cache-v0"},
+                None,
+                None
+        ),
+        # 1. broken body
+        (
+                {"body": b"broken"},
+                None,
+                None
+        ),
+        # 2. body refers to a class which no longer exists
+        (
+                {"body": zlib.compress(b"cnot_existing_module\nParameterCellMatrix\n.")},
+                None,
+                None
+        ),
+    ]
+)
+def test_load_invalid_cache(tmp_path, test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    cache_file_impl = CacheFileImpl(str(tmp_path))
+    cache_file_impl.save("key", "value")
+    cache_file = cache_file_impl._get_cache_file("key")
+    with open(cache_file, "rb") as f:
+        header = f.readline()
+        body = f.read()
+    with open(cache_file, "wb") as f:
+        f.write(header.replace(CacheFileImpl.format_version, test_input.get("format_version", CacheFileImpl.format_version)))
+        f.write(test_input.get("body", body))
+    assert cache_file_impl.load("key") == test_result
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. evict least recently used
+        (
+                {"max_size": 2, "save": ["key1", "key2", "key3"], "load": ["key1"]},
+                ["key1", "key3"],
+                None
+        ),
+        # 1. no eviction
+        (
+                {"max_size": 3, "save": ["key1", "key2", "key3"], "load": []},
+                ["key1", "key2", "key3"],
+                None
+        ),
+    ]
+)
+def test_prune(tmp_path, test_input: Dict[str, Any], test_result: List[str], test_exception_result: Exception):
+    cache_file_impl = CacheFileImpl(str(tmp_path))
+    for i, key in enumerate(test_input["save"]):
+        cache_file_impl.save(key, "x" * 100)
+        os.utime(cache_file_impl._get_cache_file(key), (time.time() - 100 + i, time.time() - 100 + i))
+    for key in test_input["load"]:
+        cache_file_impl.load(key)
+    cache_file_impl.max_size = os.path.getsize(cache_file_impl._get_cache_file("key1")) * test_input["max_size"]
+    cache_file_impl.prune()
+    assert [key for key in test_input["save"] if cache_file_impl.load(key) is not None] == test_result
+
+
+def test_hash_sources(tmp_path, monkeypatch):
+    module = types.ModuleType("cached_type")
+    module.__file__ = str(tmp_path / "cached_type.py")
+    with open(module.__file__, "w", encoding="utf-8") as f:
+        f.write("class CachedType:\n    pass\n")
+    hash_before = CacheFileImpl.hash_sources(module)
+
+    changed_module = types.ModuleType("cached_type")
+    changed_module.__file__ = str(tmp_path / "changed_cached_type.py")
+    with open(changed_module.__file__, "w", encoding="utf-8") as f:
+        f.write("class CachedType:\n    value: int = 0\n")
+
+    # 型の定義が変わった場合はハッシュ値が変わり、ソースファイルが存在しない場合は実行ファイルから計算する
+    assert hash_before == CacheFileImpl.hash_sources(module)
+    assert hash_before != CacheFileImpl.hash_sources(changed_module)
+    assert CacheFileImpl.hash_sources(types.ModuleType("frozen")) == CacheFileImpl.hash_sources(types.ModuleType("frozen2"))
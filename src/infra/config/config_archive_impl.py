@@ -0,0 +1,191 @@
+from typing import Any, Dict, List, Optional, Union
+from src.utils.logger import get_custom_logger
+from src.domain.config.config import Config
+from .config_txt_impl import ConfigTxtImpl
+from .config_txt_impl_exception import ArchiveFormatNotSupportedError
+import hashlib
+import io
+import json
+import os
+import tarfile
+import time
+import zipfile
+
+
+logger = get_custom_logger(__name__)
+
+
+class ConfigArchiveImpl(ConfigTxtImpl):
+    """ConfigArchiveImpl
+
+    本クラスは、ConfigSampleFileとConfigを用いて、全てのコンフィグを1つのアーカイブ(tar/zip)に出力するための具象クラスである
+
+    Attributes:
+        config_sample_file str: ConfigSampleFileが存在するファイルパス
+        archive_file (str): 出力するアーカイブのファイルパス
+        archive_format (str): アーカイブの形式(tar、tar.gz、tar.bz2、tar.xz、zip)
+        manifest (List[Dict[str, Any]]): アーカイブに追加したコンフィグのデバイス名、エントリ名、サイズ、SHA-256の配列
+
+    Note:
+        コンフィグは書き込みのたびにアーカイブのエントリとして追加し、全てのコンフィグをメモリに保持しない。
+        エントリ名は、アーカイブのディレクトリからの出力先の相対パスとする。
+        closeを呼び出すと、manifest.jsonをアーカイブに追加してアーカイブを閉じる。
+        エラーによりabortを呼び出した場合は、manifest.jsonを追加せずにアーカイブを閉じる。
+        複数のプロセスから同時に書き込めないため、並列処理では親プロセスで書き込む。
+
+    """
+
+    concurrent_writable: bool = False
+
+    TAR_MODES: Dict[str, str] = {
+        "tar": "w",
+        "tar.gz": "w:gz",
+        "tar.bz2": "w:bz2",
+        "tar.xz": "w:xz",
+    }
+
+    ARCHIVE_FORMATS: List[str] = [*TAR_MODES, "zip"]
+
+    def __init__(self, config_sample_file: str, archive_file: str, archive_format: str) -> None:
+
+        logger.debug(f"Intializing ConfigArchiveImpl(config_sample_file={config_sample_file}, archive_file={archive_file}, archive_format={archive_format})...")
+
+        super(ConfigArchiveImpl, self).__init__(config_sample_file)
+
+        if archive_format not in self.ARCHIVE_FORMATS:
+
+            raise ArchiveFormatNotSupportedError({"archive_format": archive_format, "archive_formats": self.ARCHIVE_FORMATS})
+
+        self.archive_file: str = archive_file
+        self.archive_format: str = archive_format
+        self.manifest: List[Dict[str, Any]] = []
+
+        self._archive: Optional[Union[tarfile.TarFile, zipfile.ZipFile]] = None
+
+
+    def write(self, config: Config, output_config_file: str, device_name: Optional[str] = None) -> None:
+        """write
+
+        ConfigSampleFileとConfigインスタンスから作成したコンフィグを、アーカイブのエントリとして追加する関数
+
+        Args:
+            config (:obj:`Config`): コンフィグに記載すべき内容を含んだオブジェクト
+            output_config_file (str): 出力先のファイルパス、アーカイブのエントリ名に用いる
+            device_name (Optional[str]): コンフィグのデバイス名、マニフェストに記録する
+
+        """
+        self.write_content(self.render(config), output_config_file, device_name)
+
+
+    def write_content(self, content: bytes, output_config_file: str, device_name: Optional[str] = None) -> None:
+        """write_content
+
+        renderで作成したコンフィグの内容を、アーカイブのエントリとして追加する関数
+
+        Args:
+            content (bytes): コンフィグファイルの内容
+            output_config_file (str): 出力先のファイルパス、アーカイブのエントリ名に用いる
+            device_name (Optional[str]): コンフィグのデバイス名、マニフェストに記録する
+
+        """
+        arcname: str = os.path.relpath(output_config_file, os.path.dirname(self.archive_file) or ".").replace(os.sep, "/")
+
+        logger.debug(f"Writing a config_file({arcname}) in the archive({self.archive_file})...")
+
+        self._add_entry(arcname, content)
+
+        self.manifest.append(
+            {
+                "device": device_name,
+                "file": arcname,
+                "size": len(content),
+                "sha256": hashlib.sha256(content).hexdigest(),
+            }
+        )
+
+        logger.debug(f"Writing a config_file({arcname}) in the archive({self.archive_file}) has been finished successfully")
+
+
+    def exists(self, output_config_file: str) -> bool:
+        # 以前のアーカイブのエントリは再利用できないため、常に全てのコンフィグを出力する
+        return False
+
+
+    def read_manifest(self, output_path: str) -> Dict[str, str]:
+        return {}
+
+
+    def write_manifest(self, output_path: str, fingerprints: Dict[str, str]) -> None:
+        pass
+
+
+    def make_output_dir(self, output_path: str) -> None:
+        # エントリ名にディレクトリを含めるため、出力先ディレクトリは作成しない
+        pass
+
+
+    def close(self) -> None:
+        """close
+
+        マニフェストをアーカイブに追加し、アーカイブを閉じる関数
+
+        """
+        if self._archive is None and not self.manifest:
+            return
+
+        self._add_entry(self.MANIFEST_FILE, json.dumps(self.manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+
+        self._archive.close()
+        self._archive = None
+
+        logger.info(f"Writing {len(self.manifest)} configs in the archive({self.archive_file}) has been completed")
+
+
+    def abort(self) -> None:
+        """abort
+
+        マニフェストを追加せずにアーカイブを閉じる関数
+
+        Note:
+            manifest.jsonを含まないアーカイブは、全てのコンフィグを出力できなかったことを示す。
+
+        """
+        if self._archive is None:
+            return
+
+        self._archive.close()
+        self._archive = None
+
+        logger.warning(f"Closing the archive({self.archive_file}) without manifest.json because creating configs has failed after {len(self.manifest)} configs")
+
+
+    def _open_archive(self) -> Union[tarfile.TarFile, zipfile.ZipFile]:
+        if self._archive is None:
+
+            archive_dir: str = os.path.dirname(self.archive_file)
+
+            if archive_dir:
+                os.makedirs(archive_dir, exist_ok=True)
+
+            if self.archive_format == "zip":
+                self._archive = zipfile.ZipFile(self.archive_file, "w", compression=zipfile.ZIP_DEFLATED)
+            else:
+                self._archive = tarfile.open(self.archive_file, self.TAR_MODES[self.archive_format])
+
+        return self._archive
+
+
+    def _add_entry(self, arcname: str, content: bytes) -> None:
+        archive = self._open_archive()
+
+        if isinstance(archive, zipfile.ZipFile):
+
+            archive.writestr(arcname, content)
+
+        else:
+
+            tar_info = tarfile.TarInfo(name=arcname)
+            tar_info.size = len(content)
+            tar_info.mtime = int(time.time())
+
+            archive.addfile(tar_info, io.BytesIO(content))
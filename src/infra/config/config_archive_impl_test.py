@@ -0,0 +1,70 @@
+from typing import Any, Dict
+import hashlib
+import json
+import pytest
+import tarfile
+import zipfile
+
+from .config_archive_impl import ConfigArchiveImpl
+from .config_txt_impl_exception import ArchiveFormatNotSupportedError
+from src.domain.config.config import Config, ConfigSource
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(tar)
+        (
+                {"archive_format": "tar"},
+                {"WA1/device1_20240101000000.log": b"hostname\nhost1\n!\nend\n", "WA1/device2_20240101000000.log": b"hostname\nhost2\n!\nend\n"},
+                None
+        ),
+        # 1. correct(tar.xz)
+        (
+                {"archive_format": "tar.xz"},
+                {"WA1/device1_20240101000000.log": b"hostname\nhost1\n!\nend\n", "WA1/device2_20240101000000.log": b"hostname\nhost2\n!\nend\n"},
+                None
+        ),
+        # 2. correct(zip)
+        (
+                {"archive_format": "zip"},
+                {"WA1/device1_20240101000000.log": b"hostname\nhost1\n!\nend\n", "WA1/device2_20240101000000.log": b"hostname\nhost2\n!\nend\n"},
+                None
+        ),
+        # 3. incorrect(unsupported archive_format)
+        (
+                {"archive_format": "rar"},
+                None,
+                ArchiveFormatNotSupportedError
+        ),
+    ]
+)
+def test_config_archive_impl(tmp_path, monkeypatch, test_input: Dict[str, Any], test_result: Dict[str, bytes], test_exception_result: Exception):
+    monkeypatch.setattr("os.linesep", "\n")
+    config_sample_file = tmp_path / "config_sample.log"
+    config_sample_file.write_text("hostname\n%%HOSTNAME%%\n!\nend\n", encoding="utf-8")
+    archive_file = tmp_path / "output" / f"configs.{test_input['archive_format']}"
+
+    if test_result:
+        config_archive_impl = ConfigArchiveImpl(str(config_sample_file), str(archive_file), test_input["archive_format"])
+        for device_name in ["device1", "device2"]:
+            config = Config(config_sources=[ConfigSource(marker="%%HOSTNAME%%", commands_group=[[device_name.replace("device", "host")]])])
+            config_archive_impl.write(config, str(tmp_path / "output" / "WA1" / f"{device_name}_20240101000000.log"), device_name)
+        config_archive_impl.close()
+
+        if test_input["archive_format"] == "zip":
+            with zipfile.ZipFile(archive_file) as archive:
+                entries = {name: archive.read(name) for name in archive.namelist()}
+        else:
+            with tarfile.open(archive_file) as archive:
+                entries = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+        manifest = json.loads(entries.pop("manifest.json"))
+        assert entries == test_result
+        assert manifest == [
+            {"device": f"device{i}", "file": file_name, "size": len(config), "sha256": hashlib.sha256(config).hexdigest()}
+            for i, (file_name, config) in enumerate(test_result.items(), 1)
+        ]
+        assert not (tmp_path / "output" / "WA1").exists()
+    else:
+        with pytest.raises(test_exception_result):
+            _ = ConfigArchiveImpl(str(config_sample_file), str(archive_file), test_input["archive_format"])
@@ -1,7 +1,10 @@
-from typing import List
+from typing import Dict, Optional
 from src.utils.logger import get_custom_logger
 from src.domain.config.config import Config
 from src.domain.config.config_repository import ConfigRepository
+from src.domain.config.config_template import ConfigTemplate
+import json
+import os
 
 
 logger = get_custom_logger(__name__)
@@ -15,16 +18,64 @@ class ConfigTxtImpl(ConfigRepository):
     Attributes:
         config_sample_file str: ConfigSampleFileが存在するファイルパス
 
+    Note:
+        ConfigSampleFileは最初の出力時にConfigTemplateへ解析し、インスタンス内に保持して全てのデバイスで再利用する。
+        ConfigSampleFileの更新日時が変わった場合は、再度解析する。
+        デバイス名とフィンガープリントの辞書は、出力先ディレクトリのmanifest.jsonに記録する。
+
     """
 
+    MANIFEST_FILE: str = "manifest.json"
+
     def __init__(self, config_sample_file: str) -> None:
 
         logger.debug(f"Intializing ConfigTxtImpl(config_sample_file={config_sample_file})...")
 
         super(ConfigTxtImpl, self).__init__(config_sample_file)
 
+        self._config_template: Optional[ConfigTemplate] = None
+        self._config_template_mtime: Optional[int] = None
+
+
+    @property
+    def config_template(self) -> ConfigTemplate:
+        """config_template
+
+        ConfigSampleFileを解析したConfigTemplate、更新日時が変わっていない場合は保持しているものを返す
+
+        """
+        mtime: int = os.stat(self.config_sample_file).st_mtime_ns
+
+        if self._config_template is None or self._config_template_mtime != mtime:
+
+            logger.debug(f"Reading a config_sample_file({self.config_sample_file})...")
+
+            with open(self.config_sample_file, "r", encoding="utf-8") as cs:
+                self._config_template = ConfigTemplate(cs)
+
+            self._config_template_mtime = mtime
+
+            logger.debug(f"Reading a config_sample_file({self.config_sample_file}) has been finished successfully")
+
+        return self._config_template
+
+
+    def render(self, config: Config) -> bytes:
+        """render
+
+        ConfigSampleFileとConfigインスタンスから、コンフィグファイルの内容を作成する関数
+
+        Args:
+            config (:obj:`Config`): コンフィグに記載すべき内容を含んだオブジェクト
+
+        Returns:
+            bytes: UTF-8でエンコードしたコンフィグファイルの内容
+
+        """
+        return self._encode_config(self.config_template.render(config))
+
 
-    def write(self, config: Config, output_config_file: str) -> None:
+    def write(self, config: Config, output_config_file: str, device_name: Optional[str] = None) -> None:
         """write
     
         ConfigSampleFileとConfigインスタンスからConfigファイルをTxt(Log)形式で出力する関数
@@ -34,34 +85,77 @@ class ConfigTxtImpl(ConfigRepository):
 
         """
 
-        logger.debug(f"Reading a config_sample_file({self.config_sample_file})...")
+        # コンフィグ全体を1度だけエンコードし、1回の書き込みで出力する
+        self.write_content(self.render(config), output_config_file, device_name)
 
-        with open(self.config_sample_file, "r", encoding="utf-8") as cs:
-            config_sample: List[str] = cs.readlines()
 
-        logger.debug(f"Reading a config_sample_file({self.config_sample_file}) has been finished successfully")
+    def write_content(self, content: bytes, output_config_file: str, device_name: Optional[str] = None) -> None:
 
         logger.debug(f"Writing a config_file({output_config_file})...")
 
-        with open(output_config_file, "w", encoding="utf-8") as c:
+        with open(output_config_file, "wb") as c:
+            c.write(content)
 
-            for config_row, config_line in enumerate(config_sample):
-                stripped_config_line: str = config_line.strip()
+        logger.debug(f"Writing a config_file({output_config_file}) has been finished successfully")
 
-                if self._inspect_marker(stripped_config_line):
 
-                    logger.debug(f"Inspected a marker({stripped_config_line}) in the ConfigTxtImpl")
+    def exists(self, output_config_file: str) -> bool:
+        return os.path.isfile(output_config_file)
+
+
+    def read_manifest(self, output_path: str) -> Dict[str, str]:
+        """read_manifest
+
+        出力先ディレクトリのmanifest.jsonから、デバイス名とフィンガープリントの辞書を取得する関数
+
+        Note:
+            manifest.jsonが存在しないまたは破損している場合は、空の辞書を返す。
+
+        """
+        manifest_file: str = os.path.join(output_path, self.MANIFEST_FILE)
+
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as m:
+                result: Dict[str, str] = json.load(m)["fingerprints"]
+
+        except FileNotFoundError:
+
+            return {}
+
+        except (ValueError, KeyError, TypeError) as e:
+
+            logger.warning(f"Ignoring the broken manifest({manifest_file}): {e}")
+
+            return {}
+
+        logger.debug(f"Reading the manifest({manifest_file}) of {len(result)} devices has been completed")
+
+        return result
+
+
+    def write_manifest(self, output_path: str, fingerprints: Dict[str, str]) -> None:
+        """write_manifest
+
+        デバイス名とフィンガープリントの辞書を、出力先ディレクトリのmanifest.jsonに記録する関数
+
+        Note:
+            書き込み中に中断しても破損しないように、一時ファイルに書き込んでから置き換える。
+
+        """
+        manifest_file: str = os.path.join(output_path, self.MANIFEST_FILE)
+
+        with open(f"{manifest_file}.tmp", "w", encoding="utf-8") as m:
+            json.dump({"fingerprints": fingerprints}, m, ensure_ascii=False, indent=2, sort_keys=True)
 
-                    if stripped_config_line in config.get_markers():
-                        for commands_group in config.get_commands_group(stripped_config_line):
-                            for command in commands_group:
+        os.replace(f"{manifest_file}.tmp", manifest_file)
 
-                                logger.debug(f"writing {command} at the marker({stripped_config_line}) in the config_sample_file({self.config_sample_file}) in the ConfigTxtImpl")
+        logger.debug(f"Writing the manifest({manifest_file}) of {len(fingerprints)} devices has been completed")
 
-                                c.write(f"{command}\n")
 
-                    else:
-                        logger.warning(f"Inspected a marker({stripped_config_line}) at line({config_row}) in the ConfigTxtImpl, but any config_source doesn't exist")
+    @staticmethod
+    def _encode_config(config: str) -> bytes:
+        # テキストモードでの書き込みと同じく、改行をプラットフォームの改行コードに変換してUTF-8でエンコードする
+        if os.linesep != "\n":
+            config = config.replace("\n", os.linesep)
 
-                else:
-                    c.write(config_line)
+        return config.encode("utf-8")
@@ -2,4 +2,7 @@ from src.utils.custom_error import CustomError
 
 
 class ConfigImplError(CustomError):
-    pass
\ No newline at end of file
+    pass
+
+class ArchiveFormatNotSupportedError(ConfigImplError):
+    ja_message = "アーカイブ形式({archive_format})はサポートされていません。サポートしている形式は{archive_formats}です。"
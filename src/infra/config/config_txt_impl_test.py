@@ -4,6 +4,7 @@ import os
 
 from .config_txt_impl import ConfigTxtImpl
 from src.domain.config.config import Config, ConfigSource
+from src.domain.config.config_exception import ConfigSampleFileNotExistError
 
 
 @pytest.mark.parametrize(
@@ -11,14 +12,14 @@ from src.domain.config.config import Config, ConfigSource
         # correct
         (
                 {
-                    "config_sample_file": os.path.abspath("../../../test/data/config_sample.log"),
+                    "config_sample_file": "config_sample.log",
                     "config": Config(
                         config_sources=[
-                            ConfigSource(marker="%%parameter1%%", command_groups=[["ddddddddddddddddd", "!"]]),
-                            ConfigSource(marker="%%parameter2%%", command_groups=[["eeeeeeeeeeeeeeeee", "!"]])
+                            ConfigSource(marker="%%parameter1%%", commands_group=[["ddddddddddddddddd", "!"]]),
+                            ConfigSource(marker="%%parameter2%%", commands_group=[["eeeeeeeeeeeeeeeee", "!"]])
                         ]
                     ),
-                    "output_config_file": os.path.abspath("../../../test/data/test_device.log")
+                    "output_config_file": "test_device.log"
                 },
                 "show running-config\n!\naaaaaaaaaaaaaaaaa\n!\nbbbbbbbbbbbbbbbbb\n!\nccccccccccccccccc\n!\nddddddddddddddddd\n!\neeeeeeeeeeeeeeeee\n!\nend",
                 None
@@ -26,20 +27,97 @@ from src.domain.config.config import Config, ConfigSource
         # unexisted config_sample
         (
                 {
-                    "config_sample_file": os.path.abspath("../../../test/data/config_sample2.log"),
+                    "config_sample_file": "config_sample2.log",
                     "config": "",
-                    "output_config_file": os.path.abspath("../../../test/data/test_device.log")
+                    "output_config_file": "test_device.log"
                 },
                 None,
-                ValueError(r"of the ConfigRepository doesn't exist in your directories")
+                ConfigSampleFileNotExistError
         ),
     ]
 )
-def test_read(test_input: Dict[str, Any], test_result: str, test_exception_result: Exception):
+def test_read(tmp_path, monkeypatch, test_input: Dict[str, Any], test_result: str, test_exception_result: Exception):
+    monkeypatch.setattr(os, "linesep", "\n")
+    (tmp_path / "config_sample.log").write_text(
+        "show running-config\n!\naaaaaaaaaaaaaaaaa\n!\nbbbbbbbbbbbbbbbbb\n!\nccccccccccccccccc\n!\n%%parameter1%%\n%%parameter2%%\nend", encoding="utf-8"
+    )
+    config_sample_file = str(tmp_path / test_input["config_sample_file"])
+    output_config_file = str(tmp_path / test_input["output_config_file"])
     if test_result:
-        ConfigTxtImpl(test_input["config_sample_file"]).write(test_input["config"], test_input["output_config_file"])
-        assert open(test_input["output_config_file"], "r").read() == test_result
+        ConfigTxtImpl(config_sample_file).write(test_input["config"], output_config_file)
+        assert open(output_config_file, "r", encoding="utf-8").read() == test_result
     else:
-        with pytest.raises(Exception) as e:
-            ConfigTxtImpl(test_input["config_sample_file"]).write(test_input["config"], test_input["output_config_file"])
-        assert str(test_exception_result) in str(e.value)
+        with pytest.raises(test_exception_result):
+            ConfigTxtImpl(config_sample_file).write(test_input["config"], output_config_file)
+
+
+def test_config_template_cache(tmp_path):
+    config_sample_file = tmp_path / "config_sample.log"
+    config_sample_file.write_text("hostname\n%%parameter1%%\nend\n", encoding="utf-8")
+    output_config_file = tmp_path / "device.log"
+    config = Config(config_sources=[ConfigSource(marker="%%parameter1%%", commands_group=[["command1"]])])
+
+    config_repo_inst = ConfigTxtImpl(str(config_sample_file))
+    config_repo_inst.write(config, str(output_config_file))
+    config_template = config_repo_inst.config_template
+
+    # 更新日時が変わらない場合は、解析済みのテンプレートを再利用すること
+    config_repo_inst.write(config, str(output_config_file))
+    assert config_repo_inst.config_template is config_template
+    assert output_config_file.read_text(encoding="utf-8") == "hostname\ncommand1\nend\n"
+
+    # 更新日時が変わった場合は、再度解析すること
+    config_sample_file.write_text("%%parameter1%%\n!\n", encoding="utf-8")
+    os.utime(config_sample_file, ns=(0, os.stat(config_sample_file).st_mtime_ns + 1_000_000_000))
+    config_repo_inst.write(config, str(output_config_file))
+    assert config_repo_inst.config_template is not config_template
+    assert output_config_file.read_text(encoding="utf-8") == "command1\n!\n"
+
+
+@pytest.mark.parametrize("linesep", ["\n", "\r\n"])
+def test_write_encoded_config(tmp_path, monkeypatch, linesep: str):
+    config_sample_file = tmp_path / "config_sample.log"
+    config_sample_file.write_text("hostname ルーター\n%%parameter1%%\nend\n", encoding="utf-8")
+    output_config_file = tmp_path / "device.log"
+    config = Config(config_sources=[ConfigSource(marker="%%parameter1%%", commands_group=[["command1", "!"]])])
+
+    # テキストモードと同じく、改行はプラットフォームの改行コードで出力すること
+    monkeypatch.setattr(os, "linesep", linesep)
+    ConfigTxtImpl(str(config_sample_file)).write(config, str(output_config_file))
+    assert output_config_file.read_bytes() == "hostname ルーター\ncommand1\n!\nend\n".replace("\n", linesep).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {"manifest": None, "fingerprints": {"device1": "abc", "デバイス2": "def"}},
+                {"device1": "abc", "デバイス2": "def"},
+                None
+        ),
+        # 1. correct(broken manifest)
+        (
+                {"manifest": "{\"fingerprints\":", "fingerprints": None},
+                {},
+                None
+        ),
+        # 2. correct(no manifest)
+        (
+                {"manifest": None, "fingerprints": None},
+                {},
+                None
+        ),
+    ]
+)
+def test_manifest(tmp_path, test_input: Dict[str, Any], test_result: Dict[str, str], test_exception_result: Exception):
+    config_sample_file = tmp_path / "config_sample.log"
+    config_sample_file.write_text("%%parameter1%%\n", encoding="utf-8")
+    config_repo_inst = ConfigTxtImpl(str(config_sample_file))
+
+    if test_input["manifest"] is not None:
+        (tmp_path / ConfigTxtImpl.MANIFEST_FILE).write_text(test_input["manifest"], encoding="utf-8")
+    if test_input["fingerprints"] is not None:
+        config_repo_inst.write_manifest(str(tmp_path), test_input["fingerprints"])
+
+    assert config_repo_inst.read_manifest(str(tmp_path)) == test_result
+    assert not (tmp_path / f"{ConfigTxtImpl.MANIFEST_FILE}.tmp").exists()
@@ -1,11 +1,15 @@
-from typing import List
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from src.utils.logger import get_custom_logger
 
 from .parameter_locations_excel_impl_exceptions import SheetNotExistError
 from src.domain.parameter_locations.parameter import ParameterGroup, Parameter
-from src.domain.parameter_locations.parameter_locations import ParameterLocations
+from src.domain.parameter_locations.parameter_locations import ParameterLocations, ParameterLocationSource, ParameterRange
 from src.domain.parameter_locations.parameter_locations_repository import ParameterLocationsRepository
+from src.domain.parameter_locations.parameter_cell_matrix import ParameterCellMatrix
 
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from openpyxl.workbook.workbook import Workbook
 import openpyxl
 
 
@@ -19,12 +23,44 @@ class ParameterLocationsExcelImpl(ParameterLocationsRepository):
 
     Attributes:
         parameter_sheet_file (str): パラメータシートが存在するファイルパス
-        
+        read_only (bool): 読み取り専用モードでワークブックを開くかどうか
+        data_only (bool): 数式セルから数式ではなく、Excelが最後に計算してキャッシュした値を取得するかどうか
+
+    Note:
+        read_onlyがTrueの場合、シートのXMLを逐次読み込むため、全セルのオブジェクトを生成しない。
+        read_onlyは数式セルから取得する値を変えない。数式セルの値はdata_onlyのみで切り替える。
+        ワークブックは最初にセルを読み込む際に開き、シート名はシートのデータを読み込まずにworkbook.xmlから取得する。
+
     """
 
-    def __init__(self, parameter_sheet_file: str):
+    file_extensions: Tuple[str, ...] = (".xlsx",)
+
+    def __init__(self, parameter_sheet_file: str, read_only: bool = True, data_only: bool = False):
         super().__init__(parameter_sheet_file)
-        self.workbook = openpyxl.load_workbook(self.parameter_sheet_file)
+        self.read_only: bool = read_only
+        self.data_only: bool = data_only
+        self._workbook: Optional[Workbook] = None
+        self._sheets: Optional[List[str]] = None
+        self._sheet_set: FrozenSet[str] = frozenset()
+
+
+    @property
+    def workbook(self) -> Workbook:
+        """workbook
+
+        ワークブックを取得する関数
+
+        Note:
+            ワークブックは初回の呼び出し時に読み込む。
+
+        """
+        if self._workbook is None:
+
+            logger.debug(f"Loading the workbook({self.parameter_sheet_file}) in the ParameterLocationsExcelImpl...")
+
+            self._workbook = openpyxl.load_workbook(self.parameter_sheet_file, read_only=self.read_only, data_only=self.data_only)
+
+        return self._workbook
 
 
     def get_sheets(self) -> List[str]:
@@ -38,7 +74,11 @@ class ParameterLocationsExcelImpl(ParameterLocationsRepository):
         """
         logger.debug(f"Getting sheets in the ParameterLocationsExcelImpl...")
 
-        result: List[str] = self.workbook.sheetnames
+        if self._sheets is None:
+            self._sheets = self._read_sheet_names()
+            self._sheet_set = frozenset(self._sheets)
+
+        result: List[str] = list(self._sheets)
 
         logger.debug(f"Getting sheets({result}) in the ParameterLocationsExcelImpl has been completed")
 
@@ -66,32 +106,226 @@ class ParameterLocationsExcelImpl(ParameterLocationsRepository):
 
             raise SheetNotExistError({"sheet_name": sheet_name, "parameter_sheet_file": self.parameter_sheet_file})
 
+        cell_values: Dict[str, Any] = self._read_cell_values(sheet_name, [location.cell_number for location in parameter_locations.locations])
+
         for location in parameter_locations.locations:
 
-            logger.debug(f"Getting parameter({location.name}) at {self.workbook[sheet_name][location.cell_number].value} in the ParameterLocationsExcelImpl...")
+            logger.debug(f"Getting parameter({location.name}) at {cell_values[location.cell_number]} in the ParameterLocationsExcelImpl...")
 
             parameters.append(
                 Parameter(
                     name=location.name,
-                    value=self.workbook[sheet_name][location.cell_number].value,
+                    value=cell_values[location.cell_number],
                     required=location.required
                 )
             )
 
-            logger.debug(f"Getting parameter({location.name}) at {self.workbook[sheet_name][location.cell_number].value} in the ParameterLocationsExcelImpl has been completed")
-
         logger.debug(f"Getting parameter_group from ({self.parameter_sheet_file}) in the ParameterLocationsExcelImpl has been completed")
 
         return ParameterGroup(parameters=parameters)
 
+
+    def read_range(self, sheet_name: str, parameter_location_source: ParameterLocationSource) -> List[ParameterGroup]:
+        """read_range
+
+        ParameterLocationSourceが示す矩形範囲を1度の行走査で取得し、行ごとのParameterGroupに分割する関数
+
+        Args:
+            sheet_name (str): シート名
+            parameter_location_source (:obj:`ParameterLocationSource`): パラメータの列と行の範囲を記述したもの
+
+        Returns:
+            List[ParameterGroup]: 行ごとに取得したパラメータ群の配列
+
+        """
+        logger.debug(f"Getting parameter_groups in rows({parameter_location_source.row_from}-{parameter_location_source.row_to}) from ({self.parameter_sheet_file}) in the ParameterLocationsExcelImpl...")
+
+        if not self._validate_sheet_name(sheet_name):
+
+            raise SheetNotExistError({"sheet_name": sheet_name, "parameter_sheet_file": self.parameter_sheet_file})
+
+        parameter_range: ParameterRange = parameter_location_source.parameter_range
+        min_col: int = min(parameter_range.column_indexes)
+        columns: List[Tuple[str, int, bool]] = list(zip(parameter_range.names, parameter_range.column_indexes, parameter_range.required))
+
+        rows: List[Tuple[Any, ...]] = self._read_rows(
+            sheet_name,
+            min_row=parameter_range.row_from,
+            max_row=parameter_range.row_to,
+            min_col=min_col,
+            max_col=max(parameter_range.column_indexes)
+        )
+
+        result: List[ParameterGroup] = [
+            ParameterGroup(
+                parameters=[
+                    Parameter(
+                        name=name,
+                        value=row[column_index - min_col],
+                        required=required
+                    ) for name, column_index, required in columns
+                ]
+            ) for row in rows
+        ]
+
+        logger.debug(f"Getting parameter_groups in rows({parameter_location_source.row_from}-{parameter_location_source.row_to}) from ({self.parameter_sheet_file}) in the ParameterLocationsExcelImpl has been completed")
+
+        return result
+
+
+    def read_matrix(self, sheet_name: str, rows: List[int], columns: List[str]) -> ParameterCellMatrix:
+        """read_matrix
+
+        指定した行番号・列番号のセルを1度の行走査で取得し、ParameterCellMatrixを作成する関数
+
+        Args:
+            sheet_name (str): シート名
+            rows (List[int]): 取得する行番号の配列
+            columns (List[str]): 取得する列番号(アルファベット)の配列
+
+        Returns:
+            ParameterCellMatrix: 取得したセルの値を保持する2次元配列
+
+        """
+        logger.debug(f"Getting a parameter_cell_matrix(rows={rows}, columns={columns}) of the sheet({sheet_name}) in the ParameterLocationsExcelImpl...")
+
+        if not self._validate_sheet_name(sheet_name):
+
+            raise SheetNotExistError({"sheet_name": sheet_name, "parameter_sheet_file": self.parameter_sheet_file})
+
+        values: List[Any] = []
+
+        if rows and columns:
+
+            column_indexes: List[int] = [column_index_from_string(column) for column in columns]
+            required_rows: Set[int] = set(rows)
+            min_row: int = min(rows)
+            min_col: int = min(column_indexes)
+            max_col: int = max(column_indexes)
+
+            # 指定した行のみを保持し、最終行を読み込んだ時点で走査を終了する
+            sheet_rows: Dict[int, Tuple[Any, ...]] = {
+                row: sheet_row for row, sheet_row in enumerate(
+                    self.workbook[sheet_name].iter_rows(min_row=min_row, max_row=max(rows), min_col=min_col, max_col=max_col, values_only=True),
+                    start=min_row
+                ) if row in required_rows
+            }
+            empty_row: Tuple[Any, ...] = (None,) * (max_col - min_col + 1)
+
+            for row in rows:
+                sheet_row: Tuple[Any, ...] = sheet_rows.get(row, empty_row)
+                values.extend(sheet_row[column_index - min_col] for column_index in column_indexes)
+
+        logger.debug(f"Getting a parameter_cell_matrix of the sheet({sheet_name}) in the ParameterLocationsExcelImpl has been completed")
+
+        return ParameterCellMatrix(rows=rows, columns=columns, values=values)
+
+
+    def close(self) -> None:
+        """close
+
+        読み取り専用モードで開いたワークブックのファイルハンドルを解放する関数
+
+        """
+        if self.read_only and self._workbook is not None:
+
+            logger.debug(f"Closing the workbook({self.parameter_sheet_file}) in the ParameterLocationsExcelImpl...")
+
+            self._workbook.close()
+
+
+    def _read_cell_values(self, sheet_name: str, cell_numbers: List[str]) -> Dict[str, Any]:
+        """_read_cell_values
+
+        指定したセル群を包含する矩形範囲を1度だけ走査して値を取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            cell_numbers (List[str]): 取得するセルの位置(A1形式)の配列
+
+        Returns:
+            Dict[str, Any]: セルの位置をキー、セルの値を値とする辞書
+
+        Note:
+            読み取り専用モードのワークシートはセルへのランダムアクセスの度にシートを先頭から走査するため、まとめて取得する。
+
+        """
+        coordinates: Dict[str, Tuple[int, int]] = {}
+
+        if not cell_numbers:
+            return coordinates
+
+        for cell_number in cell_numbers:
+            column_letter, row = coordinate_from_string(cell_number)
+            coordinates[cell_number] = (row, column_index_from_string(column_letter))
+
+        min_row: int = min(row for row, _ in coordinates.values())
+        max_row: int = max(row for row, _ in coordinates.values())
+        min_col: int = min(col for _, col in coordinates.values())
+        max_col: int = max(col for _, col in coordinates.values())
+
+        rows: List[Tuple[Any, ...]] = self._read_rows(sheet_name, min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+
+        return {cell_number: rows[row - min_row][col - min_col] for cell_number, (row, col) in coordinates.items()}
+
+
+    def _read_rows(self, sheet_name: str, min_row: int, max_row: int, min_col: int, max_col: int) -> List[Tuple[Any, ...]]:
+        """_read_rows
+
+        指定した矩形範囲のセルの値を1度の行走査で取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            min_row (int): 行の始端
+            max_row (int): 行の終端
+            min_col (int): 列の始端
+            max_col (int): 列の終端
+
+        Returns:
+            List[Tuple[Any, ...]]: 行ごとのセルの値の配列
+
+        """
+        rows: List[Tuple[Any, ...]] = list(
+            self.workbook[sheet_name].iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+        )
+
+        # シートの最終行より後ろの行は、iter_rowsから返却されないため空行で補完する
+        rows.extend([(None,) * (max_col - min_col + 1)] * (max_row - min_row + 1 - len(rows)))
+
+        return rows
+
+
     def _validate_sheet_name(self, sheet_name) -> bool:
-        sheets: List[str] = self.get_sheets()
-        
-        logger.debug(f"Checking the existence of sheet_name({sheet_name}) in ({sheets})...")
+        if self._sheets is None:
+            self.get_sheets()
 
-        result: bool = any([True if sheet_name == sheet else False for sheet in sheets])
+        result: bool = sheet_name in self._sheet_set
 
-        logger.debug(f"Checking the existence of sheet_name({sheet_name}) in ({sheets}) is {result}")
+        logger.debug(f"Checking the existence of sheet_name({sheet_name}) is {result}")
 
         return result
 
+
+    def _read_sheet_names(self) -> List[str]:
+        """_read_sheet_names
+
+        シートのデータを読み込まずに、workbook.xmlからシート名の配列を取得する関数
+
+        Returns:
+            List[str]: シート名の配列
+
+        """
+        if self._workbook is not None:
+            return self._workbook.sheetnames
+
+        excel_reader = ExcelReader(self.parameter_sheet_file, read_only=True)
+
+        try:
+            excel_reader.read_manifest()
+            excel_reader.read_workbook()
+
+            return [sheet.name for sheet, _ in excel_reader.parser.find_sheets()]
+
+        finally:
+            excel_reader.archive.close()
+
@@ -1,10 +1,14 @@
 from typing import List, Dict, Any
 import pytest
+import openpyxl
 import os
 
 from .parameter_locations_excel_impl import ParameterLocationsExcelImpl
-from src.domain.parameter_locations.parameter_locations import ParameterLocations, ParameterLocation
+from .parameter_locations_excel_impl_exceptions import SheetNotExistError
+from src.domain.parameter_locations.parameter_locations import ParameterLocations, ParameterLocation, ParameterColumnLocation, ParameterLocationSource
 from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
+from src.domain.parameter_locations.parameter_locations_exceptions import ParameterSheetNotExistError
+from src.domain.parameter_locations.parameter_cell_matrix import ParameterCellMatrix
 
 
 @pytest.mark.parametrize(
@@ -12,7 +16,7 @@ from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
         # correct
         (
                 {
-                    "file_name": os.path.abspath("../../../test/data/test_parameter_sheet.xlsx"),
+                    "file_name": "test_parameter_sheet.xlsx",
                     "sheet_name": "test_device",
                     "parameter_locations": ParameterLocations(
                         locations=[
@@ -26,7 +30,7 @@ from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
                     parameters=[
                         Parameter(name="parameter1", value="value1"),
                         Parameter(name="parameter2", value="value2"),
-                        Parameter(name="parameter3", value="value3"),
+                        Parameter(name="parameter3", value=None),
                     ]
                 ),
                 None
@@ -34,7 +38,7 @@ from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
         # unexisted file name
         (
                 {
-                    "file_name": os.path.abspath("../../../test/data/test_parameter_sheet2.xlsx"),
+                    "file_name": "test_parameter_sheet2.xlsx",
                     "sheet_name": "test_device",
                     "parameter_locations": ParameterLocations(
                         locations=[
@@ -45,13 +49,12 @@ from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
                     )
                  },
                 None,
-                ValueError(r"The 'parameter_sheet_file' property(value: C:\Users\81802\PycharmProjects\github\network-device-converter\test\data\test_parameter_sheet2.xlsx)" +
-                           r" of the ParameterLocationRepository doesn't exist in your directories")
+                ParameterSheetNotExistError
         ),
         # unexisted sheet name
         (
                 {
-                    "file_name": os.path.abspath("../../../test/data/test_parameter_sheet.xlsx"),
+                    "file_name": "test_parameter_sheet.xlsx",
                     "sheet_name": "test_device2",
                     "parameter_locations": ParameterLocations(
                         locations=[
@@ -62,21 +65,282 @@ from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
                     )
                  },
                 None,
-                ValueError(r"the sheet name 'test_device2' doesn't exist in " +
-                           r"C:\Users\81802\PycharmProjects\github\network-device-converter\test\data\test_parameter_sheet.xlsx")
+                SheetNotExistError
         ),
     ]
 )
-def test_read(test_input: Dict[str, Any], test_result: List[Parameter], test_exception_result: Exception):
+def test_read(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[Parameter], test_exception_result: Exception):
+    file_name = os.path.join(os.path.dirname(parameter_sheet_file), test_input["file_name"])
     if test_result:
-        assert ParameterLocationsExcelImpl(test_input["file_name"]).read(
+        assert ParameterLocationsExcelImpl(file_name).read(
             test_input["sheet_name"],
             test_input["parameter_locations"]
         ) == test_result
     else:
-        with pytest.raises(Exception) as e:
-            _ = ParameterLocationsExcelImpl(test_input["file_name"]).read(
+        with pytest.raises(test_exception_result):
+            _ = ParameterLocationsExcelImpl(file_name).read(
                 test_input["sheet_name"],
                 test_input["parameter_locations"]
             )
-        assert str(test_exception_result) in str(e.value)
+
+
+@pytest.fixture
+def parameter_sheet_file(tmp_path) -> str:
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "test_device"
+    worksheet["C2"] = "value1"
+    worksheet["C3"] = "value2"
+    worksheet["D3"] = 100
+    workbook.create_sheet("改版履歴")
+    file_name = str(tmp_path / "test_parameter_sheet.xlsx")
+    workbook.save(file_name)
+    return file_name
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(read_only)
+        (
+                {
+                    "read_only": True,
+                    "sheet_name": "test_device",
+                    "parameter_locations": ParameterLocations(
+                        locations=[
+                            ParameterLocation(name="parameter1", cell_number="C2"),
+                            ParameterLocation(name="parameter2", cell_number="D3"),
+                            ParameterLocation(name="parameter3", cell_number="C4")
+                        ]
+                    )
+                },
+                ParameterGroup(
+                    parameters=[
+                        Parameter(name="parameter1", value="value1"),
+                        Parameter(name="parameter2", value="100"),
+                        Parameter(name="parameter3", value=None),
+                    ]
+                ),
+                None
+        ),
+        # 1. correct(full load)
+        (
+                {
+                    "read_only": False,
+                    "sheet_name": "test_device",
+                    "parameter_locations": ParameterLocations(
+                        locations=[
+                            ParameterLocation(name="parameter1", cell_number="C2"),
+                            ParameterLocation(name="parameter2", cell_number="D3"),
+                            ParameterLocation(name="parameter3", cell_number="C4")
+                        ]
+                    )
+                },
+                ParameterGroup(
+                    parameters=[
+                        Parameter(name="parameter1", value="value1"),
+                        Parameter(name="parameter2", value="100"),
+                        Parameter(name="parameter3", value=None),
+                    ]
+                ),
+                None
+        ),
+        # 2. unexisted sheet name(read_only)
+        (
+                {
+                    "read_only": True,
+                    "sheet_name": "test_device2",
+                    "parameter_locations": ParameterLocations(
+                        locations=[ParameterLocation(name="parameter1", cell_number="C2")]
+                    )
+                },
+                None,
+                SheetNotExistError
+        ),
+    ]
+)
+def test_read_mode(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: ParameterGroup, test_exception_result: Exception):
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, read_only=test_input["read_only"])
+    if test_result:
+        assert parameter_locations_excel_impl.read(test_input["sheet_name"], test_input["parameter_locations"]) == test_result
+        assert parameter_locations_excel_impl.get_sheets() == ["test_device", "改版履歴"]
+    else:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_excel_impl.read(test_input["sheet_name"], test_input["parameter_locations"])
+    parameter_locations_excel_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(read_only)
+        (
+                {
+                    "read_only": True,
+                    "sheet_name": "test_device",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[
+                            ParameterColumnLocation(name="parameter1", column_number="C"),
+                            ParameterColumnLocation(name="parameter2", column_number="D"),
+                        ],
+                        row_from=2,
+                        row_to=4
+                    )
+                },
+                [
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value="value1"), Parameter(name="parameter2", value=None)]),
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value="value2"), Parameter(name="parameter2", value="100")]),
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value=None), Parameter(name="parameter2", value=None)]),
+                ],
+                None
+        ),
+        # 1. correct(full load)
+        (
+                {
+                    "read_only": False,
+                    "sheet_name": "test_device",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[
+                            ParameterColumnLocation(name="parameter2", column_number="D"),
+                            ParameterColumnLocation(name="parameter1", column_number="C"),
+                        ],
+                        row_from=3,
+                        row_to=3
+                    )
+                },
+                [
+                    ParameterGroup(parameters=[Parameter(name="parameter2", value="100"), Parameter(name="parameter1", value="value2")]),
+                ],
+                None
+        ),
+        # 2. unexisted sheet name
+        (
+                {
+                    "read_only": True,
+                    "sheet_name": "test_device2",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[ParameterColumnLocation(name="parameter1", column_number="C")],
+                        row_from=2,
+                        row_to=2
+                    )
+                },
+                None,
+                SheetNotExistError
+        ),
+    ]
+)
+def test_read_range(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[ParameterGroup], test_exception_result: Exception):
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, read_only=test_input["read_only"])
+    if test_result:
+        assert parameter_locations_excel_impl.read_range(test_input["sheet_name"], test_input["parameter_location_source"]) == test_result
+    else:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_excel_impl.read_range(test_input["sheet_name"], test_input["parameter_location_source"])
+    parameter_locations_excel_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(read_only)
+        (
+                {"read_only": True, "sheet_name": "test_device", "rows": [2, 3, 5], "columns": ["C", "D"]},
+                ParameterCellMatrix(rows=[2, 3, 5], columns=["C", "D"], values=["value1", None, "value2", 100, None, None]),
+                None
+        ),
+        # 1. correct(full load)
+        (
+                {"read_only": False, "sheet_name": "test_device", "rows": [3], "columns": ["D", "C"]},
+                ParameterCellMatrix(rows=[3], columns=["D", "C"], values=[100, "value2"]),
+                None
+        ),
+        # 2. unexisted sheet name
+        (
+                {"read_only": True, "sheet_name": "test_device2", "rows": [2], "columns": ["C"]},
+                None,
+                SheetNotExistError
+        ),
+    ]
+)
+def test_read_matrix(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: ParameterCellMatrix, test_exception_result: Exception):
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, read_only=test_input["read_only"])
+    if test_result:
+        parameter_cell_matrix = parameter_locations_excel_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"])
+        assert (parameter_cell_matrix.rows, parameter_cell_matrix.columns, parameter_cell_matrix.values) == (test_result.rows, test_result.columns, test_result.values)
+    else:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_excel_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"])
+    parameter_locations_excel_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(read_only)
+        (
+                {"read_only": True, "sheet_name": "test_device"},
+                ["test_device", "改版履歴"],
+                None
+        ),
+        # 1. correct(full load)
+        (
+                {"read_only": False, "sheet_name": "test_device"},
+                ["test_device", "改版履歴"],
+                None
+        ),
+        # 2. unexisted sheet name
+        (
+                {"read_only": True, "sheet_name": "test_device2"},
+                ["test_device", "改版履歴"],
+                SheetNotExistError
+        ),
+    ]
+)
+def test_lazy_load(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[str], test_exception_result: Exception):
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, read_only=test_input["read_only"])
+    parameter_locations = ParameterLocations(locations=[ParameterLocation(name="parameter1", cell_number="C2")])
+
+    # シート名の取得とシート名の検証では、ワークブックを読み込まないこと
+    assert parameter_locations_excel_impl.get_sheets() == test_result
+    if test_exception_result:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_excel_impl.read(test_input["sheet_name"], parameter_locations)
+        assert parameter_locations_excel_impl._workbook is None
+    else:
+        assert parameter_locations_excel_impl._workbook is None
+        _ = parameter_locations_excel_impl.read(test_input["sheet_name"], parameter_locations)
+        assert parameter_locations_excel_impl._workbook is not None
+    parameter_locations_excel_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. formula(read_only)
+        (
+                {"read_only": True, "data_only": False},
+                ParameterGroup(parameters=[Parameter(name="parameter1", value="=D3+1")]),
+                None
+        ),
+        # 1. formula(full load)
+        (
+                {"read_only": False, "data_only": False},
+                ParameterGroup(parameters=[Parameter(name="parameter1", value="=D3+1")]),
+                None
+        ),
+        # 2. cached value(openpyxlで保存したファイルは計算結果を保持しない)
+        (
+                {"read_only": True, "data_only": True},
+                ParameterGroup(parameters=[Parameter(name="parameter1", value=None)]),
+                None
+        ),
+    ]
+)
+def test_data_only(tmp_path, test_input: Dict[str, Any], test_result: ParameterGroup, test_exception_result: Exception):
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "test_device"
+    worksheet["D3"] = 100
+    worksheet["D4"] = "=D3+1"
+    parameter_sheet_file = str(tmp_path / "test_formula_parameter_sheet.xlsx")
+    workbook.save(parameter_sheet_file)
+
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, read_only=test_input["read_only"], data_only=test_input["data_only"])
+    parameter_locations = ParameterLocations(locations=[ParameterLocation(name="parameter1", cell_number="D4")])
+    assert parameter_locations_excel_impl.read("test_device", parameter_locations) == test_result
+    parameter_locations_excel_impl.close()
@@ -0,0 +1,542 @@
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from src.utils.logger import get_custom_logger
+
+from .parameter_locations_excel_impl_exceptions import SheetNotExistError
+from src.domain.parameter_locations.parameter import ParameterGroup, Parameter
+from src.domain.parameter_locations.parameter_cell_matrix import ParameterCellMatrix
+from src.domain.parameter_locations.parameter_locations import ParameterLocations, ParameterLocationSource, ParameterRange
+from src.domain.parameter_locations.parameter_locations_repository import ParameterLocationsRepository
+
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+from openpyxl.worksheet.formula import ArrayFormula, DataTableFormula
+from xml.etree.ElementTree import iterparse, Element, XMLPullParser
+import posixpath
+import zipfile
+
+
+logger = get_custom_logger(__name__)
+
+
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _split_cell_reference(cell_reference: str) -> Tuple[int, int]:
+    """_split_cell_reference
+
+    A1形式のセル参照を(行番号, 列番号)に分解する関数
+
+    """
+    column_index: int = 0
+
+    for i, char in enumerate(cell_reference):
+        if char.isdigit():
+            return int(cell_reference[i:]), column_index
+        column_index = column_index * 26 + (ord(char) - 64)
+
+    raise ValueError(f"The cell reference({cell_reference}) doesn't contain a row number")
+
+
+class ParameterLocationsXlsxImpl(ParameterLocationsRepository):
+    """ParameterLocationsXlsxImpl
+
+    本クラスは、openpyxlを用いずにxlsxファイル(zip)内のXMLを直接読み込み、ParameterLocationsを用いてParameterを取得する具象クラスである
+
+    Attributes:
+        parameter_sheet_file (str): パラメータシートが存在するファイルパス
+        data_only (bool): 数式セルから数式ではなく、Excelが最後に計算してキャッシュした値を取得するかどうか
+
+    Note:
+        シートの一覧はworkbook.xmlとそのリレーションから取得し、シートのデータは読み込まない。
+        シートのXMLはインクリメンタルパーサーで逐次読み込み、必要な行のセルのみ値に変換する。
+        共有文字列(sharedStrings.xml)は、参照されたインデックスに到達するまでのみ逐次読み込む。
+        セルの値はopenpyxlの読み取り専用モード(data_onlyを含む)と同じ型に変換される。
+        data_onlyがFalseの場合、openpyxlと同じく数式セルは数式の文字列(共有数式は各セルの位置に変換したもの)となる。
+
+    """
+
+    file_extensions: Tuple[str, ...] = (".xlsx",)
+
+    def __init__(self, parameter_sheet_file: str, data_only: bool = False):
+        super().__init__(parameter_sheet_file)
+        self.data_only: bool = data_only
+        self.archive: zipfile.ZipFile = zipfile.ZipFile(self.parameter_sheet_file)
+
+        self._sheet_parts: Dict[str, str] = {}
+        self._shared_strings_part: Optional[str] = None
+        self._styles_part: Optional[str] = None
+        self._epoch = CALENDAR_WINDOWS_1900
+        self._index_workbook()
+
+        self._shared_strings: List[str] = []
+        self._shared_strings_iterator: Optional[Iterator[str]] = None
+        self._date_formats: Optional[Set[int]] = None
+        self._timedelta_formats: Set[int] = set()
+
+
+    def get_sheets(self) -> List[str]:
+        """get_sheets
+
+        パラメータシートからシート配列を取得する関数
+
+        Returns:
+            List[str]: 取得されたシート配列
+
+        """
+        result: List[str] = list(self._sheet_parts)
+
+        logger.debug(f"Getting sheets({result}) in the ParameterLocationsXlsxImpl has been completed")
+
+        return result
+
+
+    def read(self, sheet_name: str, parameter_locations: ParameterLocations) -> ParameterGroup:
+        """read
+
+        パラメータシートからSheetNameとParameterLocationsを指定して、xlsxファイルからパラメータを取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            parameter_locations  (:obj:`ParameterLocations`): パラメータが存在する位置を記述したもの
+
+        Returns:
+            ParameterGroup: 取得したパラメータ群
+
+        """
+        coordinates: List[Tuple[int, int]] = []
+
+        for location in parameter_locations.locations:
+            column_letter, row = coordinate_from_string(location.cell_number)
+            coordinates.append((row, column_index_from_string(column_letter)))
+
+        cell_values: Dict[int, Dict[int, Any]] = self._read_cell_values(
+            sheet_name,
+            rows={row for row, _ in coordinates},
+            column_indexes={column_index for _, column_index in coordinates}
+        )
+
+        return ParameterGroup(
+            parameters=[
+                Parameter(
+                    name=location.name,
+                    value=cell_values[row].get(column_index),
+                    required=location.required
+                ) for location, (row, column_index) in zip(parameter_locations.locations, coordinates)
+            ]
+        )
+
+
+    def read_range(self, sheet_name: str, parameter_location_source: ParameterLocationSource) -> List[ParameterGroup]:
+        """read_range
+
+        ParameterLocationSourceが示す範囲を1度の走査で取得し、行ごとのParameterGroupに分割する関数
+
+        Args:
+            sheet_name (str): シート名
+            parameter_location_source (:obj:`ParameterLocationSource`): パラメータの列と行の範囲を記述したもの
+
+        Returns:
+            List[ParameterGroup]: 行ごとに取得したパラメータ群の配列
+
+        """
+        parameter_range: ParameterRange = parameter_location_source.parameter_range
+        columns: List[Tuple[str, int, bool]] = list(zip(parameter_range.names, parameter_range.column_indexes, parameter_range.required))
+
+        cell_values: Dict[int, Dict[int, Any]] = self._read_cell_values(
+            sheet_name, rows=set(parameter_range.rows), column_indexes=set(parameter_range.column_indexes)
+        )
+
+        return [
+            ParameterGroup(
+                parameters=[
+                    Parameter(
+                        name=name,
+                        value=cell_values[row].get(column_index),
+                        required=required
+                    ) for name, column_index, required in columns
+                ]
+            ) for row in parameter_range.rows
+        ]
+
+
+    def read_matrix(self, sheet_name: str, rows: List[int], columns: List[str]) -> ParameterCellMatrix:
+        """read_matrix
+
+        指定した行番号・列番号のセルのみを1度の走査で取得し、ParameterCellMatrixを作成する関数
+
+        Args:
+            sheet_name (str): シート名
+            rows (List[int]): 取得する行番号の配列
+            columns (List[str]): 取得する列番号(アルファベット)の配列
+
+        Returns:
+            ParameterCellMatrix: 取得したセルの値を保持する2次元配列
+
+        """
+        logger.debug(f"Getting a parameter_cell_matrix(rows={rows}, columns={columns}) of the sheet({sheet_name}) in the ParameterLocationsXlsxImpl...")
+
+        column_indexes: List[int] = [column_index_from_string(column) for column in columns]
+
+        cell_values: Dict[int, Dict[int, Any]] = self._read_cell_values(sheet_name, rows=set(rows), column_indexes=set(column_indexes))
+
+        values: List[Any] = [cell_values[row].get(column_index) for row in rows for column_index in column_indexes]
+
+        logger.debug(f"Getting a parameter_cell_matrix of the sheet({sheet_name}) in the ParameterLocationsXlsxImpl has been completed")
+
+        return ParameterCellMatrix(rows=rows, columns=columns, values=values)
+
+
+    def close(self) -> None:
+        """close
+
+        xlsxファイルのファイルハンドルを解放する関数
+
+        """
+        logger.debug(f"Closing the parameter_sheet_file({self.parameter_sheet_file}) in the ParameterLocationsXlsxImpl...")
+
+        self.archive.close()
+
+
+    def _index_workbook(self) -> None:
+        """_index_workbook
+
+        workbook.xmlとそのリレーションから、シート名とシートのXMLの対応、共有文字列とスタイルのXMLの位置を取得する関数
+
+        """
+        workbook_part: str = "xl/workbook.xml"
+
+        for relationship in self._parse_part(self._get_relationships_part(""), "Relationship"):
+            if relationship.get("Type", "").rsplit("/", 1)[-1] == "officeDocument":
+                workbook_part = self._resolve_target("", relationship.get("Target"))
+
+        workbook_relationships_part: str = self._get_relationships_part(workbook_part)
+        targets: Dict[str, str] = {}
+
+        for relationship in self._parse_part(workbook_relationships_part, "Relationship"):
+            target: str = self._resolve_target(workbook_part, relationship.get("Target"))
+            relationship_type: str = relationship.get("Type", "").rsplit("/", 1)[-1]
+
+            targets[relationship.get("Id")] = target
+
+            if relationship_type == "sharedStrings":
+                self._shared_strings_part = target
+            elif relationship_type == "styles":
+                self._styles_part = target
+
+        for element in self._parse_part(workbook_part):
+            tag: str = _local_name(element.tag)
+
+            if tag == "sheet":
+                self._sheet_parts[element.get("name")] = targets[element.get(f"{{{RELATIONSHIP_NS}}}id")]
+            elif tag == "workbookPr" and element.get("date1904", "false").lower() in ("1", "true"):
+                self._epoch = CALENDAR_MAC_1904
+
+        logger.debug(f"Indexing sheets({self._sheet_parts}) of the parameter_sheet_file({self.parameter_sheet_file}) has been completed")
+
+
+    def _read_cell_values(self, sheet_name: str, rows: Set[int], column_indexes: Set[int]) -> Dict[int, Dict[int, Any]]:
+        """_read_cell_values
+
+        シートのXMLを逐次読み込み、指定した行・列のセルの値のみを取得する関数
+
+        Args:
+            sheet_name (str): シート名
+            rows (Set[int]): 取得する行番号の集合
+            column_indexes (Set[int]): 取得する列番号の集合
+
+        Returns:
+            Dict[int, Dict[int, Any]]: 行番号ごとの、列番号をキーとするセルの値の辞書
+
+        Note:
+            シートのXMLをプルパーサーに逐次入力し、行要素の終了ごとに指定した行のセルのみを値に変換する。
+            共有数式は指定していない行・列のセルで定義される場合があるため、定義(共有数式の先頭のセル)は全てのセルから取得する。
+            変換後の行要素は破棄し、指定した最終行を読み込んだ時点で走査を終了する。
+
+        """
+        if sheet_name not in self._sheet_parts:
+
+            raise SheetNotExistError({"sheet_name": sheet_name, "parameter_sheet_file": self.parameter_sheet_file})
+
+        result: Dict[int, Dict[int, Any]] = {row: {} for row in rows}
+
+        if not rows or not column_indexes:
+            return result
+
+        max_row: int = max(rows)
+        row_counter: int = 0
+        sheet_data: Optional[Element] = None
+        cell_reference: Optional[str] = None
+        shared_formulae: Dict[str, Translator] = {}
+        parser: XMLPullParser = XMLPullParser(events=("start", "end"))
+
+        with self.archive.open(self._sheet_parts[sheet_name]) as source:
+
+            for chunk in iter(lambda: source.read(READ_CHUNK_SIZE), b""):
+                parser.feed(chunk)
+
+                for event, element in parser.read_events():
+                    tag: str = _local_name(element.tag)
+
+                    if event == "start":
+                        if tag == "sheetData":
+                            sheet_data = element
+                        elif tag == "c":
+                            cell_reference = element.get("r")
+                        continue
+
+                    if tag == "f":
+                        if not self.data_only and element.get("t") == "shared" and element.text and cell_reference:
+                            shared_formulae.setdefault(element.get("si"), Translator("=" + element.text, cell_reference))
+                        continue
+
+                    if tag != "row" or sheet_data is None:
+                        continue
+
+                    row_number: Optional[str] = element.get("r")
+                    row: int = int(row_number) if row_number else row_counter + 1
+                    row_counter = row
+
+                    if row in rows:
+                        result[row] = self._parse_row(element, row, column_indexes, shared_formulae)
+
+                    # 解析済みの行をsheetDataから取り除き、メモリ上に保持する行を1行のみにする
+                    sheet_data.clear()
+
+                    if row >= max_row:
+                        return result
+
+        return result
+
+
+    def _parse_row(self, row_element: Element, row: int, column_indexes: Set[int], shared_formulae: Dict[str, Translator]) -> Dict[int, Any]:
+        result: Dict[int, Any] = {}
+        column_counter: int = 0
+
+        for cell in row_element:
+
+            if _local_name(cell.tag) != "c":
+                continue
+
+            cell_reference: Optional[str] = cell.get("r")
+
+            if cell_reference:
+                _, column_index = _split_cell_reference(cell_reference)
+            else:
+                column_index = column_counter + 1
+
+            column_counter = column_index
+
+            if column_index in column_indexes:
+                result[column_index] = self._parse_cell(cell, row, column_index, shared_formulae)
+
+        return result
+
+
+    def _parse_cell(self, cell: Element, row: int, column_index: int, shared_formulae: Dict[str, Translator]) -> Any:
+        """_parse_cell
+
+        セルのXML要素から、openpyxlの読み取り専用モードと同じ型の値を取得する関数
+
+        """
+        data_type: str = cell.get("t", "n")
+        value: Optional[str] = None
+        inline_string: Optional[Element] = None
+
+        for child in cell:
+            child_tag: str = _local_name(child.tag)
+
+            if child_tag == "f":
+                if not self.data_only:
+                    return self._parse_formula(child, cell.get("r") or f"{get_column_letter(column_index)}{row}", shared_formulae)
+            elif child_tag == "v":
+                value = child.text or None
+            elif child_tag == "is":
+                inline_string = child
+
+        if data_type == "inlineStr":
+            return self._get_text(inline_string) if inline_string is not None else None
+
+        if value is None:
+            return None
+
+        if data_type == "n":
+            number = float(value) if "." in value or "E" in value or "e" in value else int(value)
+            style_id: int = int(cell.get("s", 0))
+
+            if style_id and style_id in self._get_date_formats():
+                try:
+                    return from_excel(number, self._epoch, timedelta=style_id in self._timedelta_formats)
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+
+            return number
+
+        if data_type == "s":
+            return self._get_shared_string(int(value))
+
+        if data_type == "b":
+            return bool(int(value))
+
+        if data_type == "d":
+            return from_ISO8601(value)
+
+        return value
+
+
+    @staticmethod
+    def _parse_formula(formula: Element, cell_reference: str, shared_formulae: Dict[str, Translator]) -> Any:
+        """_parse_formula
+
+        数式のXML要素から、openpyxlと同じく数式の文字列(配列数式・データテーブルはopenpyxlのオブジェクト)を取得する関数
+
+        Args:
+            formula (Element): 数式のXML要素
+            cell_reference (str): 数式が存在するセルの位置(A1形式)
+            shared_formulae (Dict[str, Translator]): 共有数式のインデックスをキーとする、共有数式の定義
+
+        Returns:
+            Any: 数式の文字列、またはArrayFormula、DataTableFormula
+
+        """
+        formula_type: Optional[str] = formula.get("t")
+        value: str = "=" + (formula.text or "")
+
+        if formula_type == "array":
+            return ArrayFormula(ref=formula.get("ref"), text=value)
+
+        if formula_type == "shared" and formula.text is None:
+            translator: Optional[Translator] = shared_formulae.get(formula.get("si"))
+            return translator.translate_formula(cell_reference) if translator is not None else value
+
+        if formula_type == "dataTable":
+            return DataTableFormula(**formula.attrib)
+
+        return value
+
+
+    def _get_shared_string(self, index: int) -> str:
+        """_get_shared_string
+
+        共有文字列をインデックスから取得する関数
+
+        Note:
+            sharedStrings.xmlは、指定したインデックスに到達するまでのみ読み込み、続きは次回の呼び出し時に読み込む。
+
+        """
+        if self._shared_strings_iterator is None:
+            self._shared_strings_iterator = self._iter_shared_strings()
+
+        while len(self._shared_strings) <= index:
+            self._shared_strings.append(next(self._shared_strings_iterator))
+
+        return self._shared_strings[index]
+
+
+    def _iter_shared_strings(self) -> Iterator[str]:
+        if self._shared_strings_part is None:
+            return
+
+        with self.archive.open(self._shared_strings_part) as source:
+
+            for _, element in iterparse(source, events=("end",)):
+
+                if _local_name(element.tag) == "si":
+                    yield self._get_text(element).replace("x005F_", "")
+                    element.clear()
+
+
+    def _get_date_formats(self) -> Set[int]:
+        """_get_date_formats
+
+        日付・時刻の表示形式が設定されたスタイルのインデックスを取得する関数
+
+        Note:
+            styles.xmlは、スタイルが設定された数値セルを初めて読み込む際に1度だけ読み込む。
+
+        """
+        if self._date_formats is not None:
+            return self._date_formats
+
+        self._date_formats = set()
+
+        if self._styles_part is None:
+            return self._date_formats
+
+        custom_formats: Dict[int, str] = {}
+        style_index: int = 0
+        in_cell_xfs: bool = False
+
+        with self.archive.open(self._styles_part) as source:
+
+            for event, element in iterparse(source, events=("start", "end")):
+
+                tag: str = _local_name(element.tag)
+
+                if tag == "cellXfs":
+                    in_cell_xfs = event == "start"
+
+                if event != "end":
+                    continue
+
+                if tag == "numFmt":
+                    custom_formats[int(element.get("numFmtId"))] = element.get("formatCode")
+
+                elif tag == "xf" and in_cell_xfs:
+                    number_format_id: int = int(element.get("numFmtId", 0))
+                    number_format: Optional[str] = custom_formats.get(number_format_id, BUILTIN_FORMATS.get(number_format_id))
+
+                    if number_format and is_date_format(number_format):
+                        self._date_formats.add(style_index)
+                    if number_format and is_timedelta_format(number_format):
+                        self._timedelta_formats.add(style_index)
+
+                    style_index += 1
+
+        return self._date_formats
+
+
+    def _parse_part(self, part: str, tag: Optional[str] = None) -> Iterator[Element]:
+        if part not in self.archive.NameToInfo:
+            return
+
+        with self.archive.open(part) as source:
+            for _, element in iterparse(source, events=("end",)):
+                if tag is None or _local_name(element.tag) == tag:
+                    yield element
+
+
+    @staticmethod
+    def _get_text(element: Element) -> str:
+        # ルビ(rPh)を除いた、t要素とr要素内のt要素の文字列を連結する
+        snippets: List[str] = []
+
+        for child in element:
+            tag: str = _local_name(child.tag)
+
+            if tag == "t":
+                snippets.append(child.text or "")
+            elif tag == "r":
+                snippets.extend(grandchild.text or "" for grandchild in child if _local_name(grandchild.tag) == "t")
+
+        return "".join(snippets)
+
+
+    @staticmethod
+    def _get_relationships_part(part: str) -> str:
+        directory, file_name = posixpath.split(part)
+        return posixpath.join(directory, "_rels", f"{file_name}.rels")
+
+
+    @staticmethod
+    def _resolve_target(source_part: str, target: str) -> str:
+        if target.startswith("/"):
+            return target.lstrip("/")
+
+        return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
@@ -0,0 +1,300 @@
+from typing import List, Dict, Any
+import datetime
+import zipfile
+import pytest
+import openpyxl
+from openpyxl.worksheet.formula import ArrayFormula
+
+from .parameter_locations_xlsx_impl import ParameterLocationsXlsxImpl
+from . import parameter_locations_xlsx_impl as parameter_locations_xlsx_impl_module
+from .parameter_locations_excel_impl import ParameterLocationsExcelImpl
+from .parameter_locations_excel_impl_exceptions import SheetNotExistError
+from src.domain.parameter_locations.parameter_locations import ParameterLocations, ParameterLocation, ParameterColumnLocation, ParameterLocationSource
+from src.domain.parameter_locations.parameter import Parameter, ParameterGroup
+
+
+@pytest.fixture
+def parameter_sheet_file(tmp_path) -> str:
+    workbook = openpyxl.Workbook()
+    worksheet = workbook.active
+    worksheet.title = "test_device"
+    worksheet["C2"] = "value1"
+    worksheet["C3"] = "value2"
+    worksheet["D3"] = 100
+    worksheet["E3"] = 1.5
+    worksheet["F3"] = True
+    worksheet["C5"] = datetime.datetime(2022, 4, 1, 12, 30)
+    worksheet["D5"] = datetime.time(8, 15)
+    worksheet["E5"] = "value1"
+    worksheet["F5"] = "=D3*2"
+    worksheet["AB10"] = "value3"
+    workbook.create_sheet("改版履歴")
+    file_name = str(tmp_path / "test_parameter_sheet.xlsx")
+    workbook.save(file_name)
+    return file_name
+
+
+@pytest.fixture
+def shared_strings_parameter_sheet_file(tmp_path) -> str:
+    # Excelが保存する形式と同様に、共有文字列(リッチテキスト・ルビを含む)、共有数式・配列数式と、
+    # mc:AlternateContent内で名前空間のプレフィックスを再宣言したシートを持つxlsxファイル
+    parts = {
+        "[Content_Types].xml": (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+            '</Types>'
+        ),
+        "_rels/.rels": (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/workbook.xml": (
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            '<sheets><sheet name="test_device" sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/sharedStrings.xml": (
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="3" uniqueCount="3">'
+            '<si><t>value1</t></si>'
+            '<si><r><t>val</t></r><r><rPr><b/></rPr><t>ue2</t></r></si>'
+            '<si><t>東京</t><rPh sb="0" eb="2"><t>トウキョウ</t></rPh></si>'
+            '</sst>'
+        ),
+        "xl/worksheets/sheet1.xml": (
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" '
+            'xmlns:x14ac="http://schemas.microsoft.com/office/spreadsheetml/2009/9/ac" mc:Ignorable="x14ac">'
+            '<mc:AlternateContent xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+            '<mc:Choice Requires="x14ac"><sheetPr/></mc:Choice>'
+            '</mc:AlternateContent>'
+            '<sheetData>'
+            '<row r="2" x14ac:dyDescent="0.4"><c r="C2" t="s"><v>0</v></c><c r="D2"><v>10</v></c></row>'
+            '<row r="3" x14ac:dyDescent="0.4"><c r="C3" t="s"><v>2</v></c><c r="D3" t="s"><v>1</v></c></row>'
+            '<row x14ac:dyDescent="0.4"><c t="s"><v>1</v></c><c/><c t="s"><v>0</v></c></row>'
+            '<row r="5"><c r="A5"><f t="shared" ref="A5:C5" si="0">D2*2</f><v>20</v></c>'
+            '<c r="B5"><f t="shared" si="0"/><v>0</v></c><c r="C5"><f t="shared" si="0"/><v>0</v></c>'
+            '<c r="D5"><f t="array" ref="D5">SUM(D2:D3)</f><v>10</v></c><c r="E5" t="str"><f>C2&amp;"x"</f><v>value1x</v></c></row>'
+            '</sheetData>'
+            '</worksheet>'
+        ),
+    }
+    file_name = str(tmp_path / "test_shared_strings_parameter_sheet.xlsx")
+    with zipfile.ZipFile(file_name, "w") as archive:
+        for part, xml in parts.items():
+            archive.writestr(part, '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>' + xml)
+    return file_name
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "sheet_name": "test_device",
+                    "parameter_locations": ParameterLocations(
+                        locations=[
+                            ParameterLocation(name="parameter1", cell_number="C2"),
+                            ParameterLocation(name="parameter2", cell_number="D3"),
+                            ParameterLocation(name="parameter3", cell_number="C4"),
+                            ParameterLocation(name="parameter4", cell_number="AB10")
+                        ]
+                    )
+                },
+                ParameterGroup(
+                    parameters=[
+                        Parameter(name="parameter1", value="value1"),
+                        Parameter(name="parameter2", value="100"),
+                        Parameter(name="parameter3", value=None),
+                        Parameter(name="parameter4", value="value3"),
+                    ]
+                ),
+                None
+        ),
+        # 1. unexisted sheet name
+        (
+                {
+                    "sheet_name": "test_device2",
+                    "parameter_locations": ParameterLocations(
+                        locations=[ParameterLocation(name="parameter1", cell_number="C2")]
+                    )
+                },
+                None,
+                SheetNotExistError
+        ),
+    ]
+)
+def test_read(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: ParameterGroup, test_exception_result: Exception):
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(parameter_sheet_file)
+    if test_result:
+        assert parameter_locations_xlsx_impl.read(test_input["sheet_name"], test_input["parameter_locations"]) == test_result
+        assert parameter_locations_xlsx_impl.get_sheets() == ["test_device", "改版履歴"]
+    else:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_xlsx_impl.read(test_input["sheet_name"], test_input["parameter_locations"])
+    parameter_locations_xlsx_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct
+        (
+                {
+                    "sheet_name": "test_device",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[
+                            ParameterColumnLocation(name="parameter1", column_number="C"),
+                            ParameterColumnLocation(name="parameter2", column_number="D"),
+                        ],
+                        row_from=2,
+                        row_to=4
+                    )
+                },
+                [
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value="value1"), Parameter(name="parameter2", value=None)]),
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value="value2"), Parameter(name="parameter2", value="100")]),
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value=None), Parameter(name="parameter2", value=None)]),
+                ],
+                None
+        ),
+        # 1. rows beyond the last row of the sheet
+        (
+                {
+                    "sheet_name": "改版履歴",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[ParameterColumnLocation(name="parameter1", column_number="C")],
+                        row_from=1,
+                        row_to=2
+                    )
+                },
+                [
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value=None)]),
+                    ParameterGroup(parameters=[Parameter(name="parameter1", value=None)]),
+                ],
+                None
+        ),
+        # 2. unexisted sheet name
+        (
+                {
+                    "sheet_name": "test_device2",
+                    "parameter_location_source": ParameterLocationSource(
+                        parameter_column_locations=[ParameterColumnLocation(name="parameter1", column_number="C")],
+                        row_from=2,
+                        row_to=2
+                    )
+                },
+                None,
+                SheetNotExistError
+        ),
+    ]
+)
+def test_read_range(parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[ParameterGroup], test_exception_result: Exception):
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(parameter_sheet_file)
+    if test_result:
+        assert parameter_locations_xlsx_impl.read_range(test_input["sheet_name"], test_input["parameter_location_source"]) == test_result
+    else:
+        with pytest.raises(test_exception_result):
+            _ = parameter_locations_xlsx_impl.read_range(test_input["sheet_name"], test_input["parameter_location_source"])
+    parameter_locations_xlsx_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input", [
+        # 0. strings, numbers, booleans, dates and formulas
+        {"data_only": False, "sheet_name": "test_device", "rows": [2, 3, 5], "columns": ["C", "D", "E", "F"]},
+        # 1. strings, numbers, booleans, dates and cached values of formulas
+        {"data_only": True, "sheet_name": "test_device", "rows": [2, 3, 5], "columns": ["C", "D", "E", "F"]},
+        # 2. unordered rows and columns beyond the last column
+        {"data_only": False, "sheet_name": "test_device", "rows": [10, 1, 3], "columns": ["AB", "D", "AC"]},
+        # 3. empty sheet
+        {"data_only": False, "sheet_name": "改版履歴", "rows": [1, 2], "columns": ["A"]},
+    ]
+)
+def test_read_matrix(parameter_sheet_file: str, test_input: Dict[str, Any]):
+    # openpyxlの読み取り専用モードで取得した値と一致すること
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(parameter_sheet_file, data_only=test_input["data_only"])
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(parameter_sheet_file, data_only=test_input["data_only"])
+
+    xlsx_matrix = parameter_locations_xlsx_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"])
+    excel_matrix = parameter_locations_excel_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"])
+
+    assert xlsx_matrix.values == excel_matrix.values
+    assert [type(value) for value in xlsx_matrix.values] == [type(value) for value in excel_matrix.values]
+
+    parameter_locations_xlsx_impl.close()
+    parameter_locations_excel_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input", [
+        # 0. rows split across chunks
+        {"read_chunk_size": 7, "sheet_name": "test_device", "rows": [2, 3, 5, 10], "columns": ["C", "D", "E", "F", "AB"]},
+        # 1. empty sheet split across chunks
+        {"read_chunk_size": 7, "sheet_name": "改版履歴", "rows": [1], "columns": ["A"]},
+    ]
+)
+def test_read_matrix_chunks(parameter_sheet_file: str, test_input: Dict[str, Any], monkeypatch):
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(parameter_sheet_file)
+    expected_values = parameter_locations_xlsx_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"]).values
+
+    monkeypatch.setattr(parameter_locations_xlsx_impl_module, "READ_CHUNK_SIZE", test_input["read_chunk_size"])
+
+    assert parameter_locations_xlsx_impl.read_matrix(test_input["sheet_name"], test_input["rows"], test_input["columns"]).values == expected_values
+    parameter_locations_xlsx_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result", [
+        # 0. shared strings, rich text and phonetic runs
+        ({"rows": [2, 3], "columns": ["C", "D"]}, ["value1", 10, "東京", "value2"]),
+        # 1. rows and cells without references
+        ({"rows": [4], "columns": ["A", "B", "C"]}, ["value2", None, "value1"]),
+        # 2. rows beyond the last row of the sheet
+        ({"rows": [3, 20], "columns": ["C"]}, ["東京", None]),
+    ]
+)
+def test_read_matrix_shared_strings(shared_strings_parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[Any], monkeypatch):
+    monkeypatch.setattr(parameter_locations_xlsx_impl_module, "READ_CHUNK_SIZE", 16)
+
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(shared_strings_parameter_sheet_file)
+    assert parameter_locations_xlsx_impl.read_matrix("test_device", test_input["rows"], test_input["columns"]).values == test_result
+    parameter_locations_xlsx_impl.close()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result", [
+        # 0. formulas(shared formulas are translated to each cell)
+        ({"data_only": False, "rows": [5], "columns": ["A", "B", "C", "E"]}, ["=D2*2", "=E2*2", "=F2*2", '=C2&"x"']),
+        # 1. shared formula whose definition is in an unrequested column
+        ({"data_only": False, "rows": [5], "columns": ["C"]}, ["=F2*2"]),
+        # 2. cached values
+        ({"data_only": True, "rows": [5], "columns": ["A", "B", "C", "D", "E"]}, [20, 0, 0, 10, "value1x"]),
+    ]
+)
+def test_read_matrix_formulas(shared_strings_parameter_sheet_file: str, test_input: Dict[str, Any], test_result: List[Any]):
+    # openpyxlの読み取り専用モードで取得した値と一致すること
+    parameter_locations_xlsx_impl = ParameterLocationsXlsxImpl(shared_strings_parameter_sheet_file, data_only=test_input["data_only"])
+    parameter_locations_excel_impl = ParameterLocationsExcelImpl(shared_strings_parameter_sheet_file, data_only=test_input["data_only"])
+
+    values = parameter_locations_xlsx_impl.read_matrix("test_device", test_input["rows"], test_input["columns"]).values
+    assert values == test_result
+    assert values == parameter_locations_excel_impl.read_matrix("test_device", test_input["rows"], test_input["columns"]).values
+
+    # 配列数式はopenpyxlと同じくArrayFormulaとして取得すること
+    if not test_input["data_only"]:
+        array_formula = parameter_locations_xlsx_impl.read_matrix("test_device", [5], ["D"]).values[0]
+        assert (type(array_formula), array_formula.ref, array_formula.text) == (ArrayFormula, "D5", "=SUM(D2:D3)")
+
+    parameter_locations_xlsx_impl.close()
+    parameter_locations_excel_impl.close()
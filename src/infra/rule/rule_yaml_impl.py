@@ -6,11 +6,15 @@ import yaml
 logger = get_custom_logger(__name__)
 
 
+# libyamlが利用可能な場合は、C実装のローダーを使用する
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 class RuleYamlImpl(RuleRepository):
     def __init__(self, rule_file: str) -> None:
         super(RuleYamlImpl, self).__init__(rule_file)
 
     def read(self) -> Rule:
         with open(self.rule_file, "r", encoding="UTF-8") as f:
-            raw_rule = yaml.safe_load(f)
+            raw_rule = yaml.load(f, Loader=YamlLoader)
         return Rule(**raw_rule)
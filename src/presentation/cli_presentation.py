@@ -3,7 +3,7 @@ import os
 from typing import Dict
 
 from .abstract_presentation import AbstractPresentation
-from .presentation_exception import CommandNotExistError, RequiredFileNotExistError
+from .presentation_exception import CommandNotExistError, RequiredFileNotExistError, InvalidWorkersError
 from src.utils.logger import get_custom_logger
 
 logger = get_custom_logger(__name__)
@@ -34,6 +34,10 @@ class CliPresentation(AbstractPresentation):
         run_parser.add_argument("-rf", "--rule_file",  required=True, help="コンフィグの変換をするモデル名を指定して下さい。")
         run_parser.add_argument("-op", "--output_path", required=True, help="作成ファイルの出力先を指定してください。")
         run_parser.add_argument("-es", "--exception_sheets",  type=exceptional_sheets_lambda, help="パラメーターシートがエクセルの場合、コンフィグ作成時に参照しないエクセルのシートを指定して下さい。")
+        run_parser.add_argument("-w", "--workers", type=int, help="コンフィグを並列に作成するプロセス数を指定して下さい。デフォルトは、パラメータシートがファイルの場合は1(並列化しない)、ディレクトリの場合はCPU数です。")
+        run_parser.add_argument("-cd", "--cache_dir", help="パラメータシートから取得した値と検証済みのルールをキャッシュするディレクトリを指定して下さい。指定した場合、内容が変更されていないパラメータシートとルールファイルは読み込まずにキャッシュから取得します。")
+        run_parser.add_argument("-af", "--archive_format", choices=["tar", "tar.gz", "tar.bz2", "tar.xz", "zip"], help="全てのコンフィグを1つのアーカイブに出力する場合に、アーカイブの形式を指定して下さい。指定した場合、出力先にconfigs_<作成日時>.<形式>を作成し、各デバイスのコンフィグとmanifest.jsonを格納します。")
+        run_parser.add_argument("-inc", "--incremental", action="store_true", help="前回から変更されたデバイスのみコンフィグを作成する場合に指定して下さい。指定した場合、コンフィグは<デバイス名>.logとして出力し、出力先のmanifest.jsonに記録したフィンガープリントが一致するデバイスは作成を省略します。")
         args = parser.parse_args()
 
         return args
@@ -59,6 +63,9 @@ class CliPresentation(AbstractPresentation):
             if not os.path.exists(args[file_type]):
                 raise RequiredFileNotExistError({"file_type": file_type, "file_path": args[file_type]})
 
+        if args["workers"] is not None and args["workers"] < 1:
+            raise InvalidWorkersError({"workers": args["workers"]})
+
         logger.debug(f"The result of getting args from cli commands is {args}")
         logger.debug("Getting args from cli commands has been completed successfully")
 
@@ -9,4 +9,8 @@ class CommandNotExistError(CLIPresentationError):
 
 
 class RequiredFileNotExistError(CLIPresentationError):
-    ja_message = "{file_type}: {file_path}が存在しません。"
\ No newline at end of file
+    ja_message = "{file_type}: {file_path}が存在しません。"
+
+
+class InvalidWorkersError(CLIPresentationError):
+    ja_message = "ワーカー数({workers})には1以上の整数を指定して下さい。"
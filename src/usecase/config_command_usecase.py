@@ -1,12 +1,26 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import List, Type
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+from src.domain.cache.cache_repository import CacheRepository
+from src.domain.config.buffered_config_repository import BufferedConfigRepository
 from src.domain.config.config import Config, ConfigSource
 from src.domain.config.config_repository import ConfigRepository
-from src.domain.parameter_locations.parameter import ParameterGroup
-from src.domain.parameter_locations.parameter_locations_repository import ParameterLocationsRepository, ParameterLocations
+from src.domain.parameter_locations.parameter_frame import ParameterFrame
+from src.domain.parameter_locations.parameter_cell_matrix import ParameterCellMatrix
+from src.domain.parameter_locations.cached_parameter_locations_repository import CachedParameterLocationsRepository
+from src.domain.parameter_locations.parameter_locations_repository import ParameterLocationsRepository
+from src.domain.parameter_locations.parameter_locations_exceptions import ParameterSheetNotExistError
+from src.domain.rule.cached_rule_repository import CachedRuleRepository
+from src.domain.rule.render_memo import RenderMemo
+from src.domain.rule.rule import Rule
 from src.domain.rule.rule_repository import RuleRepository
+from src.utils.custom_error import CustomError
 from src.utils.logger import get_custom_logger
+from .config_command_usecase_exceptions import DeviceConfigCreationError
+import hashlib
+import multiprocessing.util
 import os
 import pprint
 
@@ -14,80 +28,582 @@ import pprint
 logger = get_custom_logger(__name__)
 
 
+# ワーカーのプロセス内で、デバイスをまたいで開いたままにするパラメータシートなど
+_worker_state: Dict[str, Any] = {}
+
+
+def _initialize_worker() -> None:
+    # ワーカーの終了時に、開いたままのパラメータシートを閉じる(キャッシュの整理を含む)
+    _worker_state.clear()
+    multiprocessing.util.Finalize(None, _close_worker_state, exitpriority=10)
+
+
+def _close_worker_state() -> None:
+    parameter_locations_repo_inst: Optional[ParameterLocationsRepository] = _worker_state.get("parameter_locations_repo_inst")
+
+    _worker_state.clear()
+
+    if parameter_locations_repo_inst is not None:
+        parameter_locations_repo_inst.close()
+
+
 class AbstractConfigCommandUsecase(ABC):
-    def __init__(self, config_repo: Type[ConfigRepository], parameter_locations_repo: Type[ParameterLocationsRepository], rule_repo: Type[RuleRepository]) -> None:
+    def __init__(self, config_repo: Type[ConfigRepository], parameter_locations_repo: Type[ParameterLocationsRepository], rule_repo: Type[RuleRepository], cache_repo: Optional[Type[CacheRepository]] = None, archive_config_repo: Optional[Type[ConfigRepository]] = None) -> None:
         self.config_repo               = config_repo
         self.parameter_locations_repo  = parameter_locations_repo
         self.rule_repo                 = rule_repo
+        self.cache_repo                = cache_repo
+        self.archive_config_repo       = archive_config_repo
 
     @abstractmethod
-    def create_config(self, config_sample_file: str, parameter_sheet_file: str, rule_file: str, output_path: str, exception_sheets: list) -> None:
+    def create_config(self, config_sample_file: str, parameter_sheet_file: str, rule_file: str, output_path: str, exception_sheets: list, workers: Optional[int] = None, cache_dir: Optional[str] = None, archive_format: Optional[str] = None, incremental: bool = False) -> None:
         raise NotImplementedError("The 'create_config' method of AbstractConfigCommandUsecase must be implemented")
 
 
 class ConfigCommandUsecase(AbstractConfigCommandUsecase):
-    def __init__(self,  config_repo: Type[ConfigRepository], parameter_locations_repo: Type[ParameterLocationsRepository], rule_repo: Type[RuleRepository]) -> None:
-        super().__init__(config_repo, parameter_locations_repo, rule_repo)
+    def __init__(self,  config_repo: Type[ConfigRepository], parameter_locations_repo: Type[ParameterLocationsRepository], rule_repo: Type[RuleRepository], cache_repo: Optional[Type[CacheRepository]] = None, archive_config_repo: Optional[Type[ConfigRepository]] = None) -> None:
+        super().__init__(config_repo, parameter_locations_repo, rule_repo, cache_repo, archive_config_repo)
         
-    def create_config(self, config_sample_file: str, parameter_sheet_file: str, rule_file: str, output_path: str, exception_sheets: list) -> None:
+    def create_config(self, config_sample_file: str, parameter_sheet_file: str, rule_file: str, output_path: str, exception_sheets: list, workers: Optional[int] = None, cache_dir: Optional[str] = None, archive_format: Optional[str] = None, incremental: bool = False) -> None:
+
+        logger.info(f"Starting create_config(config_sample_file={config_sample_file}, parameter_sheet_file={parameter_sheet_file}, rule_file={rule_file}, output_path={output_path}, exception_sheets={exception_sheets}, workers={workers}, cache_dir={cache_dir}, archive_format={archive_format}, incremental={incremental})...")
+
+        cache_repo_inst: Optional[CacheRepository] = None
 
-        logger.info(f"Starting create_config(config_sample_file={config_sample_file}, parameter_sheet_file={parameter_sheet_file}, rule_file={rule_file}, output_path={output_path}, exception_sheets={exception_sheets})...")
+        if cache_dir and self.cache_repo:
 
-        rule_repo_inst                  = self.rule_repo(rule_file=rule_file)
+            cache_repo_inst = self.cache_repo(cache_dir=cache_dir)
+
+            logger.info(f"Instantiating cache_repo(cache_dir={cache_dir}) has been completed")
+
+        rule_repo_inst                  = self._open_rule_repo(rule_file=rule_file, cache_repo_inst=cache_repo_inst)
         rule_object                     = rule_repo_inst.read()
-        converter_rules                 = rule_object.converter_rules
-        common_parameter                = rule_object.common_parameter
 
-        logger.info(f"Getting rule from ({parameter_sheet_file}) has been completed")
-    
-        parameter_locations_repo_inst = self.parameter_locations_repo(parameter_sheet_file=parameter_sheet_file)
+        logger.info(f"Getting rule from ({rule_file}) has been completed")
+
+        if archive_format and self.archive_config_repo:
+
+            # 全てのコンフィグを出力先ディレクトリ直下の1つのアーカイブに出力する
+            archive_file: str = os.path.join(output_path, f"configs_{datetime.now().strftime('%Y%m%d%H%M%S')}.{archive_format}")
+
+            config_repo_inst = self.archive_config_repo(config_sample_file=config_sample_file, archive_file=archive_file, archive_format=archive_format)
 
-        logger.info(f"Instantiating parameter_locations_repo(parameter_sheet_file={parameter_sheet_file}) has been completed")
+            logger.info(f"Instantiating archive_config_repo(config_sample_file={config_sample_file}, archive_file={archive_file}) has been completed")
 
-        config_repo_inst = self.config_repo(config_sample_file=config_sample_file)
+        else:
 
-        logger.info(f"Instantiating config_repo(config_sample_file={config_sample_file}) has been completed")
+            config_repo_inst = self.config_repo(config_sample_file=config_sample_file)
 
-        for device_name in self.get_sheets(parameter_locations_repo_inst.get_sheets(), exception_sheets):
+            logger.info(f"Instantiating config_repo(config_sample_file={config_sample_file}) has been completed")
 
-            output_file: str = os.path.join(output_path, f"{device_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}.log")
+        # ディレクトリが指定された場合は、配下の全パラメータシートをワークブック単位の出力先に振り分ける
+        if os.path.isdir(parameter_sheet_file):
 
-            config_sources: List[ConfigSource] = []
+            parameter_sheet_jobs: List[Tuple[str, str]] = [
+                (file, os.path.join(output_path, os.path.splitext(os.path.relpath(file, parameter_sheet_file))[0]))
+                for file in self.get_parameter_sheet_files(parameter_sheet_file)
+            ]
 
-            for converter_rule in converter_rules.values():
+            workers = workers or os.cpu_count() or 1
 
-                parameter_group_list: List[ParameterGroup] = []
+        else:
 
-                parameter_locations_list: List[ParameterLocations] = converter_rule.data.convert_to_parameter_locations_list()
+            parameter_sheet_jobs = [(parameter_sheet_file, output_path)]
 
-                for parameter_locations in parameter_locations_list:
-                
-                    parameter_group = parameter_locations_repo_inst.read(sheet_name=device_name, parameter_locations=parameter_locations)
+            workers = workers or 1
 
-                    logger.info(f"Getting parameter_group({parameter_group}) has been completed successfully")
-                
-                    if parameter_group.is_all_required_params_available():
-            
-                        parameter_group_list.append(parameter_group)
+        # 差分作成の場合は、ルールファイルとConfigSampleFileの内容をデバイスごとのフィンガープリントに含める
+        source_fingerprint: Optional[str] = None
 
-                        logger.info(f"parameter_group({parameter_group}) has been validated")
+        if incremental:
 
-                config_source = converter_rule.make_config_source(
-                    parameter_group_list=parameter_group_list,
-                    common_parameter=common_parameter
+            source_fingerprint = hashlib.sha256(
+                f"{CacheRepository.hash_file(rule_file)}:{CacheRepository.hash_file(config_sample_file)}".encode("utf-8")
+            ).hexdigest()
+
+        # 作成したコマンド群を再利用するキャッシュ、並列処理では各ワーカーで参照した回数のみを集計する
+        render_memo: RenderMemo = RenderMemo()
+
+        logger.info(f"Creating configs from {len(parameter_sheet_jobs)} parameter_sheet_files with {workers} workers...")
+
+        try:
+            if workers > 1:
+
+                fingerprints: Dict[str, Dict[str, str]] = self._create_configs_in_parallel(
+                    parameter_sheet_jobs=parameter_sheet_jobs,
+                    config_repo_inst=config_repo_inst,
+                    rule_object=rule_object,
+                    exception_sheets=exception_sheets or [],
+                    workers=workers,
+                    cache_repo_inst=cache_repo_inst,
+                    source_fingerprint=source_fingerprint,
+                    render_memo=render_memo
                 )
 
-                config_sources.append(config_source)
+            else:
 
-            config_repo_inst.write(
-                config=Config(config_sources=config_sources),
-                output_config_file=output_file
-            )
+                fingerprints = {}
 
-            logger.info(f"Writing {device_name} config in {output_file} has been completed successfully")
+                for job_parameter_sheet_file, job_output_path in parameter_sheet_jobs:
+
+                    fingerprints[job_output_path] = self._create_configs_of_parameter_sheet(
+                        parameter_sheet_file=job_parameter_sheet_file,
+                        config_repo_inst=config_repo_inst,
+                        rule_object=rule_object,
+                        device_names=None,
+                        exception_sheets=exception_sheets or [],
+                        output_path=job_output_path,
+                        cache_repo_inst=cache_repo_inst,
+                        source_fingerprint=source_fingerprint,
+                        render_memo=render_memo
+                    )
+
+            if incremental:
+
+                for job_output_path, job_fingerprints in fingerprints.items():
+
+                    config_repo_inst.write_manifest(job_output_path, job_fingerprints)
+
+        except Exception:
+
+            config_repo_inst.abort()
+
+            raise
+
+        config_repo_inst.close()
+
+        logger.info(f"Reusing commands_groups: {render_memo.hits} hits, {render_memo.misses} misses (hit rate {render_memo.hit_rate:.1%})")
 
         logger.info(f"Creating config from {parameter_sheet_file} has been completed successfully")
 
+    def create_device_configs(self, parameter_locations_repo_inst: ParameterLocationsRepository, config_repo_inst: ConfigRepository, rule_object: Rule, device_names: List[str], output_path: str, source_fingerprint: Optional[str] = None, render_memo: Optional[RenderMemo] = None) -> Dict[str, str]:
+        """create_device_configs
+
+        指定したデバイス(シート)ごとにコンフィグを作成して出力する関数
+
+        Args:
+            parameter_locations_repo_inst (:obj:`ParameterLocationsRepository`): パラメータシートを開いたリポジトリ
+            config_repo_inst (:obj:`ConfigRepository`): コンフィグを出力するリポジトリ
+            rule_object (:obj:`Rule`): パラメータシートからパラメータを取り出すルール
+            device_names (List[str]): コンフィグを作成するデバイス名(シート名)の配列
+            output_path (str): コンフィグの出力先ディレクトリ
+            source_fingerprint (Optional[str]): ルールファイルとConfigSampleFileのハッシュ値、指定した場合は差分作成とする
+            render_memo (Optional[:obj:`RenderMemo`]): 作成したコマンド群を再利用するキャッシュ、指定しない場合は本関数の呼び出し内でのみ再利用する
+
+        Returns:
+            Dict[str, str]: デバイス名からフィンガープリントを参照する辞書、差分作成でない場合は空の辞書
+
+        Raises:
+            DeviceConfigCreationError: コンフィグ作成中にエラーが発生した場合、デバイス名を付与して送出する。
+
+        """
+        converter_rules = rule_object.converter_rules
+        common_parameter = rule_object.common_parameter
+
+        # 全てのConverterRuleが参照する行・列のみを読み込み、それ以外の行はパラメータシートから読み飛ばす
+        required_rows, required_columns = rule_object.required_rows, rule_object.required_columns
+
+        # 差分作成の場合は、前回の出力を再利用するため出力ファイル名に作成日時を含めない
+        previous_fingerprints: Dict[str, str] = config_repo_inst.read_manifest(output_path) if source_fingerprint else {}
+        fingerprints: Dict[str, str] = {}
+
+        # 同じ値を持つデバイス間で、ルールごとに作成したコマンド群を再利用する
+        if render_memo is None:
+            render_memo = RenderMemo()
+
+        for device_name in device_names:
+
+            try:
+                if source_fingerprint:
+                    output_file: str = os.path.join(output_path, f"{device_name}.log")
+                else:
+                    output_file = os.path.join(output_path, f"{device_name}_{datetime.now().strftime('%Y%m%d%H%M%S')}.log")
+
+                config_sources: List[ConfigSource] = []
+
+                parameter_cell_matrix: ParameterCellMatrix = parameter_locations_repo_inst.read_matrix(sheet_name=device_name, rows=required_rows, columns=required_columns)
+
+                logger.info(f"Getting parameter_cell_matrix of {device_name} has been completed successfully")
+
+                if source_fingerprint:
+
+                    fingerprints[device_name] = hashlib.sha256(f"{source_fingerprint}:{parameter_cell_matrix.fingerprint()}".encode("utf-8")).hexdigest()
+
+                    if previous_fingerprints.get(device_name) == fingerprints[device_name] and config_repo_inst.exists(output_file):
+
+                        logger.info(f"Skipping {device_name} because the parameters, the rule and the config_sample_file have not been changed since {output_file} was written")
+
+                        continue
+
+                for converter_rule in converter_rules.values():
+
+                    # ルールの範囲の全ての行を列ごとの値の配列として取得し、まとめてコマンドを作成する
+                    parameter_frame: ParameterFrame = parameter_cell_matrix.get_parameter_frame(converter_rule.data)
+                    parameter_frame = parameter_frame.select(parameter_frame.is_all_required_params_available())
+
+                    logger.info(f"Getting parameter_frame({len(parameter_frame)} rows) of {converter_rule.marker} has been completed successfully")
+
+                    config_source = converter_rule.make_config_source_batch(
+                        parameter_frame=parameter_frame,
+                        common_parameter=common_parameter,
+                        render_memo=render_memo
+                    )
+
+                    config_sources.append(config_source)
+
+                # markerの重複はRuleのバリデーションで検証済みのため、Configのバリデーションを省略する
+                config_repo_inst.write(
+                    config=Config.construct(config_sources=config_sources),
+                    output_config_file=output_file,
+                    device_name=device_name
+                )
+
+                # デバイス単位でセルのキャッシュを解放する
+                del parameter_cell_matrix
+
+            except Exception as e:
+
+                raise DeviceConfigCreationError(
+                    {
+                        "parameter_sheet_file": parameter_locations_repo_inst.parameter_sheet_file,
+                        "device_name": device_name,
+                        "error": e.get_ja_message() if isinstance(e, CustomError) else str(e)
+                    }
+                ) from e
+
+            logger.info(f"Writing {device_name} config in {output_file} has been completed successfully")
+
+        return fingerprints
+
+    def _create_configs_in_parallel(self, parameter_sheet_jobs: List[Tuple[str, str]], config_repo_inst: ConfigRepository, rule_object: Rule, exception_sheets: List[str], workers: int, cache_repo_inst: Optional[CacheRepository] = None, source_fingerprint: Optional[str] = None, render_memo: Optional[RenderMemo] = None) -> Dict[str, Dict[str, str]]:
+        """_create_configs_in_parallel
+
+        パラメータシートとデバイス(シート)をワーカー数で分割し、プロセスプールでコンフィグを並列に作成する関数
+
+        Args:
+            parameter_sheet_jobs (List[Tuple[str, str]]): パラメータシートのパスと出力先ディレクトリの組の配列
+            config_repo_inst (:obj:`ConfigRepository`): コンフィグを出力するリポジトリ
+            rule_object (:obj:`Rule`): パラメータシートからパラメータを取り出すルール
+            exception_sheets (List[str]): コンフィグ作成に用いないシート名の配列
+            workers (int): ワーカー数
+            cache_repo_inst (Optional[:obj:`CacheRepository`]): セルの値をキャッシュするリポジトリ
+            source_fingerprint (Optional[str]): ルールファイルとConfigSampleFileのハッシュ値、指定した場合は差分作成とする
+            render_memo (Optional[:obj:`RenderMemo`]): 親プロセスのキャッシュ、各ワーカーで参照した回数を加算する
+
+        Returns:
+            Dict[str, Dict[str, str]]: 出力先ディレクトリごとの、デバイス名からフィンガープリントを参照する辞書
+
+        Note:
+            パラメータシートの数がワーカー数以上の場合は、パラメータシート単位でワーカーに割り当てる。
+            それ以外の場合は、各パラメータシートのデバイスを分割して割り当てる。
+            各ワーカーは担当するデバイス群に対してパラメータシートを1度だけ開く。
+            いずれかのワーカーでエラーが発生した場合、未着手のワーカーを取り消した上でエラーを送出する。
+            出力先が同時に書き込めない場合は、デバイス単位でワーカーに割り当て、親プロセスが完了した順に書き込む。
+
+        """
+        tasks: List[Tuple[str, Optional[List[str]], str]] = []
+
+        if len(parameter_sheet_jobs) >= workers:
+
+            tasks = [(job_parameter_sheet_file, None, job_output_path) for job_parameter_sheet_file, job_output_path in parameter_sheet_jobs]
+
+        else:
+
+            split_count: int = -(-workers // len(parameter_sheet_jobs))
+
+            for job_parameter_sheet_file, job_output_path in parameter_sheet_jobs:
+
+                parameter_locations_repo_inst = self._open_parameter_locations_repo(job_parameter_sheet_file, cache_repo_inst)
+                device_names: List[str] = self.get_sheets(parameter_locations_repo_inst.get_sheets(), exception_sheets)
+                parameter_locations_repo_inst.close()
+
+                tasks.extend(
+                    (job_parameter_sheet_file, device_names[i::split_count], job_output_path)
+                    for i in range(split_count) if device_names[i::split_count]
+                )
+
+        fingerprints: Dict[str, Dict[str, str]] = {job_output_path: {} for _, job_output_path in parameter_sheet_jobs}
+
+        if len(tasks) <= 1:
+
+            for task_parameter_sheet_file, task_device_names, task_output_path in tasks:
+                fingerprints[task_output_path] = self._create_configs_of_parameter_sheet(task_parameter_sheet_file, config_repo_inst, rule_object, task_device_names, exception_sheets, task_output_path, cache_repo_inst, source_fingerprint, render_memo)
+
+            return fingerprints
+
+        if render_memo is None:
+            render_memo = RenderMemo()
+
+        logger.info(f"Creating configs with {len(tasks)} tasks in {min(workers, len(tasks))} workers...")
+
+        if not config_repo_inst.concurrent_writable:
+
+            # 同時に書き込めない出力先の場合は、デバイス単位で作成したコンフィグの内容を完了した順に親プロセスで書き込む
+            device_tasks: List[Tuple[str, str, str]] = []
+
+            for task_parameter_sheet_file, task_device_names, task_output_path in tasks:
+
+                if task_device_names is None:
+                    parameter_locations_repo_inst = self._open_parameter_locations_repo(task_parameter_sheet_file, cache_repo_inst)
+                    task_device_names = self.get_sheets(parameter_locations_repo_inst.get_sheets(), exception_sheets)
+                    parameter_locations_repo_inst.close()
+
+                device_tasks.extend((task_parameter_sheet_file, device_name, task_output_path) for device_name in task_device_names)
+
+            # ワーカーがパラメータシートを開き直さないよう、パラメータシートの順に割り当てる
+            device_tasks.sort(key=lambda device_task: device_task[0])
+
+            self._write_device_configs_in_parallel(device_tasks, config_repo_inst, rule_object, workers, fingerprints, render_memo, cache_repo_inst, source_fingerprint)
+
+            return fingerprints
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+
+            futures: Dict[Future, str] = {
+                executor.submit(
+                    self._create_configs_of_parameter_sheet_in_worker,
+                    task_parameter_sheet_file,
+                    config_repo_inst,
+                    rule_object,
+                    task_device_names,
+                    exception_sheets,
+                    task_output_path,
+                    cache_repo_inst,
+                    source_fingerprint
+                ): task_output_path for task_parameter_sheet_file, task_device_names, task_output_path in tasks
+            }
+
+            try:
+                for future in as_completed(futures):
+                    task_fingerprints, hits, misses = future.result()
+
+                    fingerprints[futures[future]].update(task_fingerprints)
+                    render_memo.add_counts(hits, misses)
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return fingerprints
+
+    def _create_configs_of_parameter_sheet(self, parameter_sheet_file: str, config_repo_inst: ConfigRepository, rule_object: Rule, device_names: Optional[List[str]], exception_sheets: List[str], output_path: str, cache_repo_inst: Optional[CacheRepository] = None, source_fingerprint: Optional[str] = None, render_memo: Optional[RenderMemo] = None) -> Dict[str, str]:
+        """_create_configs_of_parameter_sheet
+
+        パラメータシートを1度だけ開き、指定したデバイス(シート)群のコンフィグを作成する関数
+
+        Returns:
+            Dict[str, str]: デバイス名からフィンガープリントを参照する辞書、差分作成でない場合は空の辞書
+
+        Note:
+            device_namesがNoneの場合、exception_sheetsを除く全シートをデバイスとして扱う。
+
+        """
+        parameter_locations_repo_inst = self._open_parameter_locations_repo(parameter_sheet_file, cache_repo_inst)
+
+        try:
+            if device_names is None:
+                device_names = self.get_sheets(parameter_locations_repo_inst.get_sheets(), exception_sheets)
+
+            config_repo_inst.make_output_dir(output_path)
+
+            fingerprints: Dict[str, str] = self.create_device_configs(
+                parameter_locations_repo_inst=parameter_locations_repo_inst,
+                config_repo_inst=config_repo_inst,
+                rule_object=rule_object,
+                device_names=device_names,
+                output_path=output_path,
+                source_fingerprint=source_fingerprint,
+                render_memo=render_memo
+            )
+        finally:
+            parameter_locations_repo_inst.close()
+
+        logger.info(f"Creating configs of {len(device_names)} devices from {parameter_sheet_file} has been completed successfully")
+
+        return fingerprints
+
+    def _create_configs_of_parameter_sheet_in_worker(self, parameter_sheet_file: str, config_repo_inst: ConfigRepository, rule_object: Rule, device_names: Optional[List[str]], exception_sheets: List[str], output_path: str, cache_repo_inst: Optional[CacheRepository] = None, source_fingerprint: Optional[str] = None) -> Tuple[Dict[str, str], int, int]:
+        """_create_configs_of_parameter_sheet_in_worker
+
+        ワーカーで_create_configs_of_parameter_sheetを呼び出し、作成したコマンド群のキャッシュを参照した回数と共に返す関数
+
+        Returns:
+            Tuple[Dict[str, str], int, int]: デバイス名からフィンガープリントを参照する辞書、キャッシュのヒット数、ミス数
+
+        """
+        render_memo: RenderMemo = RenderMemo()
+
+        fingerprints: Dict[str, str] = self._create_configs_of_parameter_sheet(
+            parameter_sheet_file, config_repo_inst, rule_object, device_names, exception_sheets, output_path, cache_repo_inst, source_fingerprint, render_memo
+        )
+
+        return fingerprints, render_memo.hits, render_memo.misses
+
+    def _write_device_configs_in_parallel(self, device_tasks: List[Tuple[str, str, str]], config_repo_inst: ConfigRepository, rule_object: Rule, workers: int, fingerprints: Dict[str, Dict[str, str]], render_memo: RenderMemo, cache_repo_inst: Optional[CacheRepository] = None, source_fingerprint: Optional[str] = None) -> None:
+        """_write_device_configs_in_parallel
+
+        デバイス単位でワーカーにコンフィグの内容を作成させ、完了した順に親プロセスで出力先に書き込む関数
+
+        Args:
+            device_tasks (List[Tuple[str, str, str]]): パラメータシートのパス、デバイス名、出力先ディレクトリの組の配列
+            config_repo_inst (:obj:`ConfigRepository`): 同時に書き込めないコンフィグの出力先
+            rule_object (:obj:`Rule`): パラメータシートからパラメータを取り出すルール
+            workers (int): ワーカー数
+            fingerprints (Dict[str, Dict[str, str]]): 出力先ディレクトリごとの、デバイス名からフィンガープリントを参照する辞書、作成したデバイスを追加する
+            render_memo (:obj:`RenderMemo`): 親プロセスのキャッシュ、各ワーカーで参照した回数を加算する
+            cache_repo_inst (Optional[:obj:`CacheRepository`]): セルの値をキャッシュするリポジトリ
+            source_fingerprint (Optional[str]): ルールファイルとConfigSampleFileのハッシュ値、指定した場合は差分作成とする
+
+        Note:
+            作成中・書き込み待ちのデバイスをワーカー数の2倍までに制限し、親プロセスが保持するコンフィグの内容を一定に抑える。
+            各ワーカーが開いたままのパラメータシートは、ワーカーの終了時に閉じる。
+            ワーカーが異常終了した場合でもキャッシュの合計サイズを上限までに抑えるため、終了後に親プロセスでもキャッシュを整理する。
+
+        """
+        max_pending: int = min(workers, len(device_tasks)) * 2
+        remaining_tasks: Iterator[Tuple[str, str, str]] = iter(device_tasks)
+
+        logger.info(f"Creating {len(device_tasks)} device configs in {min(workers, len(device_tasks))} workers...")
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(device_tasks)), initializer=_initialize_worker) as executor:
+
+                pending: Dict[Future, str] = {}
+
+                try:
+                    while True:
+
+                        for task_parameter_sheet_file, task_device_name, task_output_path in islice(remaining_tasks, max_pending - len(pending)):
+                            future: Future = executor.submit(
+                                self._render_device_config,
+                                task_parameter_sheet_file,
+                                config_repo_inst.config_sample_file,
+                                rule_object,
+                                task_device_name,
+                                task_output_path,
+                                cache_repo_inst,
+                                source_fingerprint
+                            )
+                            pending[future] = task_output_path
+
+                        if not pending:
+                            break
+
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                        for future in done:
+                            contents, device_fingerprints, hits, misses = future.result()
+
+                            BufferedConfigRepository.flush(contents, config_repo_inst)
+                            fingerprints[pending.pop(future)].update(device_fingerprints)
+                            render_memo.add_counts(hits, misses)
+
+                except Exception:
+                    for future in pending:
+                        future.cancel()
+                    raise
+        finally:
+            if cache_repo_inst is not None:
+                cache_repo_inst.prune()
+
+    def _render_device_config(self, parameter_sheet_file: str, config_sample_file: str, rule_object: Rule, device_name: str, output_path: str, cache_repo_inst: Optional[CacheRepository] = None, source_fingerprint: Optional[str] = None) -> Tuple[List[Tuple[bytes, str, Optional[str]]], Dict[str, str], int, int]:
+        """_render_device_config
+
+        ワーカーで1台のデバイスのコンフィグを作成し、書き込まずにコンフィグの内容を返す関数
+
+        Returns:
+            Tuple[List[Tuple[bytes, str, Optional[str]]], Dict[str, str], int, int]: コンフィグの内容・出力先・デバイス名の組の配列、デバイス名からフィンガープリントを参照する辞書、本デバイスでのキャッシュのヒット数とミス数
+
+        Note:
+            パラメータシート、ConfigSampleFile、作成したコマンド群のキャッシュは、ワーカーのプロセス内で次のデバイスに引き継ぐ。
+
+        """
+        state: Dict[str, Any] = _worker_state
+
+        if state.get("parameter_sheet_file") != parameter_sheet_file:
+
+            if state.get("parameter_locations_repo_inst") is not None:
+                state["parameter_locations_repo_inst"].close()
+
+            state["parameter_locations_repo_inst"] = self._open_parameter_locations_repo(parameter_sheet_file, cache_repo_inst)
+            state["parameter_sheet_file"] = parameter_sheet_file
+
+        if "config_repo_inst" not in state:
+            state["config_repo_inst"] = self.config_repo(config_sample_file=config_sample_file)
+            state["render_memo"] = RenderMemo()
+
+        buffered_config_repo_inst = BufferedConfigRepository(config_sample_file=config_sample_file, render=state["config_repo_inst"].render)
+        render_memo: RenderMemo = state["render_memo"]
+        hits, misses = render_memo.hits, render_memo.misses
+
+        fingerprints: Dict[str, str] = self.create_device_configs(
+            parameter_locations_repo_inst=state["parameter_locations_repo_inst"],
+            config_repo_inst=buffered_config_repo_inst,
+            rule_object=rule_object,
+            device_names=[device_name],
+            output_path=output_path,
+            source_fingerprint=source_fingerprint,
+            render_memo=render_memo
+        )
+
+        # ワーカーのキャッシュは次のデバイスに引き継ぐため、本デバイスで参照した回数のみを返す
+        return buffered_config_repo_inst.contents, fingerprints, render_memo.hits - hits, render_memo.misses - misses
+
+    def _open_rule_repo(self, rule_file: str, cache_repo_inst: Optional[CacheRepository]) -> RuleRepository:
+        if cache_repo_inst is None:
+            return self.rule_repo(rule_file=rule_file)
+
+        return CachedRuleRepository(
+            rule_file=rule_file,
+            rule_repo=self.rule_repo,
+            cache_repo_inst=cache_repo_inst
+        )
+
+    def _open_parameter_locations_repo(self, parameter_sheet_file: str, cache_repo_inst: Optional[CacheRepository]) -> ParameterLocationsRepository:
+        if cache_repo_inst is None:
+            return self.parameter_locations_repo(parameter_sheet_file=parameter_sheet_file)
+
+        return CachedParameterLocationsRepository(
+            parameter_sheet_file=parameter_sheet_file,
+            parameter_locations_repo=self.parameter_locations_repo,
+            cache_repo_inst=cache_repo_inst
+        )
+
+    def get_parameter_sheet_files(self, parameter_sheet_dir: str) -> List[str]:
+        """get_parameter_sheet_files
+
+        ディレクトリ配下(サブディレクトリを含む)から、パラメータシートのファイルを探索する関数
+
+        Args:
+            parameter_sheet_dir (str): パラメータシートを格納したディレクトリ
+
+        Returns:
+            List[str]: 名前順に並べたパラメータシートのパスの配列
+
+        Note:
+            Excelが作成するロックファイル(~$から始まるファイル)は対象外とする。
+
+        """
+        result: List[str] = []
+
+        for dir_path, dir_names, file_names in os.walk(parameter_sheet_dir):
+
+            dir_names.sort()
+
+            for file_name in sorted(file_names):
+
+                if file_name.lower().endswith(self.parameter_locations_repo.file_extensions) and not file_name.startswith("~$"):
+
+                    result.append(os.path.join(dir_path, file_name))
+
+        if not result:
+
+            raise ParameterSheetNotExistError({"parameter_sheet_file": parameter_sheet_dir})
+
+        logger.info(f"Getting parameter_sheet_files({result}) in ({parameter_sheet_dir}) has been completed")
+
+        return result
+
     @staticmethod
     def get_sheets(available_sheets: List[str], exception_sheets: List[str]) -> List[str]:
         return [sheet for sheet in available_sheets if sheet not in exception_sheets]
@@ -0,0 +1,9 @@
+from src.utils.custom_error import CustomError
+
+
+class ConfigCommandUsecaseError(CustomError):
+    pass
+
+
+class DeviceConfigCreationError(ConfigCommandUsecaseError):
+    ja_message = "パラメータシート({parameter_sheet_file})のデバイス({device_name})のコンフィグ作成中に以下のエラーが発生しました。\n{error}"
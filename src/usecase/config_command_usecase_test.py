@@ -0,0 +1,510 @@
+from typing import Dict, Any, List, Tuple
+import pytest
+import openpyxl
+import os
+import logging
+import re
+import json
+import shutil
+import tarfile
+import yaml
+import zipfile
+
+from .config_command_usecase import ConfigCommandUsecase, _close_worker_state, _worker_state
+from .config_command_usecase_exceptions import DeviceConfigCreationError
+from src.domain.parameter_locations.cached_parameter_locations_repository import CachedParameterLocationsRepository
+from src.domain.parameter_locations.parameter_locations_exceptions import ParameterSheetNotExistError
+from src.domain.rule.rule import Rule
+from src.infra.cache.cache_file_impl import CacheFileImpl
+from src.infra.config.config_archive_impl import ConfigArchiveImpl
+from src.infra.config.config_txt_impl import ConfigTxtImpl
+from src.infra.paramater_locations.parameter_locations_excel_impl import ParameterLocationsExcelImpl
+from src.infra.rule.rule_yaml_impl import RuleYamlImpl
+
+
+def make_converter_rule(columns: List[str], row_from: int, row_to: int) -> Dict[str, Any]:
+    return {
+        "marker": f"%%{''.join(columns)}{row_from}%%",
+        "data": {
+            "parameter_column_locations": [{"name": f"Example{column}", "column_number": column} for column in columns],
+            "row_from": row_from,
+            "row_to": row_to,
+        },
+        "commands": [" ".join(f"{{Example{column}}}" for column in columns)],
+        "validations": [],
+        "conditions": [],
+        "options": {},
+    }
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(overlapped rows)
+        (
+                {
+                    "HOSTNAME": make_converter_rule(["D"], 9, 9),
+                    "DETOUR_VLAN": make_converter_rule(["AH"], 103, 103),
+                    "LTERT_VLAN": make_converter_rule(["AP", "B"], 101, 103),
+                },
+                ([9, 101, 102, 103], ["B", "D", "AH", "AP"]),
+                None
+        ),
+        # 1. correct(no converter rules)
+        (
+                {},
+                ([], []),
+                None
+        ),
+    ]
+)
+def test_rule_required_cells(test_input: Dict[str, Any], test_result: Tuple[List[int], List[str]], test_exception_result: Exception):
+    if not test_exception_result:
+        rule_object = Rule(common_parameter={}, converter_rules=test_input)
+        assert (rule_object.required_rows, rule_object.required_columns) == test_result
+    else:
+        with pytest.raises(Exception) as e:
+            _ = Rule(common_parameter={}, converter_rules=test_input)
+        assert str(test_exception_result) in str(e.value)
+
+
+@pytest.fixture
+def create_config_files(tmp_path) -> Dict[str, str]:
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "改版履歴"
+    for i in range(5):
+        worksheet = workbook.create_sheet(f"device{i}")
+        worksheet["D9"] = f"host{i}"
+        for row in range(20, 25):
+            worksheet[f"B{row}"] = f"10.{i}.{row}.0/24"
+            worksheet[f"C{row}"] = None if row % 2 else f"192.168.{i}.1"
+    workbook.save(str(tmp_path / "parameter_sheet.xlsx"))
+
+    rule = {
+        "common_parameter": {"filling": "!"},
+        "converter_rules": {
+            "HOSTNAME": make_converter_rule(["D"], 9, 9),
+            "STATIC_ROUTE": {
+                **make_converter_rule(["B", "C"], 20, 24),
+                "commands": ["ip route {ExampleB} {ExampleC}"],
+                "conditions": [
+                    {
+                        "condition": {"type": "isEmpty", "target_parameters": ["ExampleC"]},
+                        "action": "Add",
+                        "commands": ["ip route {ExampleB} null0"]
+                    }
+                ],
+                "options": {"indent_level": 1, "filling_each_commands_group": True},
+            },
+        }
+    }
+    with open(tmp_path / "rule.yml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(rule, f, allow_unicode=True)
+
+    with open(tmp_path / "config_sample.log", "w", encoding="utf-8") as f:
+        f.write("!\nhostname\n%%D9%%\n!\n%%BC20%%\nend\n")
+
+    return {
+        "config_sample_file": str(tmp_path / "config_sample.log"),
+        "parameter_sheet_file": str(tmp_path / "parameter_sheet.xlsx"),
+        "rule_file": str(tmp_path / "rule.yml"),
+    }
+
+
+def read_output_configs(output_path: str) -> Dict[str, str]:
+    return {file_name.rsplit("_", 1)[0]: open(os.path.join(output_path, file_name), "rb").read() for file_name in os.listdir(output_path)}
+
+
+class UnopenableParameterLocationsExcelImpl(ParameterLocationsExcelImpl):
+    def __init__(self, parameter_sheet_file: str):
+        raise AssertionError("the parameter_sheet_file must not be opened")
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(2 workers)
+        (
+                {"workers": 2},
+                None,
+                None
+        ),
+        # 1. correct(more workers than devices)
+        (
+                {"workers": 8},
+                None,
+                None
+        ),
+    ]
+)
+def test_create_config_workers(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl)
+    os.makedirs(tmp_path / "serial")
+    os.makedirs(tmp_path / "parallel")
+
+    usecase.create_config(**create_config_files, output_path=str(tmp_path / "serial"), exception_sheets=["改版履歴"])
+    usecase.create_config(**create_config_files, output_path=str(tmp_path / "parallel"), exception_sheets=["改版履歴"], workers=test_input["workers"])
+
+    serial_configs = read_output_configs(str(tmp_path / "serial"))
+    assert sorted(serial_configs) == [f"device{i}" for i in range(5)]
+    assert serial_configs["device1"] == b"!\nhostname\nhost1\n!\n ip route 10.1.20.0/24 192.168.1.1\n!\n ip route 10.1.21.0/24 None\n ip route 10.1.21.0/24 null0\n!\n ip route 10.1.22.0/24 192.168.1.1\n!\n ip route 10.1.23.0/24 None\n ip route 10.1.23.0/24 null0\n!\n ip route 10.1.24.0/24 192.168.1.1\n!\nend\n"
+    assert read_output_configs(str(tmp_path / "parallel")) == serial_configs
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. serial
+        (
+                {"workers": 1},
+                None,
+                "デバイス(device0)のコンフィグ作成中に以下のエラーが発生しました。\nUnknown format code 'd'"
+        ),
+        # 1. parallel
+        (
+                {"workers": 2},
+                None,
+                "のコンフィグ作成中に以下のエラーが発生しました。\nUnknown format code 'd'"
+        ),
+    ]
+)
+def test_create_config_device_error(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: Any, test_exception_result: str):
+    with open(create_config_files["rule_file"], "r", encoding="utf-8") as f:
+        rule = yaml.safe_load(f)
+    rule["converter_rules"]["HOSTNAME"]["commands"] = ["hostname {ExampleD:d}"]
+    with open(create_config_files["rule_file"], "w", encoding="utf-8") as f:
+        yaml.safe_dump(rule, f, allow_unicode=True)
+
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl)
+
+    with pytest.raises(DeviceConfigCreationError) as e:
+        usecase.create_config(**create_config_files, output_path=str(tmp_path), exception_sheets=["改版履歴"], workers=test_input["workers"])
+    assert e.value.message_items["device_name"].startswith("device")
+    assert test_exception_result in e.value.get_ja_message()
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. unknown placeholder in the commands
+        (
+                {"rule_name": "HOSTNAME", "commands": ["hostname {Unknown}"], "conditional_commands": None},
+                None,
+                "The placeholder '{Unknown}' in the command(hostname {Unknown}) must be one of the parameter names(['ExampleD'])"
+        ),
+        # 1. unknown placeholder in the commands of the conditions
+        (
+                {"rule_name": "STATIC_ROUTE", "commands": None, "conditional_commands": ["ip route {ExampleB} {Unknown}"]},
+                None,
+                "The placeholder '{Unknown}' in the command(ip route {ExampleB} {Unknown}) must be one of the parameter names(['ExampleB', 'ExampleC'])"
+        ),
+    ]
+)
+def test_create_config_unknown_placeholder(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: Any, test_exception_result: str):
+    with open(create_config_files["rule_file"], "r", encoding="utf-8") as f:
+        rule = yaml.safe_load(f)
+    if test_input["commands"]:
+        rule["converter_rules"][test_input["rule_name"]]["commands"] = test_input["commands"]
+    if test_input["conditional_commands"]:
+        rule["converter_rules"][test_input["rule_name"]]["conditions"][0]["commands"] = test_input["conditional_commands"]
+    with open(create_config_files["rule_file"], "w", encoding="utf-8") as f:
+        yaml.safe_dump(rule, f, allow_unicode=True)
+
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, UnopenableParameterLocationsExcelImpl, RuleYamlImpl)
+
+    # ルールの読み込み時に検出され、パラメータシートは開かれないこと
+    with pytest.raises(Exception) as e:
+        usecase.create_config(**create_config_files, output_path=str(tmp_path), exception_sheets=["改版履歴"])
+    assert test_exception_result in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. serial
+        (
+                {"workers": None, "archive_format": None},
+                10,
+                None
+        ),
+        # 1. parallel
+        (
+                {"workers": 2, "archive_format": None},
+                10,
+                None
+        ),
+        # 2. parallel with a sink which can't be written concurrently
+        (
+                {"workers": 2, "archive_format": "zip"},
+                10,
+                None
+        ),
+    ]
+)
+def test_create_config_render_memo_counts(tmp_path, caplog, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: int, test_exception_result: Exception):
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, archive_config_repo=ConfigArchiveImpl)
+
+    with caplog.at_level(logging.INFO, logger="src.usecase.config_command_usecase"):
+        usecase.create_config(**create_config_files, output_path=str(tmp_path), exception_sheets=["改版履歴"], workers=test_input["workers"], archive_format=test_input["archive_format"])
+
+    # 全てのワーカーで参照した回数(デバイス数 x ルール数)が、親プロセスで集計されること
+    counts = [re.search(r"Reusing commands_groups: (\d+) hits, (\d+) misses", record.getMessage()) for record in caplog.records]
+    hits, misses = [tuple(map(int, count.groups())) for count in counts if count][0]
+    assert hits + misses == test_result
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. serial
+        (
+                {"workers": None, "archive_format": "tar.gz"},
+                ["device0", "device1", "device2"],
+                "string index out of range"
+        ),
+        # 1. parallel
+        (
+                {"workers": 2, "archive_format": "zip"},
+                None,
+                "string index out of range"
+        ),
+    ]
+)
+def test_create_config_archive_error(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: List[str], test_exception_result: str):
+    workbook = openpyxl.load_workbook(create_config_files["parameter_sheet_file"])
+    workbook["device3"]["D9"] = "h"
+    workbook.save(create_config_files["parameter_sheet_file"])
+
+    with open(create_config_files["rule_file"], "r", encoding="utf-8") as f:
+        rule = yaml.safe_load(f)
+    rule["converter_rules"]["HOSTNAME"]["commands"] = ["hostname {ExampleD[4]}"]
+    with open(create_config_files["rule_file"], "w", encoding="utf-8") as f:
+        yaml.safe_dump(rule, f, allow_unicode=True)
+
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, archive_config_repo=ConfigArchiveImpl)
+
+    with pytest.raises(DeviceConfigCreationError) as e:
+        usecase.create_config(**create_config_files, output_path=str(tmp_path / "archive"), exception_sheets=["改版履歴"], workers=test_input["workers"], archive_format=test_input["archive_format"])
+    assert e.value.message_items["device_name"] == "device3"
+    assert test_exception_result in e.value.get_ja_message()
+
+    # エラーが発生した場合は、作成済みのコンフィグのみを含み、manifest.jsonを含まないアーカイブとする
+    archive_files = os.listdir(tmp_path / "archive") if os.path.isdir(tmp_path / "archive") else []
+    archive_configs = read_archive_configs(str(tmp_path / "archive" / archive_files[0])) if archive_files else {}
+
+    assert "manifest.json" not in archive_configs
+    if test_result:
+        assert sorted(file_name.rsplit("_", 1)[0] for file_name in archive_configs) == test_result
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(serial)
+        (
+                {"workers": 1, "parameter_sheet_files": ["a.xlsx", os.path.join("sub", "b.xlsx"), "~$a.xlsx", "memo.txt"]},
+                ["a", os.path.join("sub", "b")],
+                None
+        ),
+        # 1. correct(default workers)
+        (
+                {"workers": None, "parameter_sheet_files": ["a.xlsx", os.path.join("sub", "b.xlsx")]},
+                ["a", os.path.join("sub", "b")],
+                None
+        ),
+        # 2. correct(more workers than parameter_sheet_files)
+        (
+                {"workers": 4, "parameter_sheet_files": ["a.xlsx"]},
+                ["a"],
+                None
+        ),
+        # 3. no parameter_sheet_file
+        (
+                {"workers": 1, "parameter_sheet_files": ["memo.txt"]},
+                None,
+                ParameterSheetNotExistError
+        ),
+    ]
+)
+def test_create_config_directory(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: List[str], test_exception_result: Exception):
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl)
+    os.makedirs(tmp_path / "single")
+    os.makedirs(tmp_path / "sheets" / "sub")
+    os.makedirs(tmp_path / "output")
+
+    for parameter_sheet_file in test_input["parameter_sheet_files"]:
+        shutil.copyfile(create_config_files["parameter_sheet_file"], tmp_path / "sheets" / parameter_sheet_file)
+
+    create_config_args = {**create_config_files, "exception_sheets": ["改版履歴"]}
+
+    if test_result:
+        usecase.create_config(**create_config_args, output_path=str(tmp_path / "single"))
+        create_config_args["parameter_sheet_file"] = str(tmp_path / "sheets")
+        usecase.create_config(**create_config_args, output_path=str(tmp_path / "output"), workers=test_input["workers"])
+
+        single_configs = read_output_configs(str(tmp_path / "single"))
+        for output_dir in test_result:
+            assert read_output_configs(str(tmp_path / "output" / output_dir)) == single_configs
+        assert sorted(os.listdir(tmp_path / "output")) == sorted(set(output_dir.split(os.sep)[0] for output_dir in test_result))
+    else:
+        create_config_args["parameter_sheet_file"] = str(tmp_path / "sheets")
+        with pytest.raises(test_exception_result):
+            usecase.create_config(**create_config_args, output_path=str(tmp_path / "output"), workers=test_input["workers"])
+
+
+def test_create_config_cache(tmp_path, monkeypatch, create_config_files: Dict[str, str]):
+    for output_dir in ["no_cache", "cache_miss", "cache_hit", "cache_updated"]:
+        os.makedirs(tmp_path / output_dir)
+    create_config_args = {**create_config_files, "exception_sheets": ["改版履歴"], "cache_dir": str(tmp_path / "cache")}
+
+    ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl).create_config(**create_config_args, output_path=str(tmp_path / "no_cache"))
+    ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, CacheFileImpl).create_config(**create_config_args, output_path=str(tmp_path / "cache_miss"))
+
+    # キャッシュのキーはリポジトリのクラスを含むため、同じリポジトリのままパラメータシートを開かないことを確認する
+    with monkeypatch.context() as m:
+        m.setattr(CachedParameterLocationsRepository, "parameter_locations_repo_inst", property(lambda self: UnopenableParameterLocationsExcelImpl(self.parameter_sheet_file)))
+        ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, CacheFileImpl).create_config(**create_config_args, output_path=str(tmp_path / "cache_hit"))
+
+    assert read_output_configs(str(tmp_path / "cache_miss")) == read_output_configs(str(tmp_path / "no_cache"))
+    assert read_output_configs(str(tmp_path / "cache_hit")) == read_output_configs(str(tmp_path / "no_cache"))
+
+    workbook = openpyxl.load_workbook(create_config_files["parameter_sheet_file"])
+    workbook["device0"]["D9"] = "updated"
+    workbook.save(create_config_files["parameter_sheet_file"])
+
+    ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, CacheFileImpl).create_config(**create_config_args, output_path=str(tmp_path / "cache_updated"))
+
+    assert b"\nupdated\n" in read_output_configs(str(tmp_path / "cache_updated"))["device0"]
+
+
+def read_archive_configs(archive_file: str) -> Dict[str, bytes]:
+    if archive_file.endswith(".zip"):
+        with zipfile.ZipFile(archive_file) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+
+    with tarfile.open(archive_file) as archive:
+        return {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(tar.gz)
+        (
+                {"workers": None, "archive_format": "tar.gz"},
+                None,
+                None
+        ),
+        # 1. correct(zip with 2 workers)
+        (
+                {"workers": 2, "archive_format": "zip"},
+                None,
+                None
+        ),
+    ]
+)
+def test_create_config_archive(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, archive_config_repo=ConfigArchiveImpl)
+    os.makedirs(tmp_path / "txt")
+    os.makedirs(tmp_path / "archive")
+
+    usecase.create_config(**create_config_files, output_path=str(tmp_path / "txt"), exception_sheets=["改版履歴"])
+    usecase.create_config(**create_config_files, output_path=str(tmp_path / "archive"), exception_sheets=["改版履歴"], workers=test_input["workers"], archive_format=test_input["archive_format"])
+
+    archive_files = os.listdir(tmp_path / "archive")
+    assert len(archive_files) == 1 and archive_files[0].endswith(f".{test_input['archive_format']}")
+
+    archive_configs = read_archive_configs(str(tmp_path / "archive" / archive_files[0]))
+    manifest = json.loads(archive_configs.pop("manifest.json"))
+
+    assert {file_name.rsplit("_", 1)[0]: config for file_name, config in archive_configs.items()} == read_output_configs(str(tmp_path / "txt"))
+    assert sorted(entry["device"] for entry in manifest) == [f"device{i}" for i in range(5)]
+    assert all(entry["size"] == len(archive_configs[entry["file"]]) for entry in manifest)
+
+
+class SmallCacheFileImpl(CacheFileImpl):
+    def __init__(self, cache_dir: str):
+        super().__init__(cache_dir, max_size=1)
+
+
+def test_create_config_archive_cache(tmp_path, create_config_files: Dict[str, str]):
+    # ワーカーが書き込んだキャッシュも、合計サイズの上限までに整理されること
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl, SmallCacheFileImpl, ConfigArchiveImpl)
+    os.makedirs(tmp_path / "archive")
+
+    usecase.create_config(**create_config_files, output_path=str(tmp_path / "archive"), exception_sheets=["改版履歴"], workers=2, archive_format="zip", cache_dir=str(tmp_path / "cache"))
+
+    assert sum(entry.stat().st_size for entry in os.scandir(tmp_path / "cache") if entry.is_file()) <= 1
+
+
+class CloseRecordingParameterLocationsExcelImpl(ParameterLocationsExcelImpl):
+    closed_files: List[str] = []
+
+    def close(self) -> None:
+        super().close()
+        self.closed_files.append(self.parameter_sheet_file)
+
+
+def test_close_worker_state(tmp_path, monkeypatch, create_config_files: Dict[str, str]):
+    monkeypatch.setattr(CloseRecordingParameterLocationsExcelImpl, "closed_files", [])
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, CloseRecordingParameterLocationsExcelImpl, RuleYamlImpl)
+    rule_object = RuleYamlImpl(create_config_files["rule_file"]).read()
+    parameter_sheet_files = [create_config_files["parameter_sheet_file"], str(tmp_path / "parameter_sheet2.xlsx")]
+    shutil.copyfile(parameter_sheet_files[0], parameter_sheet_files[1])
+
+    for parameter_sheet_file in parameter_sheet_files:
+        _ = usecase._render_device_config(parameter_sheet_file, create_config_files["config_sample_file"], rule_object, "device0", str(tmp_path))
+
+    # 別のパラメータシートに切り替えた場合と、ワーカーの終了時にパラメータシートを閉じること
+    assert CloseRecordingParameterLocationsExcelImpl.closed_files == parameter_sheet_files[:1]
+    _close_worker_state()
+    assert CloseRecordingParameterLocationsExcelImpl.closed_files == parameter_sheet_files
+    assert _worker_state == {}
+
+
+@pytest.mark.parametrize(
+    "test_input,test_result,test_exception_result", [
+        # 0. correct(serial)
+        (
+                {"workers": None},
+                None,
+                None
+        ),
+        # 1. correct(2 workers)
+        (
+                {"workers": 2},
+                None,
+                None
+        ),
+    ]
+)
+def test_create_config_incremental(tmp_path, create_config_files: Dict[str, str], test_input: Dict[str, Any], test_result: Any, test_exception_result: Exception):
+    usecase = ConfigCommandUsecase(ConfigTxtImpl, ParameterLocationsExcelImpl, RuleYamlImpl)
+    os.makedirs(tmp_path / "full")
+    os.makedirs(tmp_path / "incremental")
+    create_config_args = {**create_config_files, "exception_sheets": ["改版履歴"], "workers": test_input["workers"]}
+
+    def create_incremental_configs() -> List[str]:
+        # 前回の出力の更新日時を0にして、今回の実行で書き込まれたデバイスを返す
+        for file_name in os.listdir(tmp_path / "incremental"):
+            os.utime(tmp_path / "incremental" / file_name, ns=(0, 0))
+        usecase.create_config(**create_config_args, output_path=str(tmp_path / "incremental"), incremental=True)
+        return sorted(file_name[:-len(".log")] for file_name in os.listdir(tmp_path / "incremental") if file_name.endswith(".log") and os.stat(tmp_path / "incremental" / file_name).st_mtime_ns != 0)
+
+    usecase.create_config(**create_config_args, output_path=str(tmp_path / "full"))
+
+    assert create_incremental_configs() == [f"device{i}" for i in range(5)]
+    assert sorted(os.listdir(tmp_path / "incremental")) == sorted([f"device{i}.log" for i in range(5)] + ["manifest.json"])
+    incremental_configs = read_output_configs(str(tmp_path / "incremental"))
+    del incremental_configs["manifest.json"]
+    assert incremental_configs == {f"{device_name}.log": config for device_name, config in read_output_configs(str(tmp_path / "full")).items()}
+
+    assert create_incremental_configs() == []
+
+    workbook = openpyxl.load_workbook(create_config_files["parameter_sheet_file"])
+    workbook["device0"]["D9"] = "updated"
+    workbook.save(create_config_files["parameter_sheet_file"])
+
+    assert create_incremental_configs() == ["device0"]
+    assert b"\nupdated\n" in open(tmp_path / "incremental" / "device0.log", "rb").read()
+
+    os.remove(tmp_path / "incremental" / "device1.log")
+
+    assert create_incremental_configs() == ["device1"]
+
+    with open(create_config_files["config_sample_file"], "a", encoding="utf-8") as f:
+        f.write("! updated\n")
+
+    assert create_incremental_configs() == [f"device{i}" for i in range(5)]